@@ -6,6 +6,7 @@ Deployment: Streamlit Cloud
 Run locally: streamlit run app.py
 """
 
+import os
 import streamlit as st
 from pathlib import Path
 import sys
@@ -301,26 +302,53 @@ else:
 st.sidebar.markdown("---")
 st.sidebar.caption("Built for Indian Startups & SMBs")
 
+# Bytes held in session state by this session (sampled, tracked per process)
+from src.dashboard.session_stats import record_session_size
+record_session_size(force=query_params.get("admin") == "1")
+
+# Cache hit/miss and session size panels for maintainers (?admin=1)
+if query_params.get("admin") == "1":
+    from src.dashboard.cache import show_cache_admin
+    from src.dashboard.session_stats import show_session_admin
+    show_cache_admin()
+    show_session_admin()
+
+# Prometheus scrape endpoint for this process (started once)
+if os.environ.get("DPDPA_METRICS_PORT"):
+    from src.utils.metrics import start_http_server
+    start_http_server(int(os.environ["DPDPA_METRICS_PORT"]))
+
 # Route to pages
 if current_page == "home":
     from src.dashboard.pages import home
-    home.show()
+    page_show = home.show
 elif current_page == "assessment":
     from src.dashboard.pages import assessment
-    assessment.show()
+    page_show = assessment.show
 elif current_page == "results":
     from src.dashboard.pages import results
-    results.show()
+    page_show = results.show
 elif current_page == "documents":
     from src.dashboard.pages import documents
-    documents.show()
+    page_show = documents.show
 elif current_page == "reference":
     from src.dashboard.pages import dpdpa_ref
-    dpdpa_ref.show()
+    page_show = dpdpa_ref.show
 elif current_page == "about":
     from src.dashboard.pages import about
-    about.show()
+    page_show = about.show
 else:
     # Default to home if invalid page
     st.query_params["page"] = "home"
-    st.rerun()
\ No newline at end of file
+    st.rerun()
+
+# Timing spans for this session's rerun and a breakdown on the results page (?trace=1)
+from src.utils import tracing
+
+# cProfile each rerun of the page (?profile=1 or DPDPA_PROFILE=1)
+from src.dashboard import profiling
+with tracing.scoped(query_params.get("trace") == "1"):
+    if profiling.is_enabled():
+        profiling.run_profiled(current_page, page_show)
+    else:
+        page_show()
@@ -0,0 +1,206 @@
+"""
+Benchmark Harness
+Registry, timing, JSON results, thresholds and run-to-run comparison
+
+A benchmark is a function registered with @benchmark that does its setup
+and returns a zero-argument callable; only that callable is timed. Results
+are plain JSON so CI can keep the file as an artifact, diff it against the
+previous run (compare_results) and fail on limits (check_thresholds).
+
+Usage:
+    from benchmarks.harness import benchmark
+
+    @benchmark('match_requirements_1', iterations=50)
+    def bench_match_one(ctx):
+        return lambda: match_requirements(ctx['profiles'][0])
+"""
+
+import contextlib
+import io
+import json
+import platform
+import sqlite3
+import statistics
+import subprocess
+from datetime import datetime
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+BENCHMARKS = []
+
+
+def benchmark(name: str, iterations: int = 5, warmup: int = 1, size: Optional[int] = None,
+              cold: bool = False):
+    """
+    Register a benchmark
+
+    Args:
+        name: Result key (keep stable; thresholds and comparisons use it)
+        iterations: Timed runs
+        warmup: Untimed runs before the timed ones
+        size: Workload size reported with the result (profiles, rows, ...)
+        cold: Time exactly one run with no warm-up (first use in the process)
+    """
+    def register(func: Callable[[Dict[str, Any]], Callable[[], Any]]):
+        BENCHMARKS.append({
+            'name': name,
+            'func': func,
+            'iterations': 1 if cold else iterations,
+            'warmup': 0 if cold else warmup,
+            'size': size,
+            'cold': cold
+        })
+        return func
+    return register
+
+
+def time_callable(run: Callable[[], Any], iterations: int, warmup: int = 0) -> Dict[str, float]:
+    """
+    Time repeated calls (stdout suppressed; the pipeline prints progress)
+
+    Returns:
+        Dictionary with min/median/mean/max/stdev in milliseconds
+    """
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            run()
+        for _ in range(iterations):
+            start = perf_counter()
+            run()
+            samples.append((perf_counter() - start) * 1000)
+
+    return {
+        'min_ms': round(min(samples), 3),
+        'median_ms': round(statistics.median(samples), 3),
+        'mean_ms': round(statistics.fmean(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'stdev_ms': round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0
+    }
+
+
+def run_benchmarks(ctx: Dict[str, Any], only: Optional[List[str]] = None,
+                   iterations: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Run registered benchmarks in registration order
+
+    Args:
+        ctx: Shared fixture dictionary passed to every benchmark
+        only: Substrings; run benchmarks whose name contains any of them
+        iterations: Override the iteration count (except cold benchmarks)
+
+    Returns:
+        Dictionary mapping benchmark name to its result
+    """
+    results = {}
+    for bench in BENCHMARKS:
+        if only and not any(pattern in bench['name'] for pattern in only):
+            continue
+
+        count = bench['iterations'] if bench['cold'] else (iterations or bench['iterations'])
+        print(f"  {bench['name']:36s} ", end='', flush=True)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                run = bench['func'](ctx)
+            timing = time_callable(run, count, bench['warmup'])
+        except Exception as e:
+            print(f"✗ {e}")
+            results[bench['name']] = {'error': str(e)}
+            continue
+
+        results[bench['name']] = {'size': bench['size'], 'iterations': count, **timing}
+        print(f"median {timing['median_ms']:10.2f} ms   (min {timing['min_ms']:.2f}, n={count})")
+    return results
+
+
+def environment_info() -> Dict[str, Any]:
+    """Interpreter, platform and commit for the results file"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine()
+    }
+
+
+def write_results(path: Path, results: Dict[str, Dict[str, Any]]) -> None:
+    """Write results with environment info as JSON"""
+    payload = {'environment': environment_info(), 'results': results}
+    Path(path).write_text(json.dumps(payload, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+
+
+def load_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Results section of a JSON file written by write_results()"""
+    return json.loads(Path(path).read_text(encoding='utf-8'))['results']
+
+
+def check_thresholds(results: Dict[str, Dict[str, Any]], thresholds: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    Benchmarks over their limits
+
+    Args:
+        results: run_benchmarks() output
+        thresholds: Benchmark name -> {'median_ms': limit} (any timing key);
+                    names starting with '_' are notes (e.g. the reference machine)
+
+    Returns:
+        Failure messages (empty if every limit holds)
+    """
+    failures = []
+    for name, limits in thresholds.items():
+        if name.startswith('_'):
+            continue
+        result = results.get(name)
+        if result is None:
+            continue  # Not run (--only)
+        if 'error' in result:
+            failures.append(f"{name}: failed ({result['error']})")
+            continue
+        for key, limit in limits.items():
+            if result[key] > limit:
+                failures.append(f"{name}: {key} {result[key]:.2f} > {limit:.2f}")
+    return failures
+
+
+def compare_results(baseline: Dict[str, Dict[str, Any]], current: Dict[str, Dict[str, Any]],
+                    max_regression: float = 0.25) -> List[str]:
+    """
+    Print median changes against a previous run
+
+    Args:
+        baseline: Results of the previous run
+        current: Results of this run
+        max_regression: Allowed slowdown as a fraction (0.25 = 25% slower)
+
+    Returns:
+        Messages for benchmarks slower than allowed
+    """
+    regressions = []
+    print(f"\n  {'Benchmark':36s} {'Baseline':>12s} {'Current':>12s} {'Change':>9s}")
+    for name, result in current.items():
+        before = baseline.get(name)
+        if not before or 'error' in before or 'error' in result:
+            continue
+        change = (result['median_ms'] - before['median_ms']) / before['median_ms'] if before['median_ms'] else 0.0
+        flag = ' ⚠️' if change > max_regression else ''
+        print(f"  {name:36s} {before['median_ms']:10.2f}ms {result['median_ms']:10.2f}ms {change:+8.1%}{flag}")
+        if change > max_regression:
+            regressions.append(f"{name}: {change:+.1%} slower than baseline "
+                               f"({before['median_ms']:.2f} -> {result['median_ms']:.2f} ms)")
+    return regressions
@@ -0,0 +1,462 @@
+"""
+Dashboard Load Test
+Simulated concurrent users running new assessment -> results -> documents ZIP against a synthetic database
+
+Each session runs the flow back to back (optionally with think time between
+steps) after one unmeasured warm-up flow; sessions start together. Drivers:
+    pages    The dashboard itself. The assessment step runs
+             pipeline.run_assessment() (the job the assessment page submits),
+             then app.py is run with AppTest on the results page and on the
+             documents page, clicking "Generate All Required Documents (ZIP)".
+             Each session keeps its own AppTest (its own session state) for
+             all its flows. One process per session: AppTest swaps
+             Streamlit's global runtime on every run, so concurrent AppTests
+             in one process hang or interfere.
+    service  The API service layer in one process, one thread per session:
+             service.assess(), get_snapshot() and build_document_pack(), as
+             the API server runs them.
+
+The database is generated with benchmarks/synthetic_data.py in a temporary
+directory (or --db), so the real data/processed database is never touched.
+Every step opens fresh SQLite connections the way the app does; writers
+wait up to sqlite3's 5 second busy timeout, so contention shows first as
+latency and then as "database is locked" errors, which are counted
+separately.
+
+Reports p50/p95/p99 latency per step and per flow, flows and steps per
+second, errors by kind, and memory growth (RSS after warm-up vs at the end,
+per process).
+
+Usage:
+    python benchmarks/load_test.py --sessions 8 --flows 5
+    python benchmarks/load_test.py --driver service --sessions 16 --flows 20 --profiles 50000
+    python benchmarks/load_test.py --db /tmp/scale.db --think 0.5 --json load.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+import sys
+from typing import Any, Callable, Dict, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.api.load_test import percentile
+
+DRIVERS = ('pages', 'service')
+
+FLOW_STEPS = ('assessment', 'results', 'documents')
+
+SEED = 42
+
+# Seconds allowed for one AppTest script run
+PAGE_TIMEOUT = 120
+
+# Seconds to wait for every session to finish its warm-up flow
+START_TIMEOUT = 300
+
+LOCKED_MARKERS = ('database is locked', 'database table is locked')
+
+# st.error() messages that report a failure (the pages also use st.error
+# for compliance findings, e.g. children's data violations)
+PAGE_FAILURE_PREFIXES = ('Error ', 'Generation failed', 'Bulk generation failed', 'PDF generation failed',
+                         'Unexpected error', 'Document generator module not found')
+
+
+class PageError(RuntimeError):
+    """Raised when a page run shows an exception or a failure message"""
+    pass
+
+
+def rss_mb() -> Optional[float]:
+    """Resident set size of this process in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def classify_error(error: BaseException) -> str:
+    """Error kind for the report: database_locked, timeout or the exception type"""
+    message = str(error).lower()
+    if any(marker in message for marker in LOCKED_MARKERS):
+        return 'database_locked'
+    if 'timed out' in message:
+        return 'timeout'
+    return type(error).__name__
+
+
+# ============================================================================
+# SESSIONS
+# ============================================================================
+
+class ServiceSession:
+    """One simulated user calling the API service layer"""
+
+    def __init__(self):
+        from src.api import service
+        self.service = service
+        self.business_id = None
+
+    def assessment(self, answers: Dict[str, Any]) -> None:
+        self.business_id = self.service.assess(answers)['business_id']
+
+    def results(self) -> None:
+        self.service.get_snapshot(self.business_id)
+
+    def documents(self) -> None:
+        pack, _, _ = self.service.build_document_pack(self.business_id)
+        pack.close()
+
+
+class PageSession:
+    """One simulated dashboard user: AppTest runs of app.py with their own session state"""
+
+    def __init__(self, timeout: float = PAGE_TIMEOUT):
+        from streamlit.testing.v1 import AppTest
+        from src.assessment.pipeline import run_assessment
+        from src.dashboard.cache import make_assessment_handle
+        self.run_assessment = run_assessment
+        self.make_handle = make_assessment_handle
+        self.app = AppTest.from_file(str(project_root / "app.py"), default_timeout=timeout)
+
+    def assessment(self, answers: Dict[str, Any]) -> None:
+        # The assessment page stores a handle to the job result and moves on to results
+        self.app.session_state['current_assessment'] = self.make_handle(self.run_assessment(answers))
+
+    def results(self) -> None:
+        self._open('results')
+
+    def documents(self) -> None:
+        self._open('documents')
+        buttons = [button for button in self.app.button if button.label == "Generate All Required Documents (ZIP)"]
+        if not buttons:
+            raise PageError("documents: bulk ZIP button not shown")
+        buttons[0].click().run()
+        self._check('documents')
+
+    def _open(self, page: str) -> None:
+        self.app.query_params['page'] = page
+        self.app.run()
+        self._check(page)
+
+    def _check(self, page: str) -> None:
+        problems = [getattr(element, 'message', None) or element.value for element in self.app.exception]
+        problems += [element.value for element in self.app.error
+                     if str(element.value).strip().startswith(PAGE_FAILURE_PREFIXES)]
+        if problems:
+            raise PageError(f"{page}: {problems[0]}")
+
+
+def run_flow(session, answers: Dict[str, Any], rng: random.Random, think: float) -> List[tuple]:
+    """
+    One new assessment -> results -> documents flow
+
+    Returns:
+        (step, seconds, error kind, error message) per step run, the error
+        fields None on success; a failed step ends the flow
+    """
+    steps = [
+        ('assessment', lambda: session.assessment(answers)),
+        ('results', session.results),
+        ('documents', session.documents),
+    ]
+    records = []
+    for index, (step, run) in enumerate(steps):
+        if think and index:
+            time.sleep(rng.uniform(0, 2 * think))
+        began = time.perf_counter()
+        try:
+            run()
+        except Exception as e:
+            records.append((step, time.perf_counter() - began, classify_error(e), str(e)[:300]))
+            break
+        records.append((step, time.perf_counter() - began, None, None))
+    return records
+
+
+def run_session(session_factory: Callable[[], Any], session_id: int, flows: int, think: float,
+                seed: int, started: Callable[[], None]) -> Dict[str, Any]:
+    """
+    Warm up, signal started(), then run the measured flows of one session
+
+    Returns:
+        Dictionary with records (one list per flow) and memory (RSS in MB)
+    """
+    from benchmarks.synthetic_data import sample_answers
+
+    rng = random.Random(seed * 1000 + session_id)
+    try:
+        session = session_factory()
+        run_flow(session, sample_answers(rng, session_id), rng, 0)
+    finally:
+        started()
+
+    memory = {'start_mb': rss_mb()}
+    records = []
+    for flow in range(flows):
+        answers = sample_answers(rng, (session_id + 1) * 100_000 + flow)
+        records.append(run_flow(session, answers, rng, think))
+    memory['end_mb'] = rss_mb()
+    return {'records': records, 'memory': memory}
+
+
+def _page_worker(session_id: int, flows: int, think: float, seed: int, work_dir: str,
+                 barrier, results) -> None:
+    """Process entry point for one pages session (results go on the queue)"""
+    # The documents page writes data/processed/generated_documents relative to cwd
+    os.chdir(work_dir)
+    # Setting AppTest session state between runs warns about the missing
+    # script context every time (filters survive Streamlit's log level resets)
+    logging.getLogger('streamlit.runtime.scriptrunner_utils.script_run_context').addFilter(
+        lambda record: 'missing ScriptRunContext' not in record.getMessage()
+    )
+
+    def started():
+        barrier.wait(timeout=START_TIMEOUT)
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            outcome = run_session(PageSession, session_id, flows, think, seed, started)
+    except Exception as e:
+        outcome = {'records': [], 'memory': {}, 'error': f"{type(e).__name__}: {e}"}
+    outcome['finished'] = time.time()
+    results.put(outcome)
+
+
+# ============================================================================
+# DRIVERS
+# ============================================================================
+
+def run_pages(sessions: int, flows: int, think: float, seed: int, work_dir: Path) -> Dict[str, Any]:
+    """One process per session; returns per-session outcomes and the measured wall time"""
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(sessions + 1)
+    results = context.Queue()
+    processes = [
+        context.Process(target=_page_worker, args=(session_id, flows, think, seed, str(work_dir), barrier, results),
+                        daemon=True)
+        for session_id in range(sessions)
+    ]
+    for process in processes:
+        process.start()
+
+    barrier.wait(timeout=START_TIMEOUT)
+    began = time.time()
+    outcomes = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return {'outcomes': outcomes, 'wall_s': max(outcome['finished'] for outcome in outcomes) - began}
+
+
+def run_service(sessions: int, flows: int, think: float, seed: int) -> Dict[str, Any]:
+    """One thread per session in this process; returns per-session outcomes and the measured wall time"""
+    barrier = threading.Barrier(sessions + 1)
+    outcomes = []
+    outcomes_lock = threading.Lock()
+
+    def worker(session_id):
+        try:
+            outcome = run_session(ServiceSession, session_id, flows, think, seed,
+                                  lambda: barrier.wait(timeout=START_TIMEOUT))
+        except Exception as e:
+            outcome = {'records': [], 'memory': {}, 'error': f"{type(e).__name__}: {e}"}
+        outcome['finished'] = time.time()
+        with outcomes_lock:
+            outcomes.append(outcome)
+
+    threads = [threading.Thread(target=worker, args=(session_id,), daemon=True) for session_id in range(sessions)]
+    with contextlib.redirect_stdout(io.StringIO()):
+        for thread in threads:
+            thread.start()
+        barrier.wait(timeout=START_TIMEOUT)
+        began = time.time()
+        start_mb = rss_mb()
+        for thread in threads:
+            thread.join()
+
+    # Sessions share the process, so memory is measured once for all of them
+    for outcome in outcomes:
+        outcome['memory'] = {}
+    outcomes[0]['memory'] = {'start_mb': start_mb, 'end_mb': rss_mb()}
+    return {'outcomes': outcomes, 'wall_s': max(outcome['finished'] for outcome in outcomes) - began}
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def _latency(seconds: List[float]) -> Dict[str, float]:
+    ordered = sorted(seconds)
+    return {
+        'p50': round(percentile(ordered, 0.50) * 1000, 1),
+        'p95': round(percentile(ordered, 0.95) * 1000, 1),
+        'p99': round(percentile(ordered, 0.99) * 1000, 1),
+        'max': round((ordered[-1] if ordered else 0.0) * 1000, 1)
+    }
+
+
+def summarize(driver: str, sessions: int, run: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Latency percentiles, throughput, errors and memory from a driver run
+
+    Returns:
+        Dictionary with steps (per-step count, errors and latency_ms), flow
+        (completed flows' total latency), throughput, errors (count by kind),
+        error_samples (first message per kind), database_locked,
+        session_failures and memory
+    """
+    flows = [records for outcome in run['outcomes'] for records in outcome['records']]
+    wall_s = max(run['wall_s'], 1e-9)
+
+    steps = {}
+    errors = {}
+    error_samples = {}
+    for step in FLOW_STEPS:
+        runs = [record for records in flows for record in records if record[0] == step]
+        steps[step] = {
+            'count': len(runs),
+            'errors': sum(1 for record in runs if record[2]),
+            'latency_ms': _latency([seconds for _, seconds, error, _ in runs if not error])
+        }
+        for _, _, error, message in runs:
+            if error:
+                errors[error] = errors.get(error, 0) + 1
+                error_samples.setdefault(error, f"{step}: {message}")
+
+    completed = [records for records in flows if len(records) == len(FLOW_STEPS) and not records[-1][2]]
+
+    memory_by_process = [outcome['memory'] for outcome in run['outcomes']
+                         if outcome['memory'].get('start_mb') is not None and outcome['memory'].get('end_mb') is not None]
+    growth_mb = sum(m['end_mb'] - m['start_mb'] for m in memory_by_process)
+
+    return {
+        'driver': driver,
+        'sessions': sessions,
+        'flows': len(flows),
+        'completed_flows': len(completed),
+        'wall_s': round(wall_s, 2),
+        'throughput': {
+            'flows_per_s': round(len(completed) / wall_s, 3),
+            'steps_per_s': round(sum(len(records) for records in flows) / wall_s, 3)
+        },
+        'steps': steps,
+        'flow': {'latency_ms': _latency([sum(record[1] for record in records) for records in completed])},
+        'errors': dict(sorted(errors.items())),
+        'error_samples': error_samples,
+        'database_locked': errors.get('database_locked', 0),
+        'session_failures': [outcome['error'] for outcome in run['outcomes'] if 'error' in outcome],
+        'memory': {
+            'processes': len(memory_by_process),
+            'start_mb': round(sum(m['start_mb'] for m in memory_by_process), 1),
+            'end_mb': round(sum(m['end_mb'] for m in memory_by_process), 1),
+            'growth_mb': round(growth_mb, 1),
+            'growth_per_flow_kb': round(growth_mb * 1024 / len(flows), 1) if flows else 0.0
+        }
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\n{report['driver']}: {report['sessions']} sessions, {report['flows']} flows "
+          f"({report['completed_flows']} completed) in {report['wall_s']:.1f}s")
+    print(f"  {report['throughput']['flows_per_s']} flows/s   {report['throughput']['steps_per_s']} steps/s")
+
+    print(f"\n  {'Step':14s} {'Runs':>6s} {'Errors':>7s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s} {'max ms':>9s}")
+    rows = [(step, stats['count'], stats['errors'], stats['latency_ms']) for step, stats in report['steps'].items()]
+    rows.append(('flow', report['completed_flows'], report['flows'] - report['completed_flows'],
+                 report['flow']['latency_ms']))
+    for name, count, failed, latency in rows:
+        print(f"  {name:14s} {count:6d} {failed:7d} {latency['p50']:9.1f} {latency['p95']:9.1f} "
+              f"{latency['p99']:9.1f} {latency['max']:9.1f}")
+
+    if report['errors']:
+        print(f"\n  Errors: {report['errors']}")
+        for kind, message in report['error_samples'].items():
+            print(f"    {kind}: {message}")
+    if report['database_locked']:
+        print(f"  ⚠️  {report['database_locked']} 'database is locked' errors (SQLite write contention)")
+    for failure in report['session_failures']:
+        print(f"  ✗ Session failed: {failure}")
+
+    memory = report['memory']
+    if memory['processes']:
+        print(f"\n  Memory (RSS, {memory['processes']} process(es)): {memory['start_mb']} MB after warm-up -> "
+              f"{memory['end_mb']} MB   growth {memory['growth_mb']} MB ({memory['growth_per_flow_kb']} KB/flow)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the DPDPA dashboard flow with concurrent sessions")
+    parser.add_argument('--driver', choices=DRIVERS, default='pages')
+    parser.add_argument('-s', '--sessions', type=int, default=4, help="Concurrent simulated users")
+    parser.add_argument('-f', '--flows', type=int, default=3, help="Measured flows per session")
+    parser.add_argument('--think', type=float, default=0.0,
+                        help="Mean seconds between steps (uniform 0 to 2x; not counted in latency)")
+    parser.add_argument('--db', metavar='PATH', help="Database to use (generated there if missing)")
+    parser.add_argument('--profiles', type=int, default=10_000, help="Synthetic business profiles")
+    parser.add_argument('--statuses', type=int, default=100_000, help="Synthetic compliance_status rows")
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--json', metavar='PATH', help="Write the report as JSON")
+    args = parser.parse_args()
+
+    # Every module reads DB_PATH at import time, so point it at the load-test
+    # database before importing anything from src
+    scratch_dir = Path(tempfile.mkdtemp(prefix='dpdpa_load_'))
+    db_path = Path(args.db).resolve() if args.db else scratch_dir / 'load_test.db'
+    os.environ['DPDPA_DB_PATH'] = str(db_path)
+
+    from benchmarks.synthetic_data import generate_database
+
+    print("=" * 70)
+    print("DPDPA DASHBOARD LOAD TEST")
+    print("=" * 70)
+    try:
+        if not db_path.exists():
+            print(f"Generating synthetic database ({args.profiles:,} profiles, {args.statuses:,} statuses)...")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    generate_database(db_path, profiles=args.profiles, statuses=args.statuses, seed=args.seed)
+            except FileNotFoundError as e:
+                print(f"✗ {e}")
+                sys.exit(1)
+        print(f"Database: {db_path}")
+        print(f"Running {args.sessions} {args.driver} sessions x {args.flows} flows (after 1 warm-up flow each)...")
+
+        if args.driver == 'pages':
+            run = run_pages(args.sessions, args.flows, args.think, args.seed, scratch_dir)
+        else:
+            run = run_service(args.sessions, args.flows, args.think, args.seed)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+    report = summarize(args.driver, args.sessions, run)
+    print_report(report)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+        print(f"\n✓ Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
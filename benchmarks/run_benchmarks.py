@@ -0,0 +1,103 @@
+"""
+Benchmark Runner
+Runs the benchmark suite against a scratch database and writes JSON results
+
+The scratch database is created in a temporary directory (the real
+data/processed database is never touched); extraction reads the bundled
+Rules pages from data/processed/rules_2025_extracted.jsonl, so run
+parse_rules.py once first.
+
+Usage:
+    python benchmarks/run_benchmarks.py                              # all benchmarks
+    python benchmarks/run_benchmarks.py --output bench.json          # JSON for CI
+    python benchmarks/run_benchmarks.py --only match analyze         # name substrings
+    python benchmarks/run_benchmarks.py --baseline previous.json --max-regression 0.25
+    python benchmarks/run_benchmarks.py --no-thresholds
+
+Exit status is 1 if a threshold (benchmarks/thresholds.json) is exceeded,
+a benchmark fails, or a median regresses more than allowed vs --baseline.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+THRESHOLDS_PATH = Path(__file__).parent / "thresholds.json"
+PAGES_PATH = project_root / "data" / "processed" / "rules_2025_extracted.jsonl"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the DPDPA benchmark suite")
+    parser.add_argument('--output', metavar='PATH', help="Write results as JSON")
+    parser.add_argument('--only', nargs='+', metavar='NAME', help="Run benchmarks whose name contains any of these")
+    parser.add_argument('--iterations', type=int, help="Override iteration counts")
+    parser.add_argument('--thresholds', default=str(THRESHOLDS_PATH), help="Threshold file")
+    parser.add_argument('--no-thresholds', action='store_true', help="Don't enforce thresholds")
+    parser.add_argument('--baseline', metavar='PATH', help="Previous results to compare against")
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help="Allowed median slowdown vs baseline (fraction, default 0.25)")
+    args = parser.parse_args()
+
+    if not PAGES_PATH.exists():
+        print(f"✗ {PAGES_PATH.name} not found")
+        print("  Run: python src/extraction/parse_rules.py")
+        sys.exit(1)
+
+    # Every module reads DB_PATH at import time, so point it at the scratch
+    # database before importing anything from src
+    scratch_dir = Path(tempfile.mkdtemp(prefix='dpdpa_bench_db_'))
+    os.environ['DPDPA_DB_PATH'] = str(scratch_dir / 'benchmark.db')
+
+    from benchmarks import scenarios
+    from benchmarks.harness import check_thresholds, compare_results, load_results, run_benchmarks, write_results
+
+    print("=" * 70)
+    print("DPDPA BENCHMARKS")
+    print("=" * 70)
+    print(f"Scratch database: {os.environ['DPDPA_DB_PATH']}")
+    print()
+
+    ctx = {}
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            scenarios.prepare(ctx)
+        results = run_benchmarks(ctx, args.only, args.iterations)
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+        if ctx.get('output_dir'):
+            shutil.rmtree(ctx['output_dir'], ignore_errors=True)
+
+    failures = [f"{name}: failed ({result['error']})" for name, result in results.items() if 'error' in result]
+
+    if not args.no_thresholds and Path(args.thresholds).exists():
+        thresholds = json.loads(Path(args.thresholds).read_text(encoding='utf-8'))
+        failures += [f for f in check_thresholds(results, thresholds) if f not in failures]
+
+    if args.baseline:
+        failures += compare_results(load_results(args.baseline), results, args.max_regression)
+
+    if args.output:
+        write_results(args.output, results)
+        print(f"\n✓ Results written to {args.output}")
+
+    print()
+    if failures:
+        print("❌ Benchmark check failed:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("✓ All benchmarks within limits")
+
+
+if __name__ == "__main__":
+    main()
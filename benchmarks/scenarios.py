@@ -0,0 +1,252 @@
+"""
+Benchmark Scenarios
+Matching, gap analysis, Excel export, document generation and extraction
+
+Every scenario runs against a scratch database, so DPDPA_DB_PATH must point
+at it before this module is imported (run_benchmarks.py does this). Inputs
+are generated from fixed seeds, so runs are comparable.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+"""
+
+import random
+import sqlite3
+import tempfile
+from pathlib import Path
+import sys
+from typing import Any, Dict, List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic_data import sample_answers
+from config.config import DB_PATH
+from src.extraction import extract_requirements
+from src.extraction.init_db import init_database, requirement_text_hash
+from src.assessment.business_profiler import create_business_profile
+from src.assessment.catalog import build_catalog, match_from_catalog
+from src.assessment.gap_analyzer import analyze_gaps
+from src.assessment.report_generator import export_to_excel
+from src.assessment.requirement_matcher import match_requirements
+from src.assessment.records import add_exposure, new_exposure
+
+SEED = 41
+
+OBLIGATION_TYPES = ['notice', 'security', 'breach', 'retention', 'children', 'sdf', 'rights', 'general']
+
+
+def make_profiles(count: int, seed: int = SEED) -> List[Dict[str, Any]]:
+    """Deterministic answers dictionaries (questionnaire distributions)"""
+    rng = random.Random(seed)
+    return [sample_answers(rng, i + 1) for i in range(count)]
+
+
+def ensure_extracted(ctx: Dict[str, Any]) -> None:
+    """Load requirements into the scratch database (once)"""
+    if not ctx.get('extracted'):
+        extract_requirements.main()
+        ctx['extracted'] = True
+
+
+def ensure_synthetic_requirements(ctx: Dict[str, Any], count: int = 5_000) -> List[int]:
+    """
+    Requirement IDs for large gap analyses: the extracted ones plus
+    inactive synthetic rows (inactive, so matching is unaffected)
+    """
+    if len(ctx.get('requirement_ids', [])) >= count:
+        return ctx['requirement_ids']
+
+    ensure_extracted(ctx)
+    rng = random.Random(SEED)
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    cursor.execute("SELECT id FROM penalties")
+    penalty_ids = [row[0] for row in cursor.fetchall()]
+    cursor.execute("SELECT id FROM requirements ORDER BY id")
+    requirement_ids = [row[0] for row in cursor.fetchall()]
+
+    rows = []
+    for i in range(count - len(requirement_ids)):
+        text = f"Synthetic benchmark obligation {i}: the Data Fiduciary shall " + 'maintain records ' * rng.randint(3, 30)
+        rows.append((
+            f"Rule 99({i})", text, rng.choice(OBLIGATION_TYPES), rng.choice(penalty_ids),
+            int(rng.random() < 0.1), requirement_text_hash(text), f"Rule 99({i})"
+        ))
+    with conn:
+        cursor.executemany("""
+            INSERT INTO requirements (
+                rule_number, requirement_text, obligation_type, penalty_category_id,
+                is_sdf_specific, requirement_text_hash, clause_key, is_active
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, 0)
+        """, rows)
+    cursor.execute("SELECT id FROM requirements ORDER BY id")
+    ctx['requirement_ids'] = [row[0] for row in cursor.fetchall()]
+    conn.close()
+    return ctx['requirement_ids']
+
+
+def make_gap_analysis(rows: int, seed: int = SEED) -> Dict[str, Any]:
+    """analyze_gaps()-shaped result with the given number of gaps"""
+    rng = random.Random(seed)
+    gaps = [
+        {
+            'id': i,
+            'rule_number': f"Rule {rng.randint(3, 14)}({i})",
+            'requirement_text': f"Requirement {i}: " + 'implement and document controls ' * rng.randint(1, 8),
+            'obligation_type': rng.choice(OBLIGATION_TYPES),
+            'deadline': None,
+            'is_sdf_specific': rng.random() < 0.1,
+            'penalty_category_id': 1,
+            'penalty_category': 'security_breach',
+            'penalty_amount': rng.choice([10_000, 5_000_000_000, 25_000_000_000]),
+            'days_remaining': rng.randint(0, 545),
+            'status': 'not_started',
+            'priority_score': round(rng.uniform(20, 100), 2)
+        }
+        for i in range(rows)
+    ]
+    exposure = new_exposure()
+    for gap in gaps:
+        add_exposure(exposure, gap['obligation_type'], gap['penalty_category'], gap['penalty_amount'], True)
+    penalties = [gap['penalty_amount'] for gap in gaps]
+    return {
+        'total_requirements': rows,
+        'completed': 0,
+        'gaps': gaps,
+        'compliance_score': 0.0,
+        'max_penalty_exposure': max(penalties),
+        'total_penalty_exposure': sum(penalties),
+        'priority_requirements': gaps[:10],
+        'by_type': {t: totals['count'] for t, totals in exposure['by_type'].items()},
+        'by_penalty_category': {'security_breach': rows},
+        'exposure': exposure
+    }
+
+
+def prepare(ctx: Dict[str, Any]) -> None:
+    """Create the scratch database and shared inputs"""
+    init_database(DB_PATH)
+    ctx['profiles'] = make_profiles(10_000)
+    ctx['output_dir'] = Path(tempfile.mkdtemp(prefix='dpdpa_bench_'))
+
+
+# ============================================================================
+# EXTRACTION
+# ============================================================================
+
+@benchmark('extract_requirements_cold', cold=True)
+def bench_extract_cold(ctx):
+    def run():
+        ctx['extracted'] = False
+        ensure_extracted(ctx)
+    return run
+
+
+@benchmark('extract_requirements_rerun', iterations=3)
+def bench_extract_rerun(ctx):
+    ensure_extracted(ctx)
+    return extract_requirements.main
+
+
+@benchmark('extract_rules_parse', iterations=5)
+def bench_extract_parse(ctx):
+    def run():
+        pages = extract_requirements.load_pages('rules_2025_extracted')
+        rules = extract_requirements.tokenize_rules(extract_requirements.clean_text(pages.iter_texts()))
+        extract_requirements.extract_third_schedule(extract_requirements.clean_text(pages.iter_texts()))
+        pages.close()
+        return rules
+    return run
+
+
+# ============================================================================
+# MATCHING
+# ============================================================================
+
+@benchmark('match_requirements_1', iterations=200, warmup=5, size=1)
+def bench_match_one(ctx):
+    ensure_extracted(ctx)
+    return lambda: match_requirements(ctx['profiles'][0])
+
+
+@benchmark('match_requirements_10k', iterations=1, warmup=0, size=10_000)
+def bench_match_many(ctx):
+    ensure_extracted(ctx)
+    return lambda: [match_requirements(profile) for profile in ctx['profiles']]
+
+
+@benchmark('match_from_catalog_10k', iterations=5, size=10_000)
+def bench_match_catalog(ctx):
+    ensure_extracted(ctx)
+    catalog = build_catalog()
+    return lambda: [match_from_catalog(profile, catalog) for profile in ctx['profiles']]
+
+
+# ============================================================================
+# GAP ANALYSIS
+# ============================================================================
+
+@benchmark('analyze_gaps_50', iterations=50, size=50)
+def bench_analyze_small(ctx):
+    requirement_ids = ensure_synthetic_requirements(ctx)[:50]
+    profile = ctx['profiles'][0]
+    business_id = create_business_profile(profile)
+    return lambda: analyze_gaps(business_id, requirement_ids, profile)
+
+
+@benchmark('analyze_gaps_5k', iterations=5, size=5_000)
+def bench_analyze_large(ctx):
+    requirement_ids = ensure_synthetic_requirements(ctx)[:5_000]
+    profile = ctx['profiles'][0]
+    business_id = create_business_profile(profile)
+    return lambda: analyze_gaps(business_id, requirement_ids, profile)
+
+
+# ============================================================================
+# EXCEL EXPORT
+# ============================================================================
+
+@benchmark('export_to_excel_100', iterations=5, size=100)
+def bench_export_small(ctx):
+    analysis = make_gap_analysis(100)
+    path = ctx['output_dir'] / 'export_100.xlsx'
+    return lambda: export_to_excel(ctx['profiles'][0], analysis, str(path))
+
+
+@benchmark('export_to_excel_100k', iterations=1, warmup=0, size=100_000)
+def bench_export_large(ctx):
+    analysis = make_gap_analysis(100_000)
+    path = ctx['output_dir'] / 'export_100k.xlsx'
+    return lambda: export_to_excel(ctx['profiles'][0], analysis, str(path))
+
+
+# ============================================================================
+# DOCUMENT GENERATION
+# ============================================================================
+
+def _document_inputs(ctx):
+    ensure_extracted(ctx)
+    profile = dict(ctx['profiles'][0], processes_children_data=True, has_processors=True)
+    business_id = create_business_profile(profile)
+    return profile, analyze_gaps(business_id, match_requirements(profile), profile)
+
+
+@benchmark('generate_documents_cold', cold=True)
+def bench_documents_cold(ctx):
+    profile, analysis = _document_inputs(ctx)
+
+    def run():
+        # First use in the process: imports python-docx and reads every template
+        from src.document_generator import DocumentGenerator
+        return DocumentGenerator(profile, analysis).generate_all_required_documents()
+    return run
+
+
+@benchmark('generate_documents_warm', iterations=5)
+def bench_documents_warm(ctx):
+    from src.document_generator import DocumentGenerator
+    profile, analysis = _document_inputs(ctx)
+    return lambda: DocumentGenerator(profile, analysis).generate_all_required_documents()
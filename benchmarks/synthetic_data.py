@@ -0,0 +1,368 @@
+"""
+Synthetic Data Generator
+Populates a scratch SQLite database with realistic volume for benchmarks and load tests
+
+Business profiles are sampled question by question from questionnaire.QUESTIONS
+(option weights below; options without a weight are uniform), compliance_status
+rows follow per-business maturity and per-obligation completion rates, and the
+requirements corpus can be scaled up by copying the Rule 3-14 clauses (copies
+keep their rule numbers and obligation types, so matching picks them up).
+
+Output depends only on the seed. Rows go in with executemany() in batches
+inside one transaction, with journaling off (the database is disposable):
+about 1M rows in well under a minute.
+
+Usage:
+    python benchmarks/synthetic_data.py --db /tmp/scale.db --profiles 100000 --statuses 1000000
+    python benchmarks/synthetic_data.py --db /tmp/scale.db --profiles 10000 --multiply 20 --seed 7
+
+    from benchmarks.synthetic_data import generate_database, sample_answers
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import math
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.assessment.questionnaire import QUESTIONS
+from src.extraction.init_db import DB_PATH as SOURCE_DB_PATH, ensure_assessment_schema, init_database, requirement_text_hash
+
+DEFAULT_SEED = 42
+BATCH_SIZE = 50_000
+
+# Relative weights for select options (missing options weigh 1)
+OPTION_WEIGHTS = {
+    'entity_type': {
+        'startup': 30, 'smb': 25, 'ecommerce': 12, 'social_media': 3, 'fintech': 8,
+        'healthcare': 6, 'edtech': 6, 'gaming': 4, 'other': 6
+    },
+    'annual_revenue': {
+        '< 1 crore': 40, '1-10 crore': 30, '10-50 crore': 15, '50-100 crore': 8, '> 100 crore': 7
+    }
+}
+
+# Probability of "yes" for yes/no questions
+YES_RATES = {
+    'processes_children_data': 0.15,
+    'cross_border_transfers': 0.35,
+    'uses_ai': 0.30,
+    'has_processors': 0.55,
+    'has_breach_plan': 0.25,
+    'tracks_behavior': 0.40,
+    'targeted_advertising': 0.30,
+    'has_consent_mechanism': 0.45,
+    'has_grievance_system': 0.35
+}
+
+# Probability each multiselect option is chosen ('none' only when nothing else is)
+MULTISELECT_RATES = {
+    'data_types': {
+        'name': 0.98, 'email': 0.95, 'phone': 0.80, 'address': 0.50, 'payment_info': 0.40,
+        'health_data': 0.08, 'biometric': 0.05, 'location': 0.30, 'behavioral': 0.35
+    },
+    'current_security': {'encryption': 0.60, 'access_control': 0.55, 'logging': 0.40, 'backups': 0.65}
+}
+
+# user_count is log-uniform between these bounds
+USER_COUNT_RANGE = (100, 50_000_000)
+
+# Share of a business's requirements completed, by obligation type (scaled by maturity)
+COMPLETION_RATES = {
+    'notice': 0.70, 'rights': 0.50, 'retention': 0.45, 'security': 0.40,
+    'breach': 0.30, 'children': 0.35, 'sdf': 0.15, 'general': 0.40
+}
+
+NAME_PREFIXES = ['Acme', 'Bharat', 'Nova', 'Indus', 'Zenith', 'Lotus', 'Vertex', 'Saffron', 'Orbit', 'Kaveri']
+NAME_SUFFIXES = ['Technologies', 'Retail', 'Health', 'Labs', 'Finance', 'Learning', 'Games', 'Services']
+
+
+def sample_answers(rng: random.Random, index: int = 0) -> Dict[str, Any]:
+    """
+    One answers dictionary, as run_questionnaire() would return it
+
+    Args:
+        rng: Random generator (seeded by the caller)
+        index: Sequence number, used in the business name
+
+    Returns:
+        Answers dictionary keyed by each question's maps_to field
+    """
+    answers = {}
+    for question in QUESTIONS:
+        field = question['maps_to']
+        kind = question['type']
+
+        if kind == 'text':
+            answers[field] = f"{rng.choice(NAME_PREFIXES)} {rng.choice(NAME_SUFFIXES)} {index}"
+        elif kind == 'number':
+            low, high = USER_COUNT_RANGE
+            answers[field] = int(math.exp(rng.uniform(math.log(low), math.log(high))))
+        elif kind == 'yes_no':
+            answers[field] = rng.random() < YES_RATES.get(field, 0.5)
+        elif kind == 'select':
+            weights = OPTION_WEIGHTS.get(field, {})
+            answers[field] = rng.choices(question['options'], [weights.get(o, 1) for o in question['options']])[0]
+        elif kind == 'multiselect':
+            rates = MULTISELECT_RATES.get(field, {})
+            chosen = [o for o in question['options'] if o != 'none' and rng.random() < rates.get(o, 0.5)]
+            answers[field] = chosen or (['none'] if 'none' in question['options'] else [question['options'][0]])
+    return answers
+
+
+def iter_profile_rows(count: int, seed: int, start: datetime) -> Iterator[tuple]:
+    """business_profiles rows (created over the year before start)"""
+    rng = random.Random(seed)
+    core_fields = {'business_name', 'entity_type', 'user_count', 'processes_children_data', 'cross_border_transfers'}
+    for i in range(count):
+        answers = sample_answers(rng, i + 1)
+        extended = {k: v for k, v in answers.items() if k not in core_fields}
+        created_at = (start - timedelta(seconds=rng.randint(0, 365 * 86400))).isoformat()
+        yield (
+            answers['business_name'],
+            answers['entity_type'],
+            answers['user_count'],
+            int(answers['processes_children_data']),
+            int(answers['cross_border_transfers']),
+            0.0,
+            json.dumps(extended),
+            created_at,
+            created_at
+        )
+
+
+def iter_status_rows(count: int, business_ids: range, requirements: List[tuple],
+                     seed: int, start: datetime) -> Iterator[tuple]:
+    """
+    compliance_status rows: businesses in order, each with a random subset
+    of requirements (no duplicate pairs), completion driven by maturity
+    """
+    rng = random.Random(seed + 1)
+    per_business = max(1, math.ceil(count / max(len(business_ids), 1)))
+    per_business = min(per_business, len(requirements))
+    produced = 0
+
+    for business_id in business_ids:
+        maturity = rng.betavariate(2, 3) * 1.6  # Most businesses early, a few mature
+        for requirement_id, obligation_type in rng.sample(requirements, per_business):
+            roll = rng.random()
+            completion = min(COMPLETION_RATES.get(obligation_type, 0.4) * maturity, 0.98)
+            if roll < completion:
+                status = 'completed'
+                completion_date = (start - timedelta(days=rng.randint(0, 300))).date().isoformat()
+            elif roll < completion + 0.25:
+                status, completion_date = 'in_progress', None
+            else:
+                status, completion_date = 'not_started', None
+            yield (business_id, requirement_id, status, completion_date, None, start.isoformat())
+
+            produced += 1
+            if produced >= count:
+                return
+
+
+def _insert_batches(cursor, sql: str, rows: Iterator[tuple], batch_size: int) -> int:
+    """executemany() in fixed-size batches; returns rows inserted"""
+    total = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            cursor.executemany(sql, batch)
+            total += len(batch)
+            batch = []
+    if batch:
+        cursor.executemany(sql, batch)
+        total += len(batch)
+    return total
+
+
+def copy_requirements(cursor) -> int:
+    """Copy requirements (and their penalty links) from the database attached as 'source'"""
+    cursor.execute("""
+        INSERT INTO requirements (
+            rule_number, section_number, requirement_text, obligation_type, deadline,
+            penalty_category_id, schedule_reference, is_sdf_specific,
+            requirement_text_hash, clause_key, version_id, is_active, created_at
+        )
+        SELECT rule_number, section_number, requirement_text, obligation_type, deadline,
+               penalty_category_id, schedule_reference, is_sdf_specific,
+               requirement_text_hash, clause_key, version_id, is_active, created_at
+        FROM source.requirements
+        ORDER BY id
+    """)
+    return cursor.rowcount
+
+
+def multiply_requirements(cursor, factor: int) -> int:
+    """
+    Add factor - 1 copies of every active Rule 3-14 clause
+
+    Copies keep rule_number, obligation_type and penalty so trigger groups
+    match them; text and clause_key get a copy suffix (unique indexes).
+    """
+    cursor.execute("""
+        SELECT rule_number, requirement_text, obligation_type, deadline,
+               penalty_category_id, is_sdf_specific, clause_key, version_id, created_at
+        FROM requirements
+        WHERE is_active = 1
+          AND CAST(SUBSTR(rule_number, 6) AS INTEGER) BETWEEN 3 AND 14
+    """)
+    originals = cursor.fetchall()
+
+    rows = []
+    for copy in range(1, factor):
+        for rule_number, text, obligation, deadline, penalty_id, is_sdf, clause_key, version_id, created_at in originals:
+            copy_text = f"{text} [synthetic copy {copy}]"
+            rows.append((
+                rule_number, copy_text, obligation, deadline, penalty_id, is_sdf,
+                requirement_text_hash(copy_text), f"{clause_key or rule_number}#copy{copy}",
+                version_id, created_at
+            ))
+    cursor.executemany("""
+        INSERT INTO requirements (
+            rule_number, requirement_text, obligation_type, deadline, penalty_category_id,
+            is_sdf_specific, requirement_text_hash, clause_key, version_id, is_active, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?)
+    """, rows)
+    return len(rows)
+
+
+def generate_database(db_path: Path, profiles: int = 10_000, statuses: int = 0, multiply: int = 1,
+                      seed: int = DEFAULT_SEED, source_db: Optional[Path] = None,
+                      batch_size: int = BATCH_SIZE) -> Dict[str, Any]:
+    """
+    Create (or extend) a scratch database with synthetic data
+
+    Args:
+        db_path: Target database (created with the full schema if missing)
+        profiles: Business profiles to add
+        statuses: compliance_status rows to add (spread over the new profiles)
+        multiply: Scale the Rule 3-14 requirements corpus by this factor
+        seed: Random seed (same seed, same data)
+        source_db: Extracted database to copy requirements from when the
+                   target has none (default: data/processed/dpdpa_compliance.db)
+        batch_size: Rows per executemany() call
+
+    Returns:
+        Dictionary with row counts and seconds per step
+    """
+    db_path = Path(db_path)
+    if not db_path.exists():
+        init_database(db_path)
+
+    start = datetime(2026, 1, 1)
+    timings = {}
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    # Disposable database: trade durability for load speed
+    cursor.execute("PRAGMA journal_mode = OFF")
+    cursor.execute("PRAGMA synchronous = OFF")
+
+    cursor.execute("PRAGMA table_info(business_profiles)")
+    if 'extended_data' not in [col[1] for col in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE business_profiles ADD COLUMN extended_data TEXT")
+    ensure_assessment_schema(cursor)
+
+    cursor.execute("SELECT COUNT(*) FROM requirements")
+    needs_requirements = cursor.fetchone()[0] == 0
+    if needs_requirements:
+        source_db = Path(source_db or SOURCE_DB_PATH)
+        if not source_db.exists():
+            conn.close()
+            raise FileNotFoundError(f"{source_db} not found; run src/extraction/extract_requirements.py")
+        # ATTACH/DETACH aren't allowed inside the transaction
+        cursor.execute("ATTACH DATABASE ? AS source", (str(source_db),))
+
+    cursor.execute("BEGIN")
+
+    began = perf_counter()
+    copied = copy_requirements(cursor) if needs_requirements else 0
+    added_requirements = multiply_requirements(cursor, multiply) if multiply > 1 else 0
+    timings['requirements'] = perf_counter() - began
+
+    began = perf_counter()
+    cursor.execute("SELECT COALESCE(MAX(id), 0) FROM business_profiles")
+    first_id = cursor.fetchone()[0] + 1
+    inserted_profiles = _insert_batches(cursor, """
+        INSERT INTO business_profiles (
+            business_name, entity_type, user_count, processes_children_data,
+            cross_border_transfers, assessment_score, extended_data, created_at, last_updated
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, iter_profile_rows(profiles, seed, start), batch_size)
+    timings['profiles'] = perf_counter() - began
+
+    began = perf_counter()
+    inserted_statuses = 0
+    if statuses and inserted_profiles:
+        cursor.execute("SELECT id, obligation_type FROM requirements WHERE is_active = 1 ORDER BY id")
+        requirements = cursor.fetchall()
+        inserted_statuses = _insert_batches(cursor, """
+            INSERT INTO compliance_status (
+                business_profile_id, requirement_id, status, completion_date, notes, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?)
+        """, iter_status_rows(statuses, range(first_id, first_id + inserted_profiles),
+                              requirements, seed, start), batch_size)
+    timings['statuses'] = perf_counter() - began
+
+    conn.commit()
+    if needs_requirements:
+        cursor.execute("DETACH DATABASE source")
+
+    began = perf_counter()
+    cursor.execute("ANALYZE")
+    conn.commit()
+    timings['analyze'] = perf_counter() - began
+    conn.close()
+
+    return {
+        'db_path': str(db_path),
+        'seed': seed,
+        'requirements_copied': copied,
+        'requirements_added': added_requirements,
+        'profiles': inserted_profiles,
+        'statuses': inserted_statuses,
+        'seconds': {step: round(elapsed, 2) for step, elapsed in timings.items()}
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic DPDPA compliance database")
+    parser.add_argument('--db', required=True, help="Target database file (scratch; never the real one)")
+    parser.add_argument('--profiles', type=int, default=10_000)
+    parser.add_argument('--statuses', type=int, default=0, help="compliance_status rows")
+    parser.add_argument('--multiply', type=int, default=1, help="Scale factor for Rule 3-14 requirements")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--source-db', help="Extracted database to copy requirements from")
+    args = parser.parse_args()
+
+    if Path(args.db).resolve() == Path(SOURCE_DB_PATH).resolve():
+        print("✗ Refusing to write synthetic data into the main database")
+        sys.exit(1)
+
+    print("="*70)
+    print("SYNTHETIC DATA GENERATOR")
+    print("="*70)
+    began = perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        summary = generate_database(args.db, args.profiles, args.statuses, args.multiply,
+                                    args.seed, args.source_db)
+    total = perf_counter() - began
+
+    print(f"✓ Database: {summary['db_path']} (seed {summary['seed']})")
+    print(f"  Requirements copied: {summary['requirements_copied']:,}, synthetic copies: {summary['requirements_added']:,}")
+    print(f"  Business profiles:   {summary['profiles']:,} ({summary['seconds']['profiles']:.1f}s)")
+    print(f"  Compliance status:   {summary['statuses']:,} ({summary['seconds']['statuses']:.1f}s)")
+    print(f"  Total: {total:.1f}s")
+    print("="*70)
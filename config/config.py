@@ -4,6 +4,7 @@ Configuration for DPDPA Compliance Dashboard
 
 from pathlib import Path
 from datetime import datetime
+import os
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -32,6 +33,7 @@ FULL_COMPLIANCE_DEADLINE = datetime(2027, 5, 13)   # 18 months
 # Extraction parameters
 MIN_REQUIREMENT_LENGTH = 20  # Characters
 MAX_REQUIREMENT_LENGTH = 1000
+EXTRACTION_WORKERS = min(4, os.cpu_count() or 1)  # PDF text extraction processes
 OBLIGATION_KEYWORDS = [
     "shall", "must", "required", "obligation", "duty", 
     "mandatory", "necessary", "ensure", "implement"
@@ -144,8 +146,8 @@ PENALTY_AMOUNTS = {
     "data_principal_duties": 10_000           # ₹10,000
 }
 
-# Database path
-DB_PATH = "data/processed/dpdpa_compliance.db"
+# Database path (DPDPA_DB_PATH overrides it, e.g. for benchmarks or the API service)
+DB_PATH = os.environ.get("DPDPA_DB_PATH", "data/processed/dpdpa_compliance.db")
 
 # Legal disclaimer
 LEGAL_DISCLAIMER = """
@@ -0,0 +1,347 @@
+"""
+DPDPA Compliance API
+Minimal ASGI application over the assessment service
+
+Endpoints:
+    GET  /health                              Liveness and catalog version
+    POST /profiles                            Create a business profile
+    POST /match                               Applicable requirements for answers
+    POST /analyze                             Gap analysis ({"business_id"} or {"business_id", "answers"})
+    POST /assessments                         Profile + analysis + snapshot in one call
+    GET  /profiles/{id}/snapshot              Latest stored assessment snapshot
+    GET  /profiles/{id}/documents?format=docx Document pack (ZIP, streamed)
+    GET  /metrics                             Prometheus text exposition
+
+Blocking work (SQLite, document generation) runs on the service's bounded
+thread pool, so the event loop keeps accepting requests. No framework is
+needed; serve it with any ASGI server or with src/api/server.py.
+
+Usage:
+    python src/api/server.py --port 8000
+    uvicorn src.api.app:app --port 8000
+"""
+
+import asyncio
+import json
+import re
+from time import perf_counter
+from functools import partial
+from pathlib import Path
+import sys
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import parse_qs
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.api import service
+from src.assessment.questionnaire import QUESTIONS
+from src.assessment.records import json_default
+from src.document_generator.validators import ValidationError
+from src.utils import metrics
+
+# Largest accepted request body
+MAX_BODY_BYTES = 1024 * 1024
+
+# Bytes per body message when streaming downloads
+STREAM_CHUNK_BYTES = 64 * 1024
+
+JSON_HEADERS = [(b'content-type', b'application/json')]
+
+# Questionnaire answers by key, and the JSON shape each question type takes
+QUESTIONS_BY_KEY = {question['maps_to']: question for question in QUESTIONS}
+ANSWER_SHAPES = {
+    'text': ((str,), "a string"),
+    'select': ((str,), "a string"),
+    'number': ((int, float), "a non-negative number"),
+    'yes_no': ((bool,), "true or false"),
+    'multiselect': ((list,), "a list of strings"),
+}
+
+
+class HTTPError(Exception):
+    """Error response with a status code"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking service call on the API thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(service.get_executor(), partial(func, *args, **kwargs))
+
+
+async def send_json(send: Callable, status: int, payload: Any) -> None:
+    """Send a complete JSON response"""
+    body = json.dumps(payload, default=json_default).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': JSON_HEADERS + [(b'content-length', str(len(body)).encode())]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def read_json(receive: Callable) -> Dict[str, Any]:
+    """Read and parse a JSON object request body"""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            raise HTTPError(400, "Client disconnected")
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            raise HTTPError(413, f"Request body exceeds {MAX_BODY_BYTES} bytes")
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            break
+
+    try:
+        payload = json.loads(b''.join(chunks) or b'{}')
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPError(400, f"Invalid JSON: {e}")
+    if not isinstance(payload, dict):
+        raise HTTPError(400, "Request body must be a JSON object")
+    return payload
+
+
+def check_answer_types(answers: Dict[str, Any], prefix: str = '') -> None:
+    """
+    Check questionnaire answers against the question types in QUESTIONS
+
+    Keys that aren't questions are ignored. null is accepted only for
+    optional questions.
+
+    Raises:
+        HTTPError: 400 naming the first answer of the wrong type
+    """
+    for key, value in answers.items():
+        question = QUESTIONS_BY_KEY.get(key)
+        if question is None:
+            continue
+        types, description = ANSWER_SHAPES[question['type']]
+        if value is None:
+            if question.get('required'):
+                raise HTTPError(400, f"{prefix}{key} must be {description}, not null")
+            continue
+        if (not isinstance(value, types) or isinstance(value, bool) != (question['type'] == 'yes_no')
+                or (question['type'] == 'number' and value < 0)
+                or (question['type'] == 'multiselect' and not all(isinstance(item, str) for item in value))):
+            raise HTTPError(400, f"{prefix}{key} must be {description}")
+
+
+def require_answers(payload: Dict[str, Any], key: str = 'answers') -> Dict[str, Any]:
+    """Answers object from a request payload (the payload itself if no key), type-checked"""
+    answers = payload.get(key, payload)
+    if not isinstance(answers, dict) or 'entity_type' not in answers:
+        raise HTTPError(400, "Answers must be an object with at least 'entity_type'")
+    check_answer_types(answers)
+
+    extended = answers.get('extended_data', {})
+    if not isinstance(extended, dict):
+        raise HTTPError(400, "extended_data must be an object")
+    check_answer_types(extended, prefix='extended_data.')
+    return answers
+
+
+def require_business_id(value: Any) -> int:
+    """Positive integer business ID"""
+    try:
+        business_id = int(value)
+    except (TypeError, ValueError):
+        raise HTTPError(400, "business_id must be an integer")
+    if business_id < 1:
+        raise HTTPError(400, "business_id must be positive")
+    return business_id
+
+
+# ============================================================================
+# HANDLERS
+# ============================================================================
+
+async def health(scope, receive, send, **params):
+    catalog = await run_blocking(service.get_current_catalog)
+    await send_json(send, 200, {'status': 'ok', 'version': catalog['version']})
+
+
+async def create_profile(scope, receive, send, **params):
+    answers = require_answers(await read_json(receive))
+    await send_json(send, 201, await run_blocking(service.create_profile, answers))
+
+
+async def match(scope, receive, send, **params):
+    answers = require_answers(await read_json(receive))
+    await send_json(send, 200, await run_blocking(service.match, answers))
+
+
+async def analyze(scope, receive, send, **params):
+    payload = await read_json(receive)
+    business_id = require_business_id(payload.get('business_id'))
+    answers = require_answers(payload) if 'answers' in payload else None
+    analysis = await run_blocking(service.analyze, business_id, answers,
+                                  bool(payload.get('save_snapshot', False)))
+    await send_json(send, 200, analysis)
+
+
+async def create_assessment(scope, receive, send, **params):
+    answers = require_answers(await read_json(receive))
+    await send_json(send, 201, await run_blocking(service.assess, answers))
+
+
+async def snapshot(scope, receive, send, business_id):
+    result = await run_blocking(service.get_snapshot, require_business_id(business_id))
+    await send_json(send, 200, result)
+
+
+async def documents(scope, receive, send, business_id):
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    document_format = query.get('format', ['docx'])[0]
+    if document_format not in service.DOCUMENT_FORMATS:
+        raise HTTPError(400, f"format must be one of {', '.join(service.DOCUMENT_FORMATS)}")
+
+    pack, size, filename = await run_blocking(
+        service.build_document_pack, require_business_id(business_id), document_format
+    )
+    try:
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'content-type', b'application/zip'),
+                (b'content-length', str(size).encode()),
+                (b'content-disposition', f'attachment; filename="{filename}"'.encode())
+            ]
+        })
+        while True:
+            chunk = await run_blocking(pack.read, STREAM_CHUNK_BYTES)
+            more = pack.tell() < size
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': more})
+            if not more:
+                break
+    finally:
+        pack.close()
+
+
+async def metrics_endpoint(scope, receive, send, **params):
+    body = metrics.render().encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [
+            (b'content-type', metrics.CONTENT_TYPE.encode()),
+            (b'content-length', str(len(body)).encode())
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+# (method, path pattern, handler); named groups become handler arguments
+ROUTES = [
+    ('GET', r'/health', health),
+    ('POST', r'/profiles', create_profile),
+    ('POST', r'/match', match),
+    ('POST', r'/analyze', analyze),
+    ('POST', r'/assessments', create_assessment),
+    ('GET', r'/profiles/(?P<business_id>\d+)/snapshot', snapshot),
+    ('GET', r'/profiles/(?P<business_id>\d+)/documents', documents),
+    ('GET', r'/metrics', metrics_endpoint),
+]
+
+_COMPILED_ROUTES = [(method, re.compile(pattern + r'/?$'), handler) for method, pattern, handler in ROUTES]
+
+
+def resolve(method: str, path: str) -> Optional[tuple]:
+    """
+    Handler and path parameters for a request
+
+    Returns:
+        (handler, params) or None if no route matches the path
+
+    Raises:
+        HTTPError: 405 if the path exists but not for this method
+    """
+    path_matched = False
+    for route_method, pattern, handler in _COMPILED_ROUTES:
+        found = pattern.match(path)
+        if found:
+            if route_method == method:
+                return handler, found.groupdict()
+            path_matched = True
+    if path_matched:
+        raise HTTPError(405, f"Method {method} not allowed")
+    return None
+
+
+# ============================================================================
+# ASGI ENTRY POINT
+# ============================================================================
+
+async def lifespan(receive, send):
+    """Warm the catalog and a connection at startup"""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            try:
+                info = await run_blocking(service.warm_up)
+                print(f"✓ API ready (regulation version {info['version']}, {info['requirements']} requirements)")
+                await send({'type': 'lifespan.startup.complete'})
+            except Exception as e:
+                await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+        elif message['type'] == 'lifespan.shutdown':
+            service.get_executor().shutdown(wait=False)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI application"""
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    started = False
+    status = 500
+    route_name = 'unmatched'
+    start = perf_counter()
+
+    async def tracked_send(message):
+        nonlocal started, status
+        if message['type'] == 'http.response.start':
+            started = True
+            status = message['status']
+        await send(message)
+
+    try:
+        route = resolve(scope['method'], scope['path'])
+        if route is None:
+            raise HTTPError(404, f"No route for {scope['path']}")
+        handler, params = route
+        route_name = handler.__name__
+        await handler(scope, receive, tracked_send, **params)
+    except Exception as e:
+        if started:
+            raise  # Response already under way; let the server drop the connection
+        if isinstance(e, HTTPError):
+            status, message = e.status, e.message
+        elif isinstance(e, service.NotFoundError):
+            status, message = 404, str(e)
+        elif isinstance(e, ValidationError):
+            status, message = 422, str(e)
+        elif isinstance(e, service.UnavailableError):
+            status, message = 501, str(e)
+        else:
+            print(f"❌ {scope['method']} {scope['path']} failed: {e}")
+            status, message = 500, "Internal server error"
+        await send_json(send, status, {'error': message})
+    finally:
+        method = metrics.bounded_label(scope['method'], metrics.HTTP_METHODS, 'OTHER')
+        metrics.HTTP_REQUESTS.inc(method=method, route=route_name, status=status)
+        metrics.HTTP_REQUEST_SECONDS.observe(perf_counter() - start, method=method, route=route_name)
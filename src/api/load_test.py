@@ -0,0 +1,249 @@
+"""
+API Load Test
+Drives the API with concurrent keep-alive clients and reports throughput and latency
+
+Each client thread holds one persistent HTTP connection and sends requests
+back to back for the test duration. Scenarios:
+    health    GET /health
+    match     POST /match with sample answers
+    snapshot  GET /profiles/{id}/snapshot (one assessment is created first)
+    mixed     80% match, 15% snapshot, 5% analyze
+
+Usage:
+    python src/api/load_test.py --spawn                           # start a local server
+    python src/api/load_test.py --url http://127.0.0.1:8000 --scenario mixed -c 16 -d 20
+    python src/api/load_test.py --spawn --json results.json
+"""
+
+import argparse
+import http.client
+import json
+import random
+import subprocess
+import threading
+import time
+from pathlib import Path
+import sys
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+SAMPLE_ANSWERS = [
+    {'business_name': 'Load Test Retail', 'entity_type': 'ecommerce', 'user_count': 25_000_000,
+     'processes_children_data': False, 'cross_border_transfers': True,
+     'data_types': ['name', 'email', 'payment_info']},
+    {'business_name': 'Load Test Edtech', 'entity_type': 'edtech', 'user_count': 200_000,
+     'processes_children_data': True, 'cross_border_transfers': False,
+     'data_types': ['name', 'email', 'behavioral']},
+    {'business_name': 'Load Test Startup', 'entity_type': 'other', 'user_count': 5_000,
+     'processes_children_data': False, 'cross_border_transfers': False,
+     'data_types': ['name', 'email']},
+]
+
+SCENARIOS = ('health', 'match', 'snapshot', 'mixed')
+
+
+class Client:
+    """Keep-alive HTTP client for one load-test thread"""
+
+    def __init__(self, host: str, port: int, timeout: float = 30.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.conn = None
+
+    def request(self, method: str, path: str, payload: Optional[Dict[str, Any]] = None) -> tuple:
+        """Send a request; returns (status, body bytes)"""
+        if self.conn is None:
+            self.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        body = json.dumps(payload).encode() if payload is not None else None
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        try:
+            self.conn.request(method, path, body=body, headers=headers)
+            response = self.conn.getresponse()
+            data = response.read()
+        except (http.client.HTTPException, OSError):
+            self.close()
+            raise
+        if response.will_close:
+            self.close()
+        return response.status, data
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def pick_request(scenario: str, business_id: Optional[int], rng: random.Random) -> tuple:
+    """(method, path, payload) for the next request of a scenario"""
+    if scenario == 'mixed':
+        roll = rng.random()
+        if roll < 0.80:
+            scenario = 'match'
+        elif roll < 0.95:
+            scenario = 'snapshot'
+        else:
+            return 'POST', '/analyze', {'business_id': business_id}
+
+    if scenario == 'health':
+        return 'GET', '/health', None
+    if scenario == 'snapshot':
+        return 'GET', f'/profiles/{business_id}/snapshot', None
+    return 'POST', '/match', rng.choice(SAMPLE_ANSWERS)
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_load_test(url: str, scenario: str = 'match', concurrency: int = 8,
+                  duration: float = 10.0, warmup: float = 1.0) -> Dict[str, Any]:
+    """
+    Run one scenario against a running API
+
+    Args:
+        url: Base URL, e.g. http://127.0.0.1:8000
+        scenario: One of SCENARIOS
+        concurrency: Client threads (one connection each)
+        duration: Seconds to measure
+        warmup: Seconds of unmeasured requests first
+
+    Returns:
+        Dictionary with requests, errors, rps and latency percentiles (ms)
+    """
+    parsed = urlparse(url)
+    host, port = parsed.hostname, parsed.port or 80
+
+    business_id = None
+    if scenario in ('snapshot', 'mixed'):
+        status, body = Client(host, port).request('POST', '/assessments', SAMPLE_ANSWERS[0])
+        if status != 201:
+            raise RuntimeError(f"Could not create test assessment: {status} {body[:200]!r}")
+        business_id = json.loads(body)['business_id']
+
+    start_at = time.perf_counter() + warmup
+    stop_at = start_at + duration
+    results = []
+    results_lock = threading.Lock()
+
+    def worker(seed):
+        rng = random.Random(seed)
+        client = Client(host, port)
+        latencies, errors, statuses = [], 0, {}
+        while True:
+            now = time.perf_counter()
+            if now >= stop_at:
+                break
+            method, path, payload = pick_request(scenario, business_id, rng)
+            began = time.perf_counter()
+            try:
+                status, _ = client.request(method, path, payload)
+            except (http.client.HTTPException, OSError):
+                status = 0
+            elapsed = time.perf_counter() - began
+            if began < start_at:
+                continue  # Warm-up
+            statuses[status] = statuses.get(status, 0) + 1
+            if 200 <= status < 300:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+        client.close()
+        with results_lock:
+            results.append((latencies, errors, statuses))
+
+    threads = [threading.Thread(target=worker, args=(seed,), daemon=True) for seed in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies = sorted(latency for worker_latencies, _, _ in results for latency in worker_latencies)
+    errors = sum(worker_errors for _, worker_errors, _ in results)
+    statuses = {}
+    for _, _, worker_statuses in results:
+        for status, count in worker_statuses.items():
+            statuses[status] = statuses.get(status, 0) + count
+
+    return {
+        'scenario': scenario,
+        'concurrency': concurrency,
+        'duration_s': duration,
+        'requests': len(latencies) + errors,
+        'errors': errors,
+        'statuses': {str(status): count for status, count in sorted(statuses.items())},
+        'rps': round((len(latencies) + errors) / duration, 1),
+        'latency_ms': {
+            'p50': round(percentile(latencies, 0.50) * 1000, 2),
+            'p95': round(percentile(latencies, 0.95) * 1000, 2),
+            'p99': round(percentile(latencies, 0.99) * 1000, 2),
+            'max': round((latencies[-1] if latencies else 0.0) * 1000, 2)
+        }
+    }
+
+
+def spawn_server(port: int) -> subprocess.Popen:
+    """Start the built-in API server in a subprocess and wait until it answers"""
+    process = subprocess.Popen(
+        [sys.executable, str(project_root / 'src' / 'api' / 'server.py'),
+         '--port', str(port), '--builtin'],
+        cwd=str(project_root)
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            status, _ = Client('127.0.0.1', port, timeout=2).request('GET', '/health')
+            if status == 200:
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("API server did not start within 30 seconds")
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    latency = report['latency_ms']
+    print(f"\n{report['scenario']}: {report['requests']} requests, "
+          f"{report['concurrency']} clients, {report['duration_s']:.0f}s")
+    print(f"  {report['rps']} req/s   errors: {report['errors']}   statuses: {report['statuses']}")
+    print(f"  latency p50 {latency['p50']} ms   p95 {latency['p95']} ms   "
+          f"p99 {latency['p99']} ms   max {latency['max']} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the DPDPA compliance API")
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--scenario', choices=SCENARIOS + ('all',), default='all')
+    parser.add_argument('-c', '--concurrency', type=int, default=8)
+    parser.add_argument('-d', '--duration', type=float, default=10.0)
+    parser.add_argument('--spawn', action='store_true', help="Start the built-in server on the URL's port")
+    parser.add_argument('--json', metavar='PATH', help="Write results as JSON")
+    args = parser.parse_args()
+
+    process = spawn_server(urlparse(args.url).port or 8000) if args.spawn else None
+    try:
+        scenarios = SCENARIOS if args.scenario == 'all' else (args.scenario,)
+        reports = [run_load_test(args.url, scenario, args.concurrency, args.duration) for scenario in scenarios]
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    for report in reports:
+        print_report(report)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(reports, indent=2))
+        print(f"\n✓ Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+"""
+API Server
+Runs the ASGI app locally, with uvicorn if installed or a built-in asyncio server
+
+The built-in server speaks enough HTTP/1.1 for local use and load tests:
+keep-alive connections, Content-Length request bodies, streamed
+(Content-Length or chunked) responses and the ASGI lifespan protocol.
+Use uvicorn (pip install uvicorn) for anything exposed beyond localhost.
+
+Usage:
+    python src/api/server.py                      # 127.0.0.1:8000
+    python src/api/server.py --port 9000 --builtin
+"""
+
+import argparse
+import asyncio
+from http import HTTPStatus
+from pathlib import Path
+import sys
+from typing import Callable, Optional
+from urllib.parse import unquote
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.api.app import MAX_BODY_BYTES, app
+
+# Longest accepted request line + headers
+MAX_HEADER_BYTES = 16 * 1024
+
+# Seconds an idle keep-alive connection stays open
+KEEP_ALIVE_SECONDS = 15
+
+
+async def run_lifespan(asgi_app: Callable, phase: str, state: dict) -> None:
+    """Send one lifespan event (startup or shutdown) to the app"""
+    received = asyncio.Queue()
+    sent = asyncio.Queue()
+    await received.put({'type': f'lifespan.{phase}'})
+
+    if phase == 'startup':
+        async def receive():
+            return await received.get()
+
+        async def send(message):
+            await sent.put(message)
+
+        state['received'] = received
+        state['task'] = asyncio.create_task(
+            asgi_app({'type': 'lifespan', 'asgi': {'version': '3.0'}}, receive, send)
+        )
+        state['sent'] = sent
+    else:
+        await state['received'].put({'type': 'lifespan.shutdown'})
+
+    message = await state['sent'].get()
+    if message['type'].endswith('.failed'):
+        raise RuntimeError(message.get('message', f"Lifespan {phase} failed"))
+
+
+class HTTPConnection:
+    """One client connection: parses requests and drives the ASGI app"""
+
+    def __init__(self, asgi_app: Callable, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter, server_address: tuple):
+        self.app = asgi_app
+        self.reader = reader
+        self.writer = writer
+        self.server_address = server_address
+        self.client_address = writer.get_extra_info('peername')
+
+    async def serve(self) -> None:
+        """Handle requests until the client closes or keep-alive ends"""
+        try:
+            while await self.handle_request():
+                pass
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.TimeoutError):
+            pass
+        finally:
+            self.writer.close()
+
+    async def write_error(self, status: int) -> None:
+        """Plain error response, then close"""
+        reason = HTTPStatus(status).phrase.encode()
+        self.writer.write(
+            b'HTTP/1.1 %d %s\r\ncontent-length: %d\r\nconnection: close\r\n\r\n%s'
+            % (status, reason, len(reason), reason)
+        )
+        await self.writer.drain()
+
+    async def handle_request(self) -> bool:
+        """
+        Read one request and run the app on it
+
+        Returns:
+            True if the connection should stay open for another request
+        """
+        try:
+            head = await asyncio.wait_for(self.reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_SECONDS)
+        except asyncio.LimitOverrunError:
+            await self.write_error(431)
+            return False
+        except asyncio.IncompleteReadError as e:
+            if e.partial:
+                raise
+            return False  # Clean close between requests
+
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ', 2)
+        except ValueError:
+            await self.write_error(400)
+            return False
+
+        headers = []
+        for line in lines[1:]:
+            if not line:
+                continue
+            name, _, value = line.partition(':')
+            headers.append((name.strip().lower().encode('latin-1'), value.strip().encode('latin-1')))
+        header_map = dict(headers)
+
+        if b'chunked' in header_map.get(b'transfer-encoding', b''):
+            await self.write_error(411)  # Clients send Content-Length bodies
+            return False
+        try:
+            content_length = int(header_map.get(b'content-length', b'0'))
+        except ValueError:
+            await self.write_error(400)
+            return False
+        if content_length > MAX_BODY_BYTES:
+            await self.write_error(413)
+            return False
+        body = await self.reader.readexactly(content_length) if content_length else b''
+
+        connection_header = header_map.get(b'connection', b'').lower()
+        keep_alive = (
+            connection_header != b'close'
+            if version == 'HTTP/1.1'
+            else connection_header == b'keep-alive'
+        )
+
+        path, _, query = target.partition('?')
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0', 'spec_version': '2.3'},
+            'http_version': version.split('/', 1)[-1],
+            'method': method.upper(),
+            'scheme': 'http',
+            'path': unquote(path),
+            'raw_path': path.encode('latin-1'),
+            'query_string': query.encode('latin-1'),
+            'root_path': '',
+            'headers': headers,
+            'client': self.client_address,
+            'server': self.server_address,
+        }
+
+        body_sent = False
+        response = {'started': False, 'complete': False, 'chunked': False}
+        finished = asyncio.Event()
+
+        async def receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            # Body already delivered; wait until the response is done
+            await finished.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                status = message['status']
+                response_headers = list(message.get('headers', []))
+                names = {name.lower() for name, _ in response_headers}
+                if b'content-length' not in names:
+                    response['chunked'] = True
+                    response_headers.append((b'transfer-encoding', b'chunked'))
+                response_headers.append((b'connection', b'keep-alive' if keep_alive else b'close'))
+
+                reason = HTTPStatus(status).phrase if status in HTTPStatus._value2member_map_ else ''
+                lines = [f'HTTP/1.1 {status} {reason}'.encode('latin-1')]
+                lines += [name + b': ' + value for name, value in response_headers]
+                self.writer.write(b'\r\n'.join(lines) + b'\r\n\r\n')
+                response['started'] = True
+
+            elif message['type'] == 'http.response.body':
+                chunk = message.get('body', b'')
+                more_body = message.get('more_body', False)
+                if response['chunked']:
+                    if chunk:
+                        self.writer.write(b'%x\r\n%s\r\n' % (len(chunk), chunk))
+                    if not more_body:
+                        self.writer.write(b'0\r\n\r\n')
+                else:
+                    self.writer.write(chunk)
+                await self.writer.drain()
+                if not more_body:
+                    response['complete'] = True
+                    finished.set()
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception as e:
+            print(f"❌ Unhandled error for {method} {path}: {e}")
+            if not response['started']:
+                await self.write_error(500)
+            return False
+        finally:
+            finished.set()
+
+        if not response['complete']:
+            return False
+        return keep_alive
+
+
+async def serve_builtin(asgi_app: Callable, host: str, port: int,
+                        ready: Optional[asyncio.Event] = None) -> None:
+    """Run the app on the built-in HTTP server until cancelled"""
+    lifespan_state = {}
+    await run_lifespan(asgi_app, 'startup', lifespan_state)
+
+    async def on_connect(reader, writer):
+        await HTTPConnection(asgi_app, reader, writer, (host, port)).serve()
+
+    server = await asyncio.start_server(on_connect, host, port, limit=MAX_HEADER_BYTES)
+    print(f"✓ Serving on http://{host}:{port} (built-in server)")
+    if ready is not None:
+        ready.set()
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await run_lifespan(asgi_app, 'shutdown', lifespan_state)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the DPDPA compliance API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--builtin', action='store_true', help="Use the built-in server even if uvicorn is installed")
+    args = parser.parse_args()
+
+    if not args.builtin:
+        try:
+            import uvicorn
+        except ImportError:
+            print("⚠️  uvicorn not installed, using the built-in server")
+        else:
+            uvicorn.run(app, host=args.host, port=args.port, log_level='warning')
+            return
+
+    try:
+        asyncio.run(serve_builtin(app, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n✓ Server stopped")
+
+
+if __name__ == "__main__":
+    main()
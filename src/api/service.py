@@ -0,0 +1,208 @@
+"""
+API Service Layer
+Blocking operations behind the HTTP API, run on a bounded thread pool
+
+Wraps business_profiler, requirement matching (via the in-memory catalog),
+gap_analyzer, snapshots and DocumentGenerator. Reads and writes (profile
+inserts, gap analysis, snapshots) use the calling thread's shared
+connection (src.utils.db.get_connection()), and the catalog stays warm
+between requests.
+
+Usage:
+    from src.api.service import get_executor, match
+
+    result = match({'entity_type': 'ecommerce', 'user_count': 25_000_000})
+"""
+
+import os
+import tempfile
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+import sys
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.assessment.business_profiler import create_business_profile, get_business_profile
+from src.assessment.catalog import get_current_catalog, match_from_catalog
+from src.assessment.gap_analyzer import analyze_gaps
+from src.assessment.requirement_matcher import get_trigger_groups
+from src.assessment.snapshots import get_latest_snapshot, save_snapshot
+from src.utils.db import get_connection
+from src.utils.tracing import span
+
+# Threads for blocking work (database, document generation)
+API_WORKERS = int(os.environ.get('DPDPA_API_WORKERS', '8'))
+
+# Document packs larger than this are spooled to disk while streaming
+SPOOL_MAX_BYTES = 4 * 1024 * 1024
+
+DOCUMENT_FORMATS = ('docx', 'pdf')
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+class NotFoundError(LookupError):
+    """Raised when a business profile or snapshot does not exist"""
+    pass
+
+
+class UnavailableError(RuntimeError):
+    """Raised when a feature needs an optional dependency that isn't installed"""
+    pass
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Bounded thread pool shared by all API requests"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=API_WORKERS, thread_name_prefix='api')
+        return _executor
+
+
+def warm_up() -> Dict[str, Any]:
+    """Load the catalog and open a connection before the first request"""
+    catalog = get_current_catalog()
+    get_connection().execute("SELECT 1").fetchone()
+    return {'version': catalog['version'], 'requirements': len(catalog['requirements'])}
+
+
+def load_profile(business_id: int) -> Dict[str, Any]:
+    """
+    Stored profile with extended fields flattened in
+
+    Raises:
+        NotFoundError: If the profile does not exist
+    """
+    try:
+        profile = get_business_profile(business_id, get_connection())
+    except ValueError:
+        raise NotFoundError(f"Business profile {business_id} not found")
+
+    answers = dict(profile)
+    answers.update(profile.get('extended_data') or {})
+    return answers
+
+
+def create_profile(answers: Dict[str, Any]) -> Dict[str, Any]:
+    """Save a business profile (questionnaire answers)"""
+    return {'business_id': create_business_profile(answers, get_connection(), verbose=False)}
+
+
+def match(answers: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Applicable requirements for an answers dictionary
+
+    Returns:
+        Dictionary with requirement_ids, groups, count and the catalog version
+    """
+    catalog = get_current_catalog()
+    requirement_ids = match_from_catalog(answers, catalog)
+    return {
+        'requirement_ids': requirement_ids,
+        'groups': sorted(get_trigger_groups(answers, catalog['thresholds'])),
+        'count': len(requirement_ids),
+        'version': catalog['version']
+    }
+
+
+def analyze(business_id: int, answers: Optional[Dict[str, Any]] = None,
+            store_snapshot: bool = False) -> Dict[str, Any]:
+    """
+    Gap analysis for a business
+
+    Args:
+        business_id: Business profile ID
+        answers: Answers to analyze (default: the stored profile)
+        store_snapshot: Save the result as the business's latest snapshot
+
+    Returns:
+        Analysis dictionary from analyze_gaps()
+    """
+    if answers is None:
+        answers = load_profile(business_id)
+
+    catalog = get_current_catalog()
+    conn = get_connection()
+    analysis = analyze_gaps(business_id, match_from_catalog(answers, catalog), answers, conn=conn)
+
+    if store_snapshot:
+        save_snapshot(business_id, analysis, catalog['version'], conn)
+    return analysis
+
+
+def assess(answers: Dict[str, Any]) -> Dict[str, Any]:
+    """Create a profile, analyze it and store a snapshot"""
+    business_id = create_business_profile(answers, get_connection(), verbose=False)
+    return {
+        'business_id': business_id,
+        'analysis': analyze(business_id, answers, store_snapshot=True)
+    }
+
+
+def get_snapshot(business_id: int) -> Dict[str, Any]:
+    """
+    Latest stored snapshot of a business
+
+    Raises:
+        NotFoundError: If the business has no snapshot
+    """
+    snapshot = get_latest_snapshot(business_id, get_connection())
+    if snapshot is None:
+        raise NotFoundError(f"No snapshot for business profile {business_id}")
+    return snapshot
+
+
+def build_document_pack(business_id: int, document_format: str = 'docx') -> Tuple[BinaryIO, int, str]:
+    """
+    Generate all required documents for a business as a ZIP
+
+    The archive is built in memory (spooled to a temporary file when large)
+    rather than in data/processed/generated_documents, so concurrent
+    requests don't overwrite each other's files.
+
+    Args:
+        business_id: Business profile ID
+        document_format: 'docx' or 'pdf'
+
+    Returns:
+        (file object positioned at 0, size in bytes, download filename)
+
+    Raises:
+        NotFoundError: If the profile does not exist
+        ValidationError: If the profile can't be used for documents
+        UnavailableError: If PDF output is requested without reportlab
+    """
+    from src.document_generator import DocumentGenerator, PdfRenderer
+
+    if document_format == 'pdf' and PdfRenderer is None:
+        raise UnavailableError("PDF output requires reportlab")
+
+    answers = load_profile(business_id)
+    analysis = analyze(business_id, answers)
+    documents = DocumentGenerator(answers, analysis).generate_all_required_documents()
+
+    if document_format == 'pdf':
+        renderer = PdfRenderer()
+
+    pack = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    with span('docs.zip', documents=len(documents), format=document_format), \
+            zipfile.ZipFile(pack, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        for doc_name, doc in documents.items():
+            if document_format == 'pdf':
+                zipf.writestr(f"{doc_name}.pdf", renderer.render(doc, title=doc_name))
+            else:
+                buffer = BytesIO()
+                doc.save(buffer)
+                zipf.writestr(f"{doc_name}.docx", buffer.getvalue())
+
+    size = pack.tell()
+    pack.seek(0)
+    return pack, size, f"DPDP_Documents_{business_id}_{document_format}.zip"
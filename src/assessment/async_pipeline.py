@@ -0,0 +1,231 @@
+"""
+Async Assessment Pipeline
+asyncio facade over profile creation, requirement matching and gap analysis
+
+Matching and completion inference only need the answers, not the new
+business_id, so assess() runs them concurrently with the profile insert
+and only waits for all three before the gap analysis. Database work runs
+on a small thread pool whose threads each keep one shared connection
+(src.utils.db.get_connection()) that the profile insert, inference,
+analysis and snapshot all use, so the event loop never blocks on SQLite.
+Matching uses the process-wide requirement catalog (no queries), and
+nothing on this path prints. assess_many() runs many assessments with a
+concurrency limit.
+
+Usage:
+    import asyncio
+    from src.assessment.async_pipeline import assess, assess_many
+
+    result = asyncio.run(assess(answers))
+    results = asyncio.run(assess_many(profiles, concurrency=8))
+
+    python src/assessment/async_pipeline.py --count 50 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.assessment.business_profiler import create_business_profile
+from src.assessment.catalog import get_current_catalog, match_from_catalog
+from src.assessment.gap_analyzer import analyze_gaps, infer_completed_requirements
+from src.assessment.snapshots import save_snapshot
+from src.utils.db import get_connection
+
+# Threads (and so connections) for database work
+DB_POOL_SIZE = int(os.environ.get('DPDPA_DB_POOL_SIZE', '4'))
+
+# Assessments in flight at once in assess_many()
+DEFAULT_CONCURRENCY = 8
+
+_db_executor = None
+_db_executor_lock = threading.Lock()
+
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Thread pool for database work (created on first use)"""
+    global _db_executor
+    with _db_executor_lock:
+        if _db_executor is None:
+            _db_executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix='assessment-db')
+        return _db_executor
+
+
+async def run_db(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking database call on the pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(), partial(func, *args, **kwargs))
+
+
+def _create_profile(answers: Dict[str, Any]) -> int:
+    return create_business_profile(answers, get_connection(), verbose=False)
+
+
+def _match(answers: Dict[str, Any]) -> Tuple[List[int], int]:
+    catalog = get_current_catalog()
+    return match_from_catalog(answers, catalog), catalog['version']
+
+
+def _infer_completed(answers: Dict[str, Any]) -> List[int]:
+    return infer_completed_requirements(None, answers, get_connection())
+
+
+def _analyze(business_id: int, applicable_ids: List[int], answers: Dict[str, Any],
+             completed_ids: List[int]) -> Dict[str, Any]:
+    return analyze_gaps(business_id, applicable_ids, answers, completed_ids, get_connection())
+
+
+def _save_snapshot(business_id: int, analysis: Dict[str, Any], version: int) -> None:
+    save_snapshot(business_id, analysis, version, get_connection())
+
+
+async def assess(answers: Dict[str, Any], store_snapshot: bool = False) -> Dict[str, Any]:
+    """
+    Run one assessment
+
+    Args:
+        answers: Answers dictionary (questionnaire or dashboard form)
+        store_snapshot: Also save an assessment snapshot
+
+    Returns:
+        Dictionary with business_id, answers, analysis and elapsed (seconds)
+    """
+    start = perf_counter()
+
+    business_id, (applicable_ids, version), completed_ids = await asyncio.gather(
+        run_db(_create_profile, answers),
+        run_db(_match, answers),
+        run_db(_infer_completed, answers)
+    )
+    analysis = await run_db(_analyze, business_id, applicable_ids, answers, completed_ids)
+
+    if store_snapshot:
+        await run_db(_save_snapshot, business_id, analysis, version)
+
+    return {
+        'business_id': business_id,
+        'answers': answers,
+        'analysis': analysis,
+        'elapsed': perf_counter() - start
+    }
+
+
+async def assess_many(profiles: Iterable[Dict[str, Any]], concurrency: int = DEFAULT_CONCURRENCY,
+                      store_snapshot: bool = False, return_exceptions: bool = False) -> List[Any]:
+    """
+    Run many assessments, at most `concurrency` at a time
+
+    Args:
+        profiles: Answers dictionaries
+        concurrency: Assessments in flight at once
+        store_snapshot: Also save a snapshot for each
+        return_exceptions: Return failures in the result list instead of raising
+
+    Returns:
+        assess() results in the order of profiles
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(answers):
+        async with semaphore:
+            return await assess(answers, store_snapshot)
+
+    return await asyncio.gather(*(bounded(answers) for answers in profiles),
+                                return_exceptions=return_exceptions)
+
+
+def assess_sequential(answers: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The stages of assess() one after another on the calling thread, for comparison
+
+    Uses the same pooled connection (get_connection()) and catalog matching
+    as assess(), so compare_latency() measures only the concurrency.
+    """
+    start = perf_counter()
+    business_id = _create_profile(answers)
+    applicable_ids, _ = _match(answers)
+    analysis = _analyze(business_id, applicable_ids, answers, _infer_completed(answers))
+    return {
+        'business_id': business_id,
+        'answers': answers,
+        'analysis': analysis,
+        'elapsed': perf_counter() - start
+    }
+
+
+def compare_latency(profiles: List[Dict[str, Any]], concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, Any]:
+    """
+    Time the sequential chain against assess() and assess_many()
+
+    Returns:
+        Dictionary with mean per-assessment latency (ms) of each mode and the
+        wall time (s) for the whole batch sequentially and with assess_many()
+    """
+    start = perf_counter()
+    sequential = [assess_sequential(answers) for answers in profiles]
+    sequential_wall = perf_counter() - start
+
+    async def one_at_a_time():
+        return [await assess(answers) for answers in profiles]
+
+    single = asyncio.run(one_at_a_time())
+
+    start = perf_counter()
+    batch = asyncio.run(assess_many(profiles, concurrency))
+    batch_wall = perf_counter() - start
+
+    def mean_ms(results):
+        return round(sum(r['elapsed'] for r in results) / len(results) * 1000, 2)
+
+    return {
+        'count': len(profiles),
+        'concurrency': concurrency,
+        'sequential_ms': mean_ms(sequential),
+        'async_ms': mean_ms(single),
+        'sequential_wall_s': round(sequential_wall, 3),
+        'assess_many_wall_s': round(batch_wall, 3)
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare sequential and async assessment latency")
+    parser.add_argument('--count', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    args = parser.parse_args()
+
+    entity_types = ['ecommerce', 'edtech', 'fintech', 'gaming', 'startup']
+    profiles = [
+        {
+            'business_name': f'Async Test {i}',
+            'entity_type': entity_types[i % len(entity_types)],
+            'user_count': 1_000 * (10 ** (i % 5)),
+            'processes_children_data': i % 3 == 0,
+            'cross_border_transfers': i % 2 == 0,
+            'has_breach_plan': i % 4 == 0
+        }
+        for i in range(args.count)
+    ]
+
+    print("="*70)
+    print("ASYNC ASSESSMENT PIPELINE - LATENCY COMPARISON")
+    print("="*70)
+    report = compare_latency(profiles, args.concurrency)
+    print(f"Assessments: {report['count']} (concurrency {report['concurrency']})")
+    print(f"Per assessment, sequential chain: {report['sequential_ms']:8.2f} ms")
+    print(f"Per assessment, async assess():   {report['async_ms']:8.2f} ms "
+          f"({report['sequential_ms'] / max(report['async_ms'], 1e-9):.2f}x)")
+    print(f"Batch wall time, sequential:      {report['sequential_wall_s']:8.3f} s")
+    print(f"Batch wall time, assess_many():   {report['assess_many_wall_s']:8.3f} s "
+          f"({report['sequential_wall_s'] / max(report['assess_many_wall_s'], 1e-9):.2f}x)")
+    print("="*70)
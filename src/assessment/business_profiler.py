@@ -12,27 +12,44 @@ import json
 from datetime import datetime
 from pathlib import Path
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from config.config import DB_PATH
+from src.assessment.questionnaire import QUESTIONS
+from src.utils.metrics import ASSESSMENTS_CREATED, bounded_label, instrument_connection
+from src.utils.tracing import span, traced
 
+# Default page size for list_business_profiles_page()
+PROFILE_PAGE_SIZE = 20
 
-def create_business_profile(answers: Dict[str, Any]) -> int:
+# entity_type values counted as themselves in ASSESSMENTS_CREATED (the rest as 'other')
+ENTITY_TYPE_LABELS = frozenset(next(q['options'] for q in QUESTIONS if q['maps_to'] == 'entity_type'))
+
+
+@traced('profile.create')
+def create_business_profile(answers: Dict[str, Any], conn: Optional[sqlite3.Connection] = None,
+                            verbose: bool = True) -> int:
     """
     Save business profile to database
     
     Args:
         answers: Dictionary from questionnaire.run_questionnaire()
+        conn: Optional open connection (e.g. src.utils.db.get_connection()),
+              left open afterwards
+        verbose: Print the created profile (off for worker threads)
         
     Returns:
         business_profile_id: Primary key of inserted record
     """
     
-    conn = sqlite3.connect(DB_PATH)
+    owns_connection = conn is None
+    if owns_connection:
+        with span('db.connect'):
+            conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     try:
@@ -57,107 +74,92 @@ def create_business_profile(answers: Dict[str, Any]) -> int:
             'has_grievance_system': answers.get('has_grievance_system', False)
         }
         
-        # Check if business_profiles table has extended_data column
-        cursor.execute("PRAGMA table_info(business_profiles)")
-        columns = [col[1] for col in cursor.fetchall()]
-        
-        if 'extended_data' in columns:
-            # Insert with extended_data column
-            cursor.execute("""
-                INSERT INTO business_profiles (
-                    business_name,
-                    entity_type,
-                    user_count,
-                    processes_children_data,
-                    cross_border_transfers,
-                    assessment_score,
-                    extended_data,
-                    created_at,
-                    last_updated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+        values = (
+            business_name,
+            entity_type,
+            user_count,
+            1 if processes_children_data else 0,
+            1 if cross_border_transfers else 0,
+            0.0,  # Initial score
+            json.dumps(extended_data),
+            datetime.now().isoformat(),
+            datetime.now().isoformat()
+        )
+        insert_sql = """
+            INSERT INTO business_profiles (
                 business_name,
                 entity_type,
                 user_count,
-                1 if processes_children_data else 0,
-                1 if cross_border_transfers else 0,
-                0.0,  # Initial score
-                json.dumps(extended_data),
-                datetime.now().isoformat(),
-                datetime.now().isoformat()
-            ))
-        else:
-            # Add extended_data column first
+                processes_children_data,
+                cross_border_transfers,
+                assessment_score,
+                extended_data,
+                created_at,
+                last_updated
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        
+        try:
+            cursor.execute(insert_sql, values)
+        except sqlite3.OperationalError as e:
+            # Databases created before extended_data existed: add the column once
+            if 'extended_data' not in str(e):
+                raise
             try:
                 cursor.execute("""
                     ALTER TABLE business_profiles
                     ADD COLUMN extended_data TEXT
                 """)
-                conn.commit()
-                print("✓ Added extended_data column to business_profiles")
+                if verbose:
+                    print("✓ Added extended_data column to business_profiles")
             except sqlite3.OperationalError:
-                # Column already exists, that's fine
+                # Column added concurrently, that's fine
                 pass
-            
-            # Now insert with extended_data
-            cursor.execute("""
-                INSERT INTO business_profiles (
-                    business_name,
-                    entity_type,
-                    user_count,
-                    processes_children_data,
-                    cross_border_transfers,
-                    assessment_score,
-                    extended_data,
-                    created_at,
-                    last_updated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                business_name,
-                entity_type,
-                user_count,
-                1 if processes_children_data else 0,
-                1 if cross_border_transfers else 0,
-                0.0,
-                json.dumps(extended_data),
-                datetime.now().isoformat(),
-                datetime.now().isoformat()
-            ))
+            cursor.execute(insert_sql, values)
         
         business_id = cursor.lastrowid
         conn.commit()
+        ASSESSMENTS_CREATED.inc(entity_type=bounded_label(entity_type, ENTITY_TYPE_LABELS))
         
-        print(f"✓ Business profile created (ID: {business_id})")
-        print(f"  Name: {business_name}")
-        print(f"  Type: {entity_type}")
-        print(f"  Users: {user_count:,}")
+        if verbose:
+            print(f"✓ Business profile created (ID: {business_id})")
+            print(f"  Name: {business_name}")
+            print(f"  Type: {entity_type}")
+            print(f"  Users: {user_count:,}")
         
         return business_id
         
     except sqlite3.Error as e:
-        print(f"❌ Database error: {e}")
+        if verbose:
+            print(f"❌ Database error: {e}")
         conn.rollback()
         raise
     except Exception as e:
-        print(f"❌ Error creating business profile: {e}")
+        if verbose:
+            print(f"❌ Error creating business profile: {e}")
         conn.rollback()
         raise
     finally:
-        conn.close()
+        if owns_connection:
+            conn.close()
 
 
-def get_business_profile(business_id: int) -> Dict[str, Any]:
+def get_business_profile(business_id: int, conn: Optional[sqlite3.Connection] = None) -> Dict[str, Any]:
     """
     Retrieve business profile from database
     
     Args:
         business_id: Primary key
+        conn: Optional open connection (e.g. src.utils.db.get_connection()),
+              left open afterwards
         
     Returns:
         Dictionary with business profile data
     """
     
-    conn = sqlite3.connect(DB_PATH)
+    owns_connection = conn is None
+    if owns_connection:
+        conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     try:
@@ -226,7 +228,36 @@ def get_business_profile(business_id: int) -> Dict[str, Any]:
         print(f"❌ Database error: {e}")
         raise
     finally:
-        conn.close()
+        if owns_connection:
+            conn.close()
+
+
+def profile_to_answers(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a questionnaire-style answers dict from a stored profile
+    
+    Extended fields are available both flattened and under 'extended_data',
+    as match_requirements() and analyze_gaps() expect.
+    
+    Args:
+        profile: Dictionary from get_business_profile()
+        
+    Returns:
+        Answers dictionary
+    """
+    answers = {
+        'business_name': profile.get('business_name', 'Unknown'),
+        'entity_type': profile.get('entity_type', 'other'),
+        'user_count': profile.get('user_count', 0),
+        'processes_children_data': profile.get('processes_children_data', False),
+        'cross_border_transfers': profile.get('cross_border_transfers', False),
+    }
+    
+    extended = profile.get('extended_data') or {}
+    answers['extended_data'] = extended
+    answers.update(extended)
+    
+    return answers
 
 
 def update_assessment_score(business_id: int, score: float) -> None:
@@ -238,7 +269,7 @@ def update_assessment_score(business_id: int, score: float) -> None:
         score: Compliance score (0-100)
     """
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     try:
@@ -268,7 +299,7 @@ def list_business_profiles() -> list:
         List of dictionaries with profile summaries
     """
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     try:
@@ -304,13 +335,129 @@ def list_business_profiles() -> list:
         conn.close()
 
 
+def _like_prefix(prefix: str) -> str:
+    """LIKE pattern matching a literal prefix (escape character: backslash)"""
+    escaped = prefix.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return escaped + '%'
+
+
+def list_business_profiles_page(limit: int = PROFILE_PAGE_SIZE,
+                                after: Optional[Tuple[str, int]] = None,
+                                name_prefix: Optional[str] = None,
+                                entity_type: Optional[str] = None,
+                                min_score: Optional[float] = None,
+                                max_score: Optional[float] = None) -> Dict[str, Any]:
+    """
+    One page of business profiles, newest first
+    
+    Uses keyset pagination on (created_at, id) and filters in SQL, backed
+    by the business_profiles indexes from init_db.ensure_assessment_schema(),
+    so each page costs the same with 100k+ profiles.
+    
+    Args:
+        limit: Page size
+        after: Cursor from the previous page's next_cursor
+        name_prefix: Case-insensitive business name prefix
+        entity_type: Exact entity type
+        min_score: Minimum stored assessment score (inclusive)
+        max_score: Maximum stored assessment score (inclusive)
+        
+    Returns:
+        Dictionary with profiles (list_business_profiles() format) and
+        next_cursor ((created_at, id), None on the last page)
+    """
+    
+    conditions = []
+    params = []
+    
+    if after is not None:
+        conditions.append("(created_at, id) < (?, ?)")
+        params.extend(after)
+    if name_prefix:
+        conditions.append("business_name LIKE ? ESCAPE '\\'")
+        params.append(_like_prefix(name_prefix))
+    if entity_type:
+        conditions.append("entity_type = ?")
+        params.append(entity_type)
+    if min_score is not None:
+        conditions.append("assessment_score >= ?")
+        params.append(min_score)
+    if max_score is not None:
+        conditions.append("assessment_score <= ?")
+        params.append(max_score)
+    
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
+    cursor = conn.cursor()
+    
+    try:
+        # One extra row tells whether another page follows
+        cursor.execute(f"""
+            SELECT 
+                id,
+                business_name,
+                entity_type,
+                user_count,
+                assessment_score,
+                created_at
+            FROM business_profiles
+            {where}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+        """, (*params, limit + 1))
+        rows = cursor.fetchall()
+        
+    except sqlite3.Error as e:
+        print(f"❌ Database error: {e}")
+        raise
+    finally:
+        conn.close()
+    
+    profiles = [
+        {
+            'id': row[0],
+            'business_name': row[1],
+            'entity_type': row[2],
+            'user_count': row[3],
+            'assessment_score': row[4],
+            'created_at': row[5]
+        }
+        for row in rows[:limit]
+    ]
+    
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = (profiles[-1]['created_at'], profiles[-1]['id'])
+    
+    return {'profiles': profiles, 'next_cursor': next_cursor}
+
+
+def list_entity_types() -> list:
+    """Distinct entity types of stored profiles (for filters)"""
+    
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
+    cursor = conn.cursor()
+    
+    try:
+        cursor.execute("""
+            SELECT DISTINCT entity_type
+            FROM business_profiles
+            WHERE entity_type IS NOT NULL
+            ORDER BY entity_type
+        """)
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        conn.close()
+
+
 def ensure_extended_data_support():
     """
     Add extended_data column to business_profiles if missing
     Also create business_profile_attributes table as fallback
     """
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     try:
@@ -0,0 +1,133 @@
+"""
+Requirement Catalog
+In-memory snapshot of the data requirement matching needs
+
+The catalog holds the active requirements (with penalty amounts), the
+penalty categories, the requirement IDs of each trigger group, the Third
+Schedule thresholds and the questionnaire definitions. Matching against
+it needs no database queries, which keeps long-running processes (the
+dashboard, the API service) off the database for every assessment.
+
+Usage:
+    from src.assessment.catalog import get_current_catalog, match_from_catalog
+
+    catalog = get_current_catalog()
+    applicable_ids = match_from_catalog(answers, catalog)
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+import sys
+from typing import Dict, Any, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.config import DB_PATH
+from src.assessment.questionnaire import QUESTIONS
+from src.assessment.reassessment import get_group_requirement_ids
+from src.assessment.requirement_matcher import get_third_schedule_thresholds, get_trigger_groups
+from src.extraction.versioning import get_latest_version_id
+from src.utils.metrics import MATCH_SECONDS
+
+# Seconds between checks for a new regulation version
+CATALOG_CHECK_SECONDS = 5
+
+_current = {'catalog': None, 'checked_at': 0.0}
+_current_lock = threading.Lock()
+
+
+def build_catalog(version: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Load the requirement catalog from the database
+
+    Args:
+        version: Regulation version id (default: latest)
+
+    Returns:
+        Dictionary with version, requirements, penalties, group_ids (trigger
+        group -> requirement IDs), thresholds (Third Schedule) and questions
+    """
+    if version is None:
+        version = get_latest_version_id()
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute("""
+        SELECT r.id, r.rule_number, r.obligation_type, r.is_sdf_specific, p.amount_inr
+        FROM requirements r
+        LEFT JOIN penalties p ON r.penalty_category_id = p.id
+        WHERE r.is_active = 1
+        ORDER BY r.id
+    """)
+    requirements = [
+        {
+            'id': row[0],
+            'rule_number': row[1],
+            'obligation_type': row[2],
+            'is_sdf_specific': bool(row[3]),
+            'penalty_amount': row[4] or 0
+        }
+        for row in cursor.fetchall()
+    ]
+
+    cursor.execute("SELECT category_name, amount_inr, section_reference FROM penalties ORDER BY amount_inr DESC")
+    penalties = [
+        {'category_name': row[0], 'amount_inr': row[1], 'section_reference': row[2]}
+        for row in cursor.fetchall()
+    ]
+
+    conn.close()
+
+    return {
+        'version': version,
+        'requirements': requirements,
+        'penalties': penalties,
+        'group_ids': get_group_requirement_ids(),
+        'thresholds': get_third_schedule_thresholds(),
+        'questions': QUESTIONS
+    }
+
+
+@MATCH_SECONDS.time(source='catalog')
+def match_from_catalog(answers: Dict[str, Any], catalog: Dict[str, Any]) -> List[int]:
+    """
+    Applicable requirement IDs for an answers dictionary
+
+    Same result as requirement_matcher.match_requirements(), without
+    database queries or console output.
+
+    Args:
+        answers: Answers dictionary (questionnaire or profile_to_answers format)
+        catalog: Result of build_catalog()
+
+    Returns:
+        Sorted list of requirement IDs
+    """
+    applicable_ids = set()
+    for group in get_trigger_groups(answers, catalog['thresholds']):
+        applicable_ids.update(catalog['group_ids'][group])
+    return sorted(applicable_ids)
+
+
+def get_current_catalog(max_age: float = CATALOG_CHECK_SECONDS) -> Dict[str, Any]:
+    """
+    Process-wide catalog, reloaded when a new regulation version appears
+
+    The version is re-checked at most every max_age seconds.
+    """
+    with _current_lock:
+        now = time.monotonic()
+        catalog = _current['catalog']
+        if catalog is not None and now - _current['checked_at'] < max_age:
+            return catalog
+
+        version = get_latest_version_id()
+        if catalog is None or catalog['version'] != version:
+            catalog = _current['catalog'] = build_catalog(version)
+        _current['checked_at'] = now
+        return catalog
@@ -10,15 +10,19 @@ import sqlite3
 from datetime import datetime
 from pathlib import Path
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from config.config import DB_PATH, FULL_COMPLIANCE_DEADLINE
+from src.assessment.records import Gap, GapAnalysis, add_exposure, new_exposure, shared_requirement
+from src.utils.metrics import GAP_ANALYSIS_SECONDS, instrument_connection
+from src.utils.tracing import span, traced
 
 
+@traced('gaps.priority_score')
 def calculate_priority_score(requirement: Dict[str, Any], penalty_amount: int) -> float:
     """
     Calculate priority score (0-100)
@@ -67,7 +71,7 @@ def calculate_priority_score(requirement: Dict[str, Any], penalty_amount: int) -
 
 def get_completed_requirements(business_id: int) -> List[int]:
     """Get IDs of completed requirements from database"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -83,21 +87,29 @@ def get_completed_requirements(business_id: int) -> List[int]:
     return completed
 
 
-def infer_completed_requirements(business_id: int, answers: Dict[str, Any]) -> List[int]:
+@traced('gaps.infer_completed')
+def infer_completed_requirements(business_id: Optional[int], answers: Dict[str, Any],
+                                 conn: Optional[sqlite3.Connection] = None) -> List[int]:
     """
     Infer which requirements are completed based on questionnaire answers
     Used for initial assessment when compliance_status table is empty
     
+    Only the answers are used, so this can run before the profile is saved.
+    
     Args:
-        business_id: Business profile ID
+        business_id: Business profile ID (unused; None before the profile exists)
         answers: Questionnaire answers dictionary
+        conn: Optional open connection, left open afterwards
         
     Returns:
         List of requirement IDs that are completed
     """
     completed = []
     
-    conn = sqlite3.connect(DB_PATH)
+    owns_connection = conn is None
+    if owns_connection:
+        with span('db.connect'):
+            conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     # Get extended data
@@ -109,33 +121,38 @@ def infer_completed_requirements(business_id: int, answers: Dict[str, Any]) -> L
     current_security = extended.get('current_security', answers.get('current_security', []))
     
     if all(measure in current_security for measure in security_measures):
-        cursor.execute("SELECT id FROM requirements WHERE rule_number LIKE 'Rule 6%'")
+        cursor.execute("SELECT id FROM requirements WHERE rule_number LIKE 'Rule 6%' AND is_active = 1")
         completed.extend([row[0] for row in cursor.fetchall()])
     
     # 2. BREACH NOTIFICATION (Rule 7) - 14 requirements  
     has_breach = extended.get('has_breach_plan', answers.get('has_breach_plan', False))
     if has_breach:
-        cursor.execute("SELECT id FROM requirements WHERE rule_number LIKE 'Rule 7%'")
+        cursor.execute("SELECT id FROM requirements WHERE rule_number LIKE 'Rule 7%' AND is_active = 1")
         completed.extend([row[0] for row in cursor.fetchall()])
     
     # 3. NOTICE (Rule 3) - 6 requirements
     has_consent = extended.get('has_consent_mechanism', answers.get('has_consent_mechanism', False))
     if has_consent:
-        cursor.execute("SELECT id FROM requirements WHERE rule_number LIKE 'Rule 3%'")
+        cursor.execute("SELECT id FROM requirements WHERE rule_number LIKE 'Rule 3%' AND is_active = 1")
         completed.extend([row[0] for row in cursor.fetchall()])
     
     # 4. RIGHTS/GRIEVANCE (Rule 14) - 7 requirements
     has_grievance = extended.get('has_grievance_system', answers.get('has_grievance_system', False))
     if has_grievance:
-        cursor.execute("SELECT id FROM requirements WHERE rule_number LIKE 'Rule 14%'")
+        cursor.execute("SELECT id FROM requirements WHERE rule_number LIKE 'Rule 14%' AND is_active = 1")
         completed.extend([row[0] for row in cursor.fetchall()])
     
-    conn.close()
+    if owns_connection:
+        conn.close()
     
     return completed
 
 
-def analyze_gaps(business_id: int, applicable_requirement_ids: List[int], answers: Dict[str, Any] = None) -> Dict[str, Any]:
+@traced('gaps.analyze')
+@GAP_ANALYSIS_SECONDS.time()
+def analyze_gaps(business_id: int, applicable_requirement_ids: List[int], answers: Dict[str, Any] = None,
+                 completed_ids: Optional[List[int]] = None,
+                 conn: Optional[sqlite3.Connection] = None) -> GapAnalysis:
     """
     Analyze compliance gaps and generate insights
     
@@ -143,132 +160,127 @@ def analyze_gaps(business_id: int, applicable_requirement_ids: List[int], answer
         business_id: Business profile ID
         applicable_requirement_ids: List of applicable requirement IDs
         answers: Optional - questionnaire answers to infer completion
+        completed_ids: Optional - completed requirement IDs already worked out
+                       (e.g. infer_completed_requirements() run concurrently);
+                       skips the inference / compliance_status lookup
+        conn: Optional open connection, left open afterwards
         
     Returns:
-        Dictionary with gap analysis
+        GapAnalysis (reads like the analysis dict: analysis['gaps'], ...),
+        whose gaps share one Requirement object per requirement; its
+        exposure aggregates (per obligation type and penalty category, all
+        requirements and open gaps) are built in the same pass as the gaps
     """
     
     if not applicable_requirement_ids:
-        return {
-            'total_requirements': 0,
-            'completed': 0,
-            'gaps': [],
-            'compliance_score': 0,
-            'max_penalty_exposure': 0,
-            'total_penalty_exposure': 0,
-            'priority_requirements': [],
-            'by_type': {},
-            'by_penalty_category': {}
-        }
-    
-    conn = sqlite3.connect(DB_PATH)
+        return GapAnalysis(0, 0, [], 0, 0, 0, new_exposure())
+    
+    owns_connection = conn is None
+    if owns_connection:
+        with span('db.connect'):
+            conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
-    # Get completed requirements
-    if answers:
-        # Infer from questionnaire answers
-        completed_ids = infer_completed_requirements(business_id, answers)
-    else:
-        # Fall back to database table
-        completed_ids = get_completed_requirements(business_id)
+    # Get completed requirements (unless the caller already has them)
+    if completed_ids is None:
+        if answers:
+            # Infer from questionnaire answers
+            completed_ids = infer_completed_requirements(business_id, answers, conn)
+        else:
+            # Fall back to database table
+            completed_ids = get_completed_requirements(business_id)
     
     # Get all applicable requirements with details
     placeholders = ','.join('?' * len(applicable_requirement_ids))
-    cursor.execute(f"""
-        SELECT 
-            r.id,
-            r.rule_number,
-            r.requirement_text,
-            r.obligation_type,
-            r.deadline,
-            r.is_sdf_specific,
-            p.id as penalty_id,
-            p.category_name,
-            p.amount_inr
-        FROM requirements r
-        LEFT JOIN penalties p ON r.penalty_category_id = p.id
-        WHERE r.id IN ({placeholders})
-        ORDER BY r.rule_number
-    """, applicable_requirement_ids)
-    
-    rows = cursor.fetchall()
-    conn.close()
+    with span('gaps.query', requirements=len(applicable_requirement_ids)):
+        cursor.execute(f"""
+            SELECT 
+                r.id,
+                r.rule_number,
+                r.requirement_text,
+                r.obligation_type,
+                r.deadline,
+                r.is_sdf_specific,
+                p.id as penalty_id,
+                p.category_name,
+                p.amount_inr
+            FROM requirements r
+            LEFT JOIN penalties p ON r.penalty_category_id = p.id
+            WHERE r.id IN ({placeholders})
+            ORDER BY r.rule_number
+        """, applicable_requirement_ids)
+        
+        rows = cursor.fetchall()
+    if owns_connection:
+        conn.close()
     
     gaps = []
-    by_type = {}
-    by_penalty_category = {}
-    all_penalties = []
-    
-    for row in rows:
-        req_id = row[0]
-        rule_number = row[1]
-        requirement_text = row[2]
-        obligation_type = row[3]
-        deadline = row[4]
-        is_sdf_specific = bool(row[5])
-        penalty_id = row[6]
-        penalty_category = row[7]
-        penalty_amount = row[8] or 0
-        
-        # Count by type
-        by_type[obligation_type] = by_type.get(obligation_type, 0) + 1
-        by_penalty_category[penalty_category] = by_penalty_category.get(penalty_category, 0) + 1
-        all_penalties.append(penalty_amount)
-        
-        # Check if completed
-        if req_id in completed_ids:
-            status = 'completed'
-        else:
-            status = 'not_started'
-        
-        # Only add to gaps if not completed
-        if status != 'completed':
-            # Calculate days remaining
-            if deadline:
-                deadline_dt = datetime.fromisoformat(deadline)
-                days_remaining = (deadline_dt - datetime.now()).days
-            else:
-                deadline_dt = FULL_COMPLIANCE_DEADLINE
-                days_remaining = (FULL_COMPLIANCE_DEADLINE - datetime.now()).days
+    exposure = new_exposure()
+    max_penalty = 0
+    total_penalty = 0
+    completed_set = set(completed_ids)
+    
+    with span('gaps.loop', rows=len(rows)):
+        for row in rows:
+            req_id = row[0]
+            rule_number = row[1]
+            requirement_text = row[2]
+            obligation_type = row[3]
+            deadline = row[4]
+            is_sdf_specific = bool(row[5])
+            penalty_id = row[6]
+            penalty_category = row[7]
+            penalty_amount = row[8] or 0
             
-            # Build requirement dict
-            requirement = {
-                'id': req_id,
-                'rule_number': rule_number,
-                'requirement_text': requirement_text,
-                'obligation_type': obligation_type,
-                'deadline': deadline,
-                'is_sdf_specific': is_sdf_specific,
-                'penalty_category_id': penalty_id,
-                'penalty_category': penalty_category,
-                'penalty_amount': penalty_amount,
-                'days_remaining': days_remaining,
-                'status': status
-            }
+            # Check if completed
+            if req_id in completed_set:
+                status = 'completed'
+            else:
+                status = 'not_started'
             
-            # Calculate priority score
-            priority = calculate_priority_score(requirement, penalty_amount)
-            requirement['priority_score'] = priority
+            # Counts, sums and maxima by type and penalty category (all and open)
+            add_exposure(exposure, obligation_type, penalty_category, penalty_amount, status != 'completed')
+            total_penalty += penalty_amount
+            if penalty_amount > max_penalty:
+                max_penalty = penalty_amount
             
-            gaps.append(requirement)
+            # Only add to gaps if not completed
+            if status != 'completed':
+                # Calculate days remaining
+                if deadline:
+                    deadline_dt = datetime.fromisoformat(deadline)
+                    days_remaining = (deadline_dt - datetime.now()).days
+                else:
+                    deadline_dt = FULL_COMPLIANCE_DEADLINE
+                    days_remaining = (FULL_COMPLIANCE_DEADLINE - datetime.now()).days
+                
+                # Shared requirement record (one per requirement per process)
+                requirement = shared_requirement(
+                    req_id, rule_number, requirement_text, obligation_type, deadline,
+                    is_sdf_specific, penalty_id, penalty_category, penalty_amount
+                )
+                
+                # Calculate priority score
+                priority = calculate_priority_score(requirement, penalty_amount)
+                
+                gaps.append(Gap(requirement, days_remaining, status, priority))
     
     # Sort gaps by priority (highest first)
-    gaps_sorted = sorted(gaps, key=lambda x: x['priority_score'], reverse=True)
+    with span('gaps.sort', gaps=len(gaps)):
+        gaps_sorted = sorted(gaps, key=lambda x: x['priority_score'], reverse=True)
     
     # Calculate compliance score
     compliance_score = (len(completed_ids) / len(applicable_requirement_ids)) * 100 if applicable_requirement_ids else 0
     
-    return {
-        'total_requirements': len(applicable_requirement_ids),
-        'completed': len(completed_ids),
-        'gaps': gaps_sorted,
-        'compliance_score': round(compliance_score, 1),
-        'max_penalty_exposure': max(all_penalties) if all_penalties else 0,
-        'total_penalty_exposure': sum(all_penalties),
-        'priority_requirements': gaps_sorted[:10],  # Top 10
-        'by_type': by_type,
-        'by_penalty_category': by_penalty_category
-    }
+    return GapAnalysis(
+        total_requirements=len(applicable_requirement_ids),
+        completed=len(completed_ids),
+        gaps=gaps_sorted,  # priority_requirements is the top 10 of these
+        compliance_score=round(compliance_score, 1),
+        max_penalty_exposure=max_penalty,
+        total_penalty_exposure=total_penalty,
+        exposure=exposure
+    )
 
 
 # For testing
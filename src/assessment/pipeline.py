@@ -0,0 +1,181 @@
+"""
+Assessment Pipeline
+Runs profile creation, requirement matching, gap analysis and the snapshot as a background job
+
+The dashboard submits an assessment to a small thread pool and keeps the
+job (a future plus a queue of progress events) in session state, so the
+page can show real per-stage progress and pick the job up again after a
+rerun.
+
+Usage:
+    from src.assessment.pipeline import submit_assessment, iter_progress
+
+    job = submit_assessment(answers)
+    for event in iter_progress(job):
+        print(f"{event['progress']:.0%} {event['message']}")
+    result = job['future'].result()   # {'business_id', 'answers', 'analysis'}
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.assessment.business_profiler import create_business_profile
+from src.assessment.requirement_matcher import match_requirements
+from src.assessment.gap_analyzer import analyze_gaps
+from src.assessment.snapshots import save_snapshot
+from src.utils.tracing import capture, is_enabled, scoped, span
+
+# (stage, message shown while it runs, progress reported when it starts)
+PIPELINE_STAGES = [
+    ('profile', "Creating business profile...", 0.25),
+    ('match', "Matching applicable requirements...", 0.5),
+    ('analyze', "Analyzing compliance gaps...", 0.75),
+    ('snapshot', "Saving assessment snapshot...", 0.9),
+]
+
+# Terminal event stages
+DONE = 'done'
+FAILED = 'failed'
+
+MAX_WORKERS = 2
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Shared thread pool for assessment jobs (created on first use)"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='assessment')
+        return _executor
+
+
+def run_assessment(answers: Dict[str, Any],
+                   progress: Optional[Callable[[str, float, str], None]] = None) -> Dict[str, Any]:
+    """
+    Create the profile, match requirements, analyze gaps and store a snapshot
+
+    Args:
+        answers: Answers dictionary from the questionnaire or dashboard form
+        progress: Optional callback(stage, progress, message), called before
+                  each stage and after the last one
+
+    Returns:
+        Dictionary with business_id, answers, analysis, timings
+        (seconds per stage) and trace (span records; empty unless
+        src.utils.tracing is enabled)
+    """
+    report = progress or (lambda stage, fraction, message: None)
+    stages = {stage: (message, fraction) for stage, message, fraction in PIPELINE_STAGES}
+    timings = {}
+
+    def begin(stage):
+        message, fraction = stages[stage]
+        report(stage, fraction, message)
+        return perf_counter()
+
+    with capture() as trace, span('assessment'):
+        start = begin('profile')
+        business_id = create_business_profile(answers)
+        timings['profile'] = perf_counter() - start
+
+        start = begin('match')
+        applicable_ids = match_requirements(answers)
+        timings['match'] = perf_counter() - start
+
+        start = begin('analyze')
+        analysis = analyze_gaps(business_id, applicable_ids, answers)
+        timings['analyze'] = perf_counter() - start
+
+        start = begin('snapshot')
+        save_snapshot(business_id, analysis)
+        timings['snapshot'] = perf_counter() - start
+
+    report(DONE, 1.0, "Assessment complete!")
+
+    return {
+        'business_id': business_id,
+        'answers': answers,
+        'analysis': analysis,
+        'timings': timings,
+        'trace': trace
+    }
+
+
+def submit_assessment(answers: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run an assessment in the background
+
+    Args:
+        answers: Answers dictionary
+
+    Returns:
+        Job dictionary with future (resolves to the run_assessment() result),
+        events (queue of progress events), progress and message (last event
+        seen by iter_progress)
+    """
+    events = queue.Queue()
+    # Trace the job if the submitting request is traced (the flag is per thread)
+    trace = is_enabled()
+
+    def publish(stage, fraction, message):
+        events.put({'stage': stage, 'progress': fraction, 'message': message})
+
+    def work():
+        try:
+            with scoped(trace):
+                return run_assessment(answers, publish)
+        except Exception as e:
+            publish(FAILED, 0.0, f"Assessment failed: {e}")
+            raise
+
+    return {
+        'future': get_executor().submit(work),
+        'events': events,
+        'progress': 0.0,
+        'message': "Queued..."
+    }
+
+
+def iter_progress(job: Dict[str, Any], timeout: float = 30.0) -> Iterator[Dict[str, Any]]:
+    """
+    Yield progress events as the job publishes them, until it finishes
+
+    Events are consumed from the queue, so a job can be resumed by a later
+    call (e.g. after a Streamlit rerun); job['progress'] and job['message']
+    keep the last state seen.
+
+    Args:
+        job: Job dictionary from submit_assessment()
+        timeout: Seconds to wait for the next event before re-checking the future
+
+    Yields:
+        {'stage', 'progress', 'message'} dictionaries
+    """
+    while True:
+        if job['future'].done() and job['events'].empty():
+            return
+        try:
+            event = job['events'].get(timeout=timeout)
+        except queue.Empty:
+            if job['future'].done():
+                return
+            continue
+
+        job['progress'] = event['progress']
+        job['message'] = event['message']
+        yield event
+
+        if event['stage'] in (DONE, FAILED):
+            return
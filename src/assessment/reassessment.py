@@ -0,0 +1,337 @@
+"""
+Targeted re-assessment after a regulation change
+
+Builds a reverse index from requirement ID to the business profiles it
+applies to (via the trigger groups in requirement_matcher.py) and re-runs
+gap analysis only for businesses touched by a set of changed requirements.
+
+Usage:
+    python src/assessment/reassessment.py --since-version 3
+    python src/assessment/reassessment.py --requirements 12,13,14
+
+    from src.assessment.reassessment import reassess_changed_requirements
+    report = reassess_changed_requirements(changed_ids)
+"""
+
+import argparse
+import sqlite3
+import json
+from pathlib import Path
+import sys
+from typing import Dict, Any, Iterable, List, Set
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.config import DB_PATH
+from src.assessment.business_profiler import profile_to_answers
+from src.assessment.gap_analyzer import analyze_gaps
+from src.assessment.snapshots import save_snapshots
+from src.assessment.requirement_matcher import (
+    TRIGGER_GROUP_CONDITIONS, get_third_schedule_thresholds, get_trigger_groups
+)
+from src.extraction.versioning import get_changed_requirement_ids
+
+
+def load_profiles() -> List[Dict[str, Any]]:
+    """
+    Load every business profile (with extended data) in one query
+
+    Returns:
+        List of profile dictionaries in get_business_profile() format
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    cursor.execute("PRAGMA table_info(business_profiles)")
+    has_extended = 'extended_data' in [col[1] for col in cursor.fetchall()]
+
+    cursor.execute(f"""
+        SELECT
+            id,
+            business_name,
+            entity_type,
+            user_count,
+            processes_children_data,
+            cross_border_transfers,
+            assessment_score,
+            {'extended_data' if has_extended else 'NULL'}
+        FROM business_profiles
+        ORDER BY id
+    """)
+    rows = cursor.fetchall()
+    conn.close()
+
+    return [
+        {
+            'id': row[0],
+            'business_name': row[1],
+            'entity_type': row[2],
+            'user_count': row[3],
+            'processes_children_data': bool(row[4]),
+            'cross_border_transfers': bool(row[5]),
+            'assessment_score': row[6],
+            'extended_data': json.loads(row[7]) if row[7] else {}
+        }
+        for row in rows
+    ]
+
+
+def get_group_requirement_ids() -> Dict[str, List[int]]:
+    """
+    Active requirement IDs for each trigger group
+
+    Returns:
+        Dictionary mapping group name to requirement IDs
+    """
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    group_ids = {}
+    for group, condition in TRIGGER_GROUP_CONDITIONS.items():
+        cursor.execute(f"SELECT id FROM requirements WHERE ({condition}) AND is_active = 1")
+        group_ids[group] = [row[0] for row in cursor.fetchall()]
+
+    conn.close()
+    return group_ids
+
+
+def get_requirement_groups(requirement_ids: Iterable[int]) -> Dict[int, Set[str]]:
+    """
+    Trigger groups of specific requirements, including deactivated ones
+
+    A removed requirement still affects the businesses it used to apply to.
+
+    Args:
+        requirement_ids: Requirement IDs
+
+    Returns:
+        Dictionary mapping requirement ID to its group names
+    """
+    requirement_ids = list(requirement_ids)
+    groups = {req_id: set() for req_id in requirement_ids}
+    if not requirement_ids:
+        return groups
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    placeholders = ','.join('?' * len(requirement_ids))
+    for group, condition in TRIGGER_GROUP_CONDITIONS.items():
+        cursor.execute(f"""
+            SELECT id FROM requirements
+            WHERE id IN ({placeholders}) AND ({condition})
+        """, requirement_ids)
+        for row in cursor.fetchall():
+            groups[row[0]].add(group)
+
+    conn.close()
+    return groups
+
+
+def build_reverse_index(profiles: List[Dict[str, Any]] = None) -> Dict[int, Set[int]]:
+    """
+    Map each active requirement ID to the business profiles it applies to
+
+    Args:
+        profiles: Optional result of load_profiles()
+
+    Returns:
+        Dictionary mapping requirement ID to a set of business IDs
+    """
+    if profiles is None:
+        profiles = load_profiles()
+
+    thresholds = get_third_schedule_thresholds()
+    group_ids = get_group_requirement_ids()
+
+    # Businesses per group first, then fan out to requirements
+    group_businesses = {group: set() for group in group_ids}
+    for profile in profiles:
+        for group in get_trigger_groups(profile_to_answers(profile), thresholds):
+            group_businesses[group].add(profile['id'])
+
+    index = {}
+    for group, ids in group_ids.items():
+        for req_id in ids:
+            index.setdefault(req_id, set()).update(group_businesses[group])
+
+    return index
+
+
+def find_affected_businesses(changed_ids: Iterable[int], profiles: List[Dict[str, Any]] = None) -> Set[int]:
+    """
+    Business profiles whose assessment depends on any of the changed requirements
+
+    A business is affected if a changed requirement belongs to one of its
+    trigger groups, or if it has a compliance_status row for one.
+
+    Args:
+        changed_ids: Added, changed or removed requirement IDs
+        profiles: Optional result of load_profiles()
+
+    Returns:
+        Set of business IDs
+    """
+    changed_ids = list(changed_ids)
+    if not changed_ids:
+        return set()
+
+    if profiles is None:
+        profiles = load_profiles()
+
+    changed_groups = set()
+    for groups in get_requirement_groups(changed_ids).values():
+        changed_groups.update(groups)
+
+    affected = set()
+    if changed_groups:
+        thresholds = get_third_schedule_thresholds()
+        for profile in profiles:
+            if get_trigger_groups(profile_to_answers(profile), thresholds) & changed_groups:
+                affected.add(profile['id'])
+
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+
+    placeholders = ','.join('?' * len(changed_ids))
+    cursor.execute(f"""
+        SELECT DISTINCT business_profile_id
+        FROM compliance_status
+        WHERE requirement_id IN ({placeholders})
+    """, changed_ids)
+    affected.update(row[0] for row in cursor.fetchall())
+
+    conn.close()
+    return affected
+
+
+def reassess_businesses(business_ids: Iterable[int], profiles: List[Dict[str, Any]] = None,
+                        update_scores: bool = True) -> List[Dict[str, Any]]:
+    """
+    Re-run gap analysis for specific businesses
+
+    Args:
+        business_ids: Business profile IDs to reassess
+        profiles: Optional result of load_profiles()
+        update_scores: Store snapshots and new scores (business_profiles.assessment_score)
+
+    Returns:
+        List of dictionaries with business_id, business_name, old_score,
+        new_score, delta and score_changed
+    """
+    business_ids = set(business_ids)
+    if not business_ids:
+        return []
+
+    if profiles is None:
+        profiles = load_profiles()
+
+    thresholds = get_third_schedule_thresholds()
+    group_ids = get_group_requirement_ids()
+
+    results = []
+    analyses = []
+    for profile in profiles:
+        if profile['id'] not in business_ids:
+            continue
+
+        answers = profile_to_answers(profile)
+        applicable_ids = set()
+        for group in get_trigger_groups(answers, thresholds):
+            applicable_ids.update(group_ids[group])
+
+        analysis = analyze_gaps(profile['id'], sorted(applicable_ids), answers)
+        analyses.append((profile['id'], analysis))
+
+        old_score = profile['assessment_score']
+        new_score = analysis['compliance_score']
+        results.append({
+            'business_id': profile['id'],
+            'business_name': profile['business_name'],
+            'old_score': old_score,
+            'new_score': new_score,
+            'delta': round(new_score - (old_score or 0), 1),
+            'score_changed': old_score is None or round(old_score, 1) != new_score
+        })
+
+    if update_scores:
+        # Snapshots also store the new assessment_score
+        save_snapshots(analyses)
+
+    return results
+
+
+def reassess_changed_requirements(changed_ids: Iterable[int], update_scores: bool = True) -> Dict[str, Any]:
+    """
+    Reassess only the businesses affected by a set of changed requirements
+
+    Args:
+        changed_ids: Added, changed or removed requirement IDs
+        update_scores: Store snapshots and new scores (business_profiles.assessment_score)
+
+    Returns:
+        Dictionary with changed_requirements, total_businesses,
+        affected_businesses, results and score_changes
+    """
+    changed_ids = set(changed_ids)
+    profiles = load_profiles()
+    affected = find_affected_businesses(changed_ids, profiles)
+    results = reassess_businesses(affected, profiles, update_scores)
+
+    return {
+        'changed_requirements': len(changed_ids),
+        'total_businesses': len(profiles),
+        'affected_businesses': len(affected),
+        'results': results,
+        'score_changes': [result for result in results if result['score_changed']]
+    }
+
+
+def print_reassessment_report(report: Dict[str, Any]) -> None:
+    """Print a console summary of reassess_changed_requirements()"""
+    print(f"Changed requirements: {report['changed_requirements']}")
+    print(f"Affected businesses:  {report['affected_businesses']} of {report['total_businesses']}")
+    print(f"Score changes:        {len(report['score_changes'])}")
+
+    for result in report['score_changes']:
+        old_score = f"{result['old_score']:.1f}%" if result['old_score'] is not None else "n/a"
+        print(f"  • {result['business_name'] or 'Business'} (ID {result['business_id']}): "
+              f"{old_score} → {result['new_score']:.1f}% ({result['delta']:+.1f})")
+
+
+def on_requirements_changed(changed_ids: Set[int], version_id: int) -> None:
+    """Change listener for src.extraction.versioning (register_change_listener)"""
+    print()
+    print(f"Re-assessing businesses affected by regulation version {version_id}...")
+    print_reassessment_report(reassess_changed_requirements(changed_ids))
+
+
+def main():
+    """Reassess businesses for changed requirements"""
+    parser = argparse.ArgumentParser(description="Re-assess businesses affected by requirement changes")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument('--since-version', type=int, help="Requirements changed after this regulation version")
+    group.add_argument('--requirements', help="Comma-separated requirement IDs")
+    parser.add_argument('--dry-run', action='store_true', help="Report without storing new scores")
+    args = parser.parse_args()
+
+    if args.requirements:
+        changed_ids = {int(req_id) for req_id in args.requirements.split(',') if req_id.strip()}
+    else:
+        changed_ids = get_changed_requirement_ids(args.since_version)
+
+    print("="*70)
+    print("TARGETED RE-ASSESSMENT")
+    print("="*70)
+    print()
+
+    report = reassess_changed_requirements(changed_ids, update_scores=not args.dry_run)
+    print_reassessment_report(report)
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,372 @@
+"""
+Assessment Records
+Slotted Requirement, Gap and GapAnalysis records returned by gap_analyzer
+
+Gap analyses used to be plain dicts, with every gap carrying its own copy
+of the requirement row (rule number, full requirement text, penalty) under
+12 string keys, for every business, in every cache entry and session. The
+records below keep the same keys readable dict-style (they are read-only
+Mappings, so analysis['gaps'], gap['rule_number'], gap.get(...), dict(gap)
+and pandas rows all work), but:
+
+    Requirement  one object per requirement, shared process-wide through
+                 shared_requirement(); unpickling (e.g. st.cache_data hits)
+                 resolves to the same shared object
+    Gap          the per-business part only (days_remaining, status,
+                 priority_score) plus a reference to its Requirement
+    GapAnalysis  totals, gaps and breakdowns; priority_requirements is the
+                 first 10 gaps rather than a second list
+
+GapAnalysis.exposure holds counts, penalty sums and maxima per obligation
+type and per penalty category, over all applicable requirements and over
+the open gaps, built in analyze_gaps()'s single pass over the rows
+(by_type and by_penalty_category are the counts from it). Use
+get_exposure() to read it from any analysis, including plain dicts.
+
+Use to_dict() (or json_default with json.dumps) for JSON output.
+
+Usage:
+    from src.assessment.records import json_default
+
+    analysis = analyze_gaps(business_id, applicable_ids, answers)
+    analysis['gaps'][0]['requirement_text']     # dict-style, as before
+    analysis.gaps[0].rule_number                # attribute access
+    get_exposure(analysis)['by_type']['notice'] # {'count', 'open_exposure', ...}
+    json.dumps(analysis, default=json_default)
+
+    python src/assessment/records.py     # memory per cached analysis, dicts vs records
+"""
+
+import sys
+import threading
+import weakref
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+REQUIREMENT_FIELDS = ('id', 'rule_number', 'requirement_text', 'obligation_type', 'deadline',
+                      'is_sdf_specific', 'penalty_category_id', 'penalty_category', 'penalty_amount')
+
+GAP_FIELDS = ('days_remaining', 'status', 'priority_score')
+
+# Keys of a gap, in the order the dict version had them
+GAP_KEYS = REQUIREMENT_FIELDS + GAP_FIELDS
+
+ANALYSIS_FIELDS = ('total_requirements', 'completed', 'gaps', 'compliance_score', 'max_penalty_exposure',
+                   'total_penalty_exposure', 'exposure')
+
+ANALYSIS_KEYS = ANALYSIS_FIELDS[:6] + ('priority_requirements', 'by_type', 'by_penalty_category', 'exposure')
+
+# Exposure groups and the requirement field each one is keyed by
+EXPOSURE_GROUPS = {'by_type': 'obligation_type', 'by_penalty_category': 'penalty_category'}
+
+# Gaps listed in priority_requirements
+TOP_PRIORITIES = 10
+
+_REQUIREMENT_KEYS = frozenset(REQUIREMENT_FIELDS)
+_GAP_OWN_KEYS = frozenset(GAP_FIELDS)
+_ANALYSIS_KEYS = frozenset(ANALYSIS_KEYS)
+
+_registry = weakref.WeakValueDictionary()
+_registry_lock = threading.Lock()
+
+
+class Requirement(Mapping):
+    """One requirement row, shared by every gap that references it (never mutate)"""
+    __slots__ = REQUIREMENT_FIELDS + ('__weakref__',)
+
+    def __init__(self, id: int, rule_number: str, requirement_text: str, obligation_type: str,
+                 deadline: Optional[str], is_sdf_specific: bool, penalty_category_id: Optional[int],
+                 penalty_category: Optional[str], penalty_amount: int):
+        self.id = id
+        self.rule_number = rule_number
+        self.requirement_text = requirement_text
+        self.obligation_type = obligation_type
+        self.deadline = deadline
+        self.is_sdf_specific = is_sdf_specific
+        self.penalty_category_id = penalty_category_id
+        self.penalty_category = penalty_category
+        self.penalty_amount = penalty_amount
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _REQUIREMENT_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(REQUIREMENT_FIELDS)
+
+    def __len__(self) -> int:
+        return len(REQUIREMENT_FIELDS)
+
+    def __reduce__(self):
+        return shared_requirement, self.values_tuple()
+
+    def __repr__(self) -> str:
+        return f"Requirement(id={self.id}, rule_number={self.rule_number!r})"
+
+    def values_tuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in REQUIREMENT_FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in REQUIREMENT_FIELDS}
+
+
+def shared_requirement(*values) -> Requirement:
+    """
+    The process-wide Requirement with these field values (created if needed)
+
+    Requirements are looked up by id; a changed row (e.g. a new regulation
+    version) replaces the shared object, while analyses holding the old one
+    keep it.
+
+    Args:
+        *values: Field values in REQUIREMENT_FIELDS order
+    """
+    with _registry_lock:
+        existing = _registry.get(values[0])
+        if existing is not None and existing.values_tuple() == values:
+            return existing
+        requirement = Requirement(*values)
+        _registry[values[0]] = requirement
+        return requirement
+
+
+def new_exposure() -> Dict[str, Dict[Any, Dict[str, int]]]:
+    """Empty exposure aggregates, one dict per group in EXPOSURE_GROUPS"""
+    return {group: {} for group in EXPOSURE_GROUPS}
+
+
+def add_exposure(exposure: Dict[str, Dict[Any, Dict[str, int]]], obligation_type: str,
+                 penalty_category: Optional[str], penalty_amount: int, is_open: bool) -> None:
+    """
+    Count one applicable requirement into the exposure aggregates
+
+    Each obligation type and penalty category gets count, total_exposure
+    and max_penalty over all its requirements, and open_count,
+    open_exposure and open_max_penalty over the open gaps only.
+    """
+    for group, key in (('by_type', obligation_type), ('by_penalty_category', penalty_category)):
+        totals = exposure[group].get(key)
+        if totals is None:
+            totals = exposure[group][key] = {
+                'count': 0, 'total_exposure': 0, 'max_penalty': 0,
+                'open_count': 0, 'open_exposure': 0, 'open_max_penalty': 0
+            }
+        totals['count'] += 1
+        totals['total_exposure'] += penalty_amount
+        if penalty_amount > totals['max_penalty']:
+            totals['max_penalty'] = penalty_amount
+        if is_open:
+            totals['open_count'] += 1
+            totals['open_exposure'] += penalty_amount
+            if penalty_amount > totals['open_max_penalty']:
+                totals['open_max_penalty'] = penalty_amount
+
+
+def get_exposure(analysis: Mapping) -> Dict[str, Dict[Any, Dict[str, int]]]:
+    """
+    Exposure aggregates of an analysis
+
+    Analyses from analyze_gaps() carry them; for a plain-dict analysis
+    without 'exposure' (e.g. an older cached or hand-built one) they are
+    built from its gaps, so count and total_exposure then cover the gaps
+    only.
+    """
+    exposure = analysis.get('exposure')
+    if exposure is not None:
+        return exposure
+
+    exposure = new_exposure()
+    for gap in analysis['gaps']:
+        add_exposure(exposure, gap['obligation_type'], gap['penalty_category'], gap['penalty_amount'] or 0,
+                     gap.get('status') != 'completed')
+    return exposure
+
+
+class Gap(Mapping):
+    """An unmet requirement for one business: its Requirement plus status and priority"""
+    __slots__ = ('requirement',) + GAP_FIELDS
+
+    def __init__(self, requirement: Requirement, days_remaining: int, status: str, priority_score: float):
+        self.requirement = requirement
+        self.days_remaining = days_remaining
+        self.status = status
+        self.priority_score = priority_score
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _GAP_OWN_KEYS:
+            return getattr(self, key)
+        if key in _REQUIREMENT_KEYS:
+            return getattr(self.requirement, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _GAP_OWN_KEYS:
+            raise KeyError(f"Can't set {key!r} on a gap (requirement fields are shared)")
+        setattr(self, key, value)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names that aren't slots, e.g. gap.rule_number
+        if name in _REQUIREMENT_KEYS:
+            return getattr(self.requirement, name)
+        raise AttributeError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(GAP_KEYS)
+
+    def __len__(self) -> int:
+        return len(GAP_KEYS)
+
+    def __reduce__(self):
+        return Gap, (self.requirement, self.days_remaining, self.status, self.priority_score)
+
+    def __repr__(self) -> str:
+        return (f"Gap(rule_number={self.requirement.rule_number!r}, status={self.status!r}, "
+                f"priority_score={self.priority_score})")
+
+    def to_dict(self) -> Dict[str, Any]:
+        row = self.requirement.to_dict()
+        row.update((name, getattr(self, name)) for name in GAP_FIELDS)
+        return row
+
+
+class GapAnalysis(Mapping):
+    """Result of analyze_gaps(): totals, gaps (highest priority first) and breakdowns"""
+    __slots__ = ANALYSIS_FIELDS
+
+    def __init__(self, total_requirements: int, completed: int, gaps: List[Gap], compliance_score: float,
+                 max_penalty_exposure: int, total_penalty_exposure: int,
+                 exposure: Dict[str, Dict[Any, Dict[str, int]]]):
+        self.total_requirements = total_requirements
+        self.completed = completed
+        self.gaps = gaps
+        self.compliance_score = compliance_score
+        self.max_penalty_exposure = max_penalty_exposure
+        self.total_penalty_exposure = total_penalty_exposure
+        self.exposure = exposure
+
+    @property
+    def priority_requirements(self) -> List[Gap]:
+        return self.gaps[:TOP_PRIORITIES]
+
+    @property
+    def by_type(self) -> Dict[str, int]:
+        return {key: totals['count'] for key, totals in self.exposure['by_type'].items()}
+
+    @property
+    def by_penalty_category(self) -> Dict[Optional[str], int]:
+        return {key: totals['count'] for key, totals in self.exposure['by_penalty_category'].items()}
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _ANALYSIS_KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(ANALYSIS_KEYS)
+
+    def __len__(self) -> int:
+        return len(ANALYSIS_KEYS)
+
+    def __reduce__(self):
+        return GapAnalysis, tuple(getattr(self, name) for name in ANALYSIS_FIELDS)
+
+    def __repr__(self) -> str:
+        return (f"GapAnalysis(compliance_score={self.compliance_score}, "
+                f"total_requirements={self.total_requirements}, gaps={len(self.gaps)})")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The plain-dict form analyze_gaps() used to return"""
+        gaps = [gap.to_dict() for gap in self.gaps]
+        return {
+            'total_requirements': self.total_requirements,
+            'completed': self.completed,
+            'gaps': gaps,
+            'compliance_score': self.compliance_score,
+            'max_penalty_exposure': self.max_penalty_exposure,
+            'total_penalty_exposure': self.total_penalty_exposure,
+            'priority_requirements': gaps[:TOP_PRIORITIES],
+            'by_type': self.by_type,
+            'by_penalty_category': self.by_penalty_category,
+            'exposure': {
+                group: {key: dict(totals) for key, totals in rows.items()}
+                for group, rows in self.exposure.items()
+            }
+        }
+
+
+def json_default(value: Any) -> Any:
+    """json.dumps default= hook: records as dicts, anything else as str()"""
+    to_dict = getattr(value, 'to_dict', None)
+    if callable(to_dict):
+        return to_dict()
+    return str(value)
+
+
+def measure_cached_analyses(analysis: GapAnalysis, copies: int = 200) -> Dict[str, Dict[str, float]]:
+    """
+    Memory per cached analysis, as plain dicts vs records
+
+    Each copy is a pickle round trip, which is what st.cache_data does on
+    every hit (and what a fresh analyze_gaps() call costs: new strings per
+    row), so retained size / copies is the cost of one more cached analysis.
+
+    Returns:
+        {'dicts': {...}, 'records': {...}} with kb_per_analysis and pickle_kb
+    """
+    import pickle
+    import tracemalloc
+
+    results = {}
+    for label, value in (('dicts', analysis.to_dict()), ('records', analysis)):
+        payload = pickle.dumps(value)
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        kept = [pickle.loads(payload) for _ in range(copies)]
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        results[label] = {
+            'kb_per_analysis': round(retained / copies / 1024, 1),
+            'pickle_kb': round(len(payload) / 1024, 1)
+        }
+        del kept
+    return results
+
+
+# For testing
+if __name__ == "__main__":
+    from src.assessment.gap_analyzer import analyze_gaps
+    from src.assessment.requirement_matcher import match_requirements
+    import contextlib
+    import io
+
+    print("=" * 70)
+    print("ASSESSMENT RECORDS - MEMORY PER CACHED ANALYSIS")
+    print("=" * 70)
+    print()
+
+    profiles = {
+        'Small startup': {'entity_type': 'other', 'user_count': 5_000, 'processes_children_data': False,
+                          'cross_border_transfers': False},
+        'Large e-commerce': {'entity_type': 'ecommerce', 'user_count': 25_000_000, 'processes_children_data': True,
+                             'cross_border_transfers': True, 'extended_data': {'has_processors': True}},
+    }
+
+    print(f"  {'Profile':20s} {'Gaps':>5s} {'Dicts KB':>9s} {'Records KB':>11s} {'Saved':>6s} "
+          f"{'Pickle KB (dicts/records)':>26s}")
+    for name, answers in profiles.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            applicable = match_requirements(answers)
+        analysis = analyze_gaps(0, applicable, answers)
+        sizes = measure_cached_analyses(analysis)
+        dicts, records = sizes['dicts'], sizes['records']
+        saved = 1 - records['kb_per_analysis'] / dicts['kb_per_analysis'] if dicts['kb_per_analysis'] else 0
+        print(f"  {name:20s} {len(analysis.gaps):5d} {dicts['kb_per_analysis']:9.1f} "
+              f"{records['kb_per_analysis']:11.1f} {saved:6.0%} "
+              f"{dicts['pickle_kb']:>15.1f} / {records['pickle_kb']:.1f}")
+    print()
@@ -5,7 +5,6 @@ Usage:
     from src.assessment.report_generator import print_console_report, export_to_excel
 """
 
-import pandas as pd
 from pathlib import Path
 import sys
 from typing import Dict, Any
@@ -14,6 +13,10 @@ from typing import Dict, Any
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.assessment.records import get_exposure
+from src.utils.metrics import EXCEL_EXPORT_BYTES, EXCEL_EXPORT_SECONDS
+from src.utils.tracing import span, traced
+
 
 def print_console_report(business_profile: Dict[str, Any], analysis: Dict[str, Any]):
     """
@@ -91,6 +94,19 @@ def print_console_report(business_profile: Dict[str, Any], analysis: Dict[str, A
     print("="*70)
 
 
+def exposure_columns(totals: Dict[str, int]) -> Dict[str, Any]:
+    """Excel columns for one row of analysis['exposure'] (a type or penalty category)"""
+    return {
+        'Count': totals['count'],
+        'Open Gaps': totals['open_count'],
+        'Open Exposure (Crore)': round(totals['open_exposure'] / 10_000_000),
+        'Max Open Penalty (Crore)': round(totals['open_max_penalty'] / 10_000_000),
+        'Total Exposure (Crore)': round(totals['total_exposure'] / 10_000_000)
+    }
+
+
+@traced('excel.export')
+@EXCEL_EXPORT_SECONDS.time()
 def export_to_excel(business_profile: Dict[str, Any], analysis: Dict[str, Any], filepath: str):
     """
     Export assessment results to Excel
@@ -100,6 +116,8 @@ def export_to_excel(business_profile: Dict[str, Any], analysis: Dict[str, Any],
         analysis: Gap analysis dictionary
         filepath: Output file path
     """
+    # Imported here so console reports (and the dashboard) don't pay for pandas
+    import pandas as pd
     
     # Sheet 1: Summary
     summary_data = {
@@ -165,22 +183,25 @@ def export_to_excel(business_profile: Dict[str, Any], analysis: Dict[str, Any],
     else:
         df_gaps = pd.DataFrame()
     
+    # Sheets 3 and 4: exposure aggregates from analyze_gaps
+    exposure = get_exposure(analysis)
+    
     # Sheet 3: By Obligation Type
     by_type_data = [
-        {'Obligation Type': t.title(), 'Count': count}
-        for t, count in sorted(analysis['by_type'].items(), key=lambda x: x[1], reverse=True)
+        {'Obligation Type': t.title(), **exposure_columns(totals)}
+        for t, totals in sorted(exposure['by_type'].items(), key=lambda x: x[1]['count'], reverse=True)
     ]
     df_by_type = pd.DataFrame(by_type_data)
     
     # Sheet 4: By Penalty Category
     by_penalty_data = [
-        {'Penalty Category': cat, 'Count': count}
-        for cat, count in sorted(analysis['by_penalty_category'].items(), key=lambda x: x[1], reverse=True)
+        {'Penalty Category': cat, **exposure_columns(totals)}
+        for cat, totals in sorted(exposure['by_penalty_category'].items(), key=lambda x: x[1]['count'], reverse=True)
     ]
     df_by_penalty = pd.DataFrame(by_penalty_data)
     
     # Write to Excel with formatting
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+    with span('excel.write', rows=len(gaps_data)), pd.ExcelWriter(filepath, engine='openpyxl') as writer:
         df_summary.to_excel(writer, sheet_name='Summary', index=False)
         
         if not df_gaps.empty:
@@ -204,6 +225,8 @@ def export_to_excel(business_profile: Dict[str, Any], analysis: Dict[str, Any],
                 adjusted_width = min(max_length + 2, 100)
                 worksheet.column_dimensions[column_letter].width = adjusted_width
     
+    EXCEL_EXPORT_BYTES.observe(Path(filepath).stat().st_size)
+    
     print(f"\n✓ Exported to: {filepath}")
 
 
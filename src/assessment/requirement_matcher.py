@@ -9,15 +9,28 @@ Usage:
 import sqlite3
 from pathlib import Path
 import sys
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Set
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from config.config import DB_PATH
+from src.utils.metrics import MATCH_SECONDS, instrument_connection
+from src.utils.tracing import span, traced
 
+# Requirement selection for each trigger group (active rows are filtered
+# separately so reassessment can classify removed requirements too)
+TRIGGER_GROUP_CONDITIONS = {
+    'universal': "obligation_type IN ('notice', 'security', 'breach', 'rights') AND is_sdf_specific = 0",
+    'third_schedule': "obligation_type = 'retention' OR rule_number LIKE 'Rule 8%'",
+    'children': "obligation_type = 'children' AND rule_number NOT LIKE 'Rule 9%'",
+    'cross_border': "rule_number LIKE 'Rule 15%'",
+    'sdf': "is_sdf_specific = 1 OR obligation_type = 'sdf' OR rule_number LIKE 'Rule 13%'",
+}
 
+
+@traced('match.universal')
 def get_universal_requirements() -> List[int]:
     """
     Get requirements that apply to ALL businesses
@@ -25,15 +38,16 @@ def get_universal_requirements() -> List[int]:
     Returns:
         List of requirement IDs
     """
-    conn = sqlite3.connect(DB_PATH)
+    with span('db.connect'):
+        conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     # Universal types: notice, security, breach, rights
     # Rule 9 is now correctly tagged as 'notice' in database
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT id FROM requirements
-        WHERE obligation_type IN ('notice', 'security', 'breach', 'rights')
-          AND is_sdf_specific = 0
+        WHERE ({TRIGGER_GROUP_CONDITIONS['universal']})
+          AND is_active = 1
     """)
     
     ids = [row[0] for row in cursor.fetchall()]
@@ -42,6 +56,7 @@ def get_universal_requirements() -> List[int]:
     return ids
 
 
+@traced('match.third_schedule')
 def get_third_schedule_requirements(entity_class: str) -> List[int]:
     """
     Get Third Schedule retention requirements
@@ -52,14 +67,15 @@ def get_third_schedule_requirements(entity_class: str) -> List[int]:
     Returns:
         List of requirement IDs
     """
-    conn = sqlite3.connect(DB_PATH)
+    with span('db.connect'):
+        conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     # Get retention requirements (Rule 8)
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT id FROM requirements
-        WHERE obligation_type = 'retention'
-          OR rule_number LIKE 'Rule 8%'
+        WHERE ({TRIGGER_GROUP_CONDITIONS['third_schedule']})
+          AND is_active = 1
     """)
     
     ids = [row[0] for row in cursor.fetchall()]
@@ -68,6 +84,7 @@ def get_third_schedule_requirements(entity_class: str) -> List[int]:
     return ids
 
 
+@traced('match.children')
 def get_children_requirements() -> List[int]:
     """
     Get children's data requirements (Rules 10, 11, 12)
@@ -75,13 +92,14 @@ def get_children_requirements() -> List[int]:
     Returns:
         List of requirement IDs
     """
-    conn = sqlite3.connect(DB_PATH)
+    with span('db.connect'):
+        conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT id FROM requirements
-        WHERE obligation_type = 'children'
-           AND rule_number NOT LIKE 'Rule 9%'
+        WHERE ({TRIGGER_GROUP_CONDITIONS['children']})
+          AND is_active = 1
     """)
     
     ids = [row[0] for row in cursor.fetchall()]
@@ -90,6 +108,7 @@ def get_children_requirements() -> List[int]:
     return ids
 
 
+@traced('match.cross_border')
 def get_cross_border_requirements() -> List[int]:
     """
     Get cross-border transfer requirements (Rule 15)
@@ -97,12 +116,14 @@ def get_cross_border_requirements() -> List[int]:
     Returns:
         List of requirement IDs
     """
-    conn = sqlite3.connect(DB_PATH)
+    with span('db.connect'):
+        conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT id FROM requirements
-        WHERE rule_number LIKE 'Rule 15%'
+        WHERE ({TRIGGER_GROUP_CONDITIONS['cross_border']})
+          AND is_active = 1
     """)
     
     ids = [row[0] for row in cursor.fetchall()]
@@ -111,6 +132,7 @@ def get_cross_border_requirements() -> List[int]:
     return ids
 
 
+@traced('match.sdf')
 def get_sdf_requirements() -> List[int]:
     """
     Get Significant Data Fiduciary requirements (Rule 13)
@@ -118,14 +140,14 @@ def get_sdf_requirements() -> List[int]:
     Returns:
         List of requirement IDs
     """
-    conn = sqlite3.connect(DB_PATH)
+    with span('db.connect'):
+        conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
-    cursor.execute("""
+    cursor.execute(f"""
         SELECT id FROM requirements
-        WHERE is_sdf_specific = 1
-           OR obligation_type = 'sdf'
-           OR rule_number LIKE 'Rule 13%'
+        WHERE ({TRIGGER_GROUP_CONDITIONS['sdf']})
+          AND is_active = 1
     """)
     
     ids = [row[0] for row in cursor.fetchall()]
@@ -134,6 +156,7 @@ def get_sdf_requirements() -> List[int]:
     return ids
 
 
+@traced('match.third_schedule_threshold')
 def check_third_schedule_threshold(entity_type: str, user_count: int) -> bool:
     """
     Check if business exceeds Third Schedule threshold
@@ -145,7 +168,8 @@ def check_third_schedule_threshold(entity_type: str, user_count: int) -> bool:
     Returns:
         True if Third Schedule applies
     """
-    conn = sqlite3.connect(DB_PATH)
+    with span('db.connect'):
+        conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     # Map entity types to schedule entity classes
@@ -179,6 +203,66 @@ def check_third_schedule_threshold(entity_type: str, user_count: int) -> bool:
     return user_count >= threshold
 
 
+def get_third_schedule_thresholds() -> Dict[str, int]:
+    """
+    Load all Third Schedule user thresholds in one query
+    
+    Returns:
+        Dictionary mapping entity class to threshold_users
+    """
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
+    cursor = conn.cursor()
+    
+    cursor.execute("""
+        SELECT entity_class, threshold_users
+        FROM schedule_references
+        WHERE schedule_name = 'Third Schedule'
+    """)
+    
+    thresholds = dict(cursor.fetchall())
+    conn.close()
+    
+    return thresholds
+
+
+def get_trigger_groups(business_profile: Dict[str, Any], thresholds: Dict[str, int] = None) -> Set[str]:
+    """
+    Trigger groups (keys of TRIGGER_GROUP_CONDITIONS) that apply to a business
+    
+    Same decisions as match_requirements(), without database lookups per
+    requirement or console output.
+    
+    Args:
+        business_profile: Dictionary with business data
+        thresholds: Optional result of get_third_schedule_thresholds()
+        
+    Returns:
+        Set of group names
+    """
+    entity_type = business_profile.get('entity_type', 'other')
+    user_count = business_profile.get('user_count', 0) or 0
+    
+    groups = {'universal'}
+    
+    if thresholds is None:
+        third_schedule = check_third_schedule_threshold(entity_type, user_count)
+    else:
+        third_schedule = entity_type in thresholds and user_count >= thresholds[entity_type]
+    if third_schedule:
+        groups.add('third_schedule')
+    
+    if business_profile.get('processes_children_data', False):
+        groups.add('children')
+    if business_profile.get('cross_border_transfers', False):
+        groups.add('cross_border')
+    if business_profile.get('is_sdf', False):
+        groups.add('sdf')
+    
+    return groups
+
+
+@traced('match.requirements')
+@MATCH_SECONDS.time(source='db')
 def match_requirements(business_profile: Dict[str, Any]) -> List[int]:
     """
     Match business profile to applicable requirements
@@ -298,7 +382,7 @@ def get_requirement_details(requirement_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary with requirement details
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     cursor.execute("""
@@ -355,7 +439,7 @@ def get_requirements_summary(requirement_ids: List[int]) -> Dict[str, Any]:
             'total_penalty_exposure': 0
         }
     
-    conn = sqlite3.connect(DB_PATH)
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
     cursor = conn.cursor()
     
     # Get all requirements
@@ -3,6 +3,8 @@ Runs complete assessment from questionnaire to Excel export
 
 Usage:
     python src/assessment/run_assessment.py
+    DPDPA_TRACE=1 python src/assessment/run_assessment.py                         # timing breakdown
+    DPDPA_TRACE=1 DPDPA_TRACE_FILE=trace.json python src/assessment/run_assessment.py  # Chrome trace
 """
 
 import sys
@@ -18,6 +20,7 @@ from src.assessment.business_profiler import create_business_profile, get_busine
 from src.assessment.requirement_matcher import match_requirements
 from src.assessment.gap_analyzer import analyze_gaps
 from src.assessment.report_generator import print_console_report, export_to_excel
+from src.utils import tracing
 
 
 def main():
@@ -164,6 +167,14 @@ def main():
         print(f"Deadline: May 13, 2027 ({analysis['gaps'][0]['days_remaining'] if analysis['gaps'] else 'N/A'} days remaining)")
         print()
         
+        if tracing.is_enabled():
+            print("="*70)
+            print("TIMING BREAKDOWN")
+            print("="*70)
+            print()
+            print(tracing.format_summary(tracing.get_spans()))
+            print()
+        
         return 0
         
     except KeyboardInterrupt:
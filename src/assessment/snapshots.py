@@ -0,0 +1,216 @@
+"""
+Assessment Snapshots
+Stores a summary of each gap analysis so pages can show scores without re-running it
+
+A snapshot holds the headline numbers of analyze_gaps() (score, counts,
+penalty exposure, requirements by type and the top gaps) plus the
+regulation version it was computed against. Saving a snapshot also
+updates business_profiles.assessment_score, which the paginated profile
+list reads.
+
+Usage:
+    from src.assessment.snapshots import save_snapshot, get_latest_snapshot
+
+    save_snapshot(business_id, analysis)
+    snapshot = get_latest_snapshot(business_id)
+"""
+
+import sqlite3
+import json
+from datetime import datetime
+from pathlib import Path
+import sys
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.config import DB_PATH
+from src.extraction.versioning import get_latest_version_id
+from src.utils.metrics import instrument_connection
+from src.utils.tracing import span, traced
+
+# Gaps kept per snapshot (highest priority first)
+TOP_GAPS = 5
+
+SNAPSHOT_COLUMNS = """
+    id, business_profile_id, version_id, compliance_score, total_requirements,
+    completed, gap_count, total_penalty_exposure, max_penalty_exposure,
+    by_type, top_gaps, created_at
+"""
+
+
+def build_snapshot_row(business_id: int, analysis: Dict[str, Any], version_id: Optional[int]) -> tuple:
+    """
+    Snapshot row for an analyze_gaps() result
+
+    Returns:
+        (business_profile_id, version_id, compliance_score, total_requirements,
+         completed, gap_count, total_penalty_exposure, max_penalty_exposure,
+         by_type_json, top_gaps_json, created_at)
+    """
+    top_gaps = [
+        {
+            'rule_number': gap['rule_number'],
+            'obligation_type': gap['obligation_type'],
+            'penalty_amount': gap['penalty_amount'],
+            'priority_score': gap['priority_score']
+        }
+        for gap in analysis['priority_requirements'][:TOP_GAPS]
+    ]
+    return (
+        business_id,
+        version_id,
+        analysis['compliance_score'],
+        analysis['total_requirements'],
+        analysis['completed'],
+        len(analysis['gaps']),
+        analysis['total_penalty_exposure'],
+        analysis['max_penalty_exposure'],
+        json.dumps(analysis['by_type']),
+        json.dumps(top_gaps),
+        datetime.now().isoformat()
+    )
+
+
+@traced('snapshot.save')
+def save_snapshots(analyses: Iterable[Tuple[int, Dict[str, Any]]], version_id: Optional[int] = None,
+                   conn: Optional[sqlite3.Connection] = None) -> int:
+    """
+    Store snapshots and assessment scores for several businesses in one transaction
+
+    Args:
+        analyses: (business_id, analysis) pairs
+        version_id: Regulation version the analyses used (default: latest)
+        conn: Optional open connection, left open afterwards
+
+    Returns:
+        Number of snapshots stored
+    """
+    if version_id is None:
+        version_id = get_latest_version_id()
+
+    rows = [build_snapshot_row(business_id, analysis, version_id) for business_id, analysis in analyses]
+    if not rows:
+        return 0
+
+    owns_connection = conn is None
+    if owns_connection:
+        with span('db.connect'):
+            conn = instrument_connection(sqlite3.connect(DB_PATH))
+    try:
+        with conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                INSERT INTO assessment_snapshots (
+                    business_profile_id, version_id, compliance_score, total_requirements,
+                    completed, gap_count, total_penalty_exposure, max_penalty_exposure,
+                    by_type, top_gaps, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            cursor.executemany("""
+                UPDATE business_profiles
+                SET assessment_score = ?,
+                    last_updated = ?
+                WHERE id = ?
+            """, [(row[2], row[10], row[0]) for row in rows])
+    finally:
+        if owns_connection:
+            conn.close()
+
+    return len(rows)
+
+
+def save_snapshot(business_id: int, analysis: Dict[str, Any], version_id: Optional[int] = None,
+                  conn: Optional[sqlite3.Connection] = None) -> None:
+    """Store one analysis snapshot and the business's assessment score"""
+    save_snapshots([(business_id, analysis)], version_id, conn)
+
+
+def _snapshot_from_row(row: tuple) -> Dict[str, Any]:
+    """Snapshot dictionary from a SNAPSHOT_COLUMNS row"""
+    return {
+        'id': row[0],
+        'business_profile_id': row[1],
+        'version_id': row[2],
+        'compliance_score': row[3],
+        'total_requirements': row[4],
+        'completed': row[5],
+        'gap_count': row[6],
+        'total_penalty_exposure': row[7],
+        'max_penalty_exposure': row[8],
+        'by_type': json.loads(row[9]) if row[9] else {},
+        'top_gaps': json.loads(row[10]) if row[10] else [],
+        'created_at': row[11]
+    }
+
+
+def get_latest_snapshots(business_ids: Iterable[int],
+                         conn: Optional[sqlite3.Connection] = None) -> Dict[int, Dict[str, Any]]:
+    """
+    Newest snapshot of each business
+
+    Args:
+        business_ids: Business profile IDs (e.g. one page of profiles)
+        conn: Optional open connection, left open afterwards
+
+    Returns:
+        Dictionary mapping business ID to snapshot (missing if never stored)
+    """
+    business_ids = list(business_ids)
+    if not business_ids:
+        return {}
+
+    owns_connection = conn is None
+    if owns_connection:
+        conn = instrument_connection(sqlite3.connect(DB_PATH))
+    cursor = conn.cursor()
+
+    placeholders = ','.join('?' * len(business_ids))
+    try:
+        # Latest id per business comes from the (business_profile_id, id DESC) index
+        cursor.execute(f"""
+            SELECT {SNAPSHOT_COLUMNS}
+            FROM assessment_snapshots s
+            WHERE s.business_profile_id IN ({placeholders})
+              AND s.id = (
+                  SELECT MAX(id) FROM assessment_snapshots
+                  WHERE business_profile_id = s.business_profile_id
+              )
+        """, business_ids)
+        rows = cursor.fetchall()
+    except sqlite3.OperationalError:
+        rows = []  # Database predates snapshots
+    finally:
+        if owns_connection:
+            conn.close()
+
+    return {row[1]: _snapshot_from_row(row) for row in rows}
+
+
+def get_latest_snapshot(business_id: int, conn: Optional[sqlite3.Connection] = None) -> Optional[Dict[str, Any]]:
+    """Newest snapshot of a business, or None"""
+    return get_latest_snapshots([business_id], conn).get(business_id)
+
+
+def get_snapshot_history(business_id: int, limit: int = 20) -> List[Dict[str, Any]]:
+    """Snapshots of a business, newest first"""
+    conn = instrument_connection(sqlite3.connect(DB_PATH))
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(f"""
+            SELECT {SNAPSHOT_COLUMNS}
+            FROM assessment_snapshots
+            WHERE business_profile_id = ?
+            ORDER BY id DESC
+            LIMIT ?
+        """, (business_id, limit))
+        rows = cursor.fetchall()
+    except sqlite3.OperationalError:
+        rows = []
+    finally:
+        conn.close()
+
+    return [_snapshot_from_row(row) for row in rows]
@@ -0,0 +1,367 @@
+"""
+Dashboard Caching Layer
+Streamlit caches for reference data, analyses and charts, with hit/miss counters
+
+Streamlit re-runs the whole page script on every widget interaction. The
+helpers here keep the expensive parts out of that loop:
+
+    catalog        requirement catalog, penalties, trigger groups, Third
+                   Schedule thresholds and questionnaire definitions
+                   (cache_resource, one copy per regulation version)
+    analysis       gap analysis per business, keyed by a fingerprint of
+                   the answers and the regulation version
+    assessments    stored profile + analysis per business; session state
+                   only holds a handle to one (make_assessment_handle())
+    figures/tables page-level builders decorated with cached_resource /
+                   cached_data and keyed by analysis_key() (business,
+                   answers fingerprint, regulation version)
+
+The regulation version (latest regulation_versions id) is part of every
+key, so re-running extract_requirements.py invalidates analyses without a
+restart. Hit and miss counts are process-wide and shown by
+show_cache_admin() (sidebar, ?admin=1).
+
+Usage:
+    from src.dashboard.cache import get_business_assessment, cached_resource
+
+    profile, answers, analysis = get_business_assessment(business_id)
+
+    @cached_resource('results_figures', max_entries=64)
+    def build_figures(fingerprint, is_dark, _analysis):
+        ...
+"""
+
+import functools
+import hashlib
+import json
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+import streamlit as st
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.assessment.business_profiler import (
+    get_business_profile, list_business_profiles_page, list_entity_types, profile_to_answers
+)
+from src.assessment.catalog import build_catalog, match_from_catalog
+from src.assessment.gap_analyzer import analyze_gaps
+from src.assessment.records import json_default
+from src.assessment.snapshots import get_latest_snapshots, save_snapshot
+from src.extraction.versioning import get_latest_version_id
+from src.utils.metrics import CACHE_HIT_RATIO, CACHE_MISSES, CACHE_REQUESTS
+
+# Seconds between checks for a new regulation version
+VERSION_CHECK_TTL = 30
+
+# Pipeline analyses waiting to fill the analysis cache (oldest dropped first)
+MAX_HANDOFFS = 64
+
+# {cache name: {'calls': n, 'misses': n}}
+CACHE_STATS: Dict[str, Dict[str, int]] = {}
+_stats_lock = threading.Lock()
+
+# {(business_id, answers fingerprint, version): analysis} from make_assessment_handle()
+_handoffs: Dict[Tuple[int, str, int], Any] = {}
+_handoffs_lock = threading.Lock()
+
+
+def _count(name: str, field: str) -> None:
+    with _stats_lock:
+        stats = CACHE_STATS.setdefault(name, {'calls': 0, 'misses': 0})
+        stats[field] += 1
+        hit_ratio = (stats['calls'] - stats['misses']) / stats['calls'] if stats['calls'] else 0.0
+
+    (CACHE_REQUESTS if field == 'calls' else CACHE_MISSES).inc(cache=name)
+    CACHE_HIT_RATIO.set(max(hit_ratio, 0.0), cache=name)
+
+
+def _instrumented(name: str, cache_decorator: Callable) -> Callable:
+    """
+    Wrap a Streamlit cache decorator so calls and misses are counted
+
+    The inner function only runs on a miss; the outer wrapper runs on every
+    call, so hits = calls - misses.
+    """
+    def decorate(func):
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            _count(name, 'misses')
+            return func(*args, **kwargs)
+
+        cached = cache_decorator(compute)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            _count(name, 'calls')
+            return cached(*args, **kwargs)
+
+        wrapper.clear = cached.clear
+        return wrapper
+
+    return decorate
+
+
+def cached_data(name: str, **options) -> Callable:
+    """st.cache_data with hit/miss counting (return values are copied per caller)"""
+    options.setdefault('show_spinner', False)
+    return _instrumented(name, st.cache_data(**options))
+
+
+def cached_resource(name: str, **options) -> Callable:
+    """st.cache_resource with hit/miss counting (one shared object, never mutate it)"""
+    options.setdefault('show_spinner', False)
+    return _instrumented(name, st.cache_resource(**options))
+
+
+def assessment_fingerprint(data: Any) -> str:
+    """Stable short hash of answers or an analysis (JSON, sorted keys)"""
+    payload = json.dumps(data, sort_keys=True, default=json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def get_cache_stats() -> List[Dict[str, Any]]:
+    """
+    Hit/miss counters for every instrumented cache
+
+    Returns:
+        List of dictionaries with name, calls, hits, misses and hit_rate (%)
+    """
+    with _stats_lock:
+        snapshot = {name: dict(stats) for name, stats in CACHE_STATS.items()}
+
+    rows = []
+    for name, stats in sorted(snapshot.items()):
+        hits = stats['calls'] - stats['misses']
+        rows.append({
+            'name': name,
+            'calls': stats['calls'],
+            'hits': hits,
+            'misses': stats['misses'],
+            'hit_rate': round(hits / stats['calls'] * 100, 1) if stats['calls'] else 0.0
+        })
+    return rows
+
+
+def reset_cache_stats() -> None:
+    """Zero all hit/miss counters"""
+    with _stats_lock:
+        CACHE_STATS.clear()
+
+
+def clear_caches() -> None:
+    """Drop every cached value and resource (e.g. after editing the database by hand)"""
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+# ============================================================================
+# REFERENCE DATA
+# ============================================================================
+
+@cached_data('catalog_version', ttl=VERSION_CHECK_TTL)
+def get_catalog_version() -> int:
+    """Latest regulation version id, re-read at most every VERSION_CHECK_TTL seconds"""
+    return get_latest_version_id()
+
+
+@cached_resource('catalog', max_entries=2)
+def load_catalog(version: int) -> Dict[str, Any]:
+    """Requirement catalog (catalog.build_catalog()) for a regulation version"""
+    return build_catalog(version)
+
+
+def get_catalog() -> Dict[str, Any]:
+    """Requirement catalog for the current regulation version"""
+    return load_catalog(get_catalog_version())
+
+
+# ============================================================================
+# ASSESSMENTS
+# ============================================================================
+
+@cached_data('analysis', ttl=600, max_entries=256)
+def _analyze(business_id: int, fingerprint: str, version: int, _answers: Dict[str, Any]) -> Dict[str, Any]:
+    """Gap analysis keyed by business, answers fingerprint and regulation version"""
+    # A pipeline run just analyzed these answers (make_assessment_handle())
+    with _handoffs_lock:
+        analysis = _handoffs.pop((business_id, fingerprint, version), None)
+    if analysis is not None:
+        return analysis
+
+    applicable_ids = match_from_catalog(_answers, load_catalog(version))
+    return analyze_gaps(business_id, applicable_ids, _answers)
+
+
+def get_analysis(business_id: int, answers: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Memoized analyze_gaps() for a business and its answers
+
+    Requirement matching uses the cached catalog instead of querying each
+    trigger group.
+
+    Args:
+        business_id: Business profile ID
+        answers: Answers dictionary (questionnaire or profile_to_answers format)
+
+    Returns:
+        Analysis dictionary from analyze_gaps()
+    """
+    return _analyze(business_id, assessment_fingerprint(answers), get_catalog_version(), answers)
+
+
+@cached_data('business_assessment', ttl=600, max_entries=256)
+def _load_business_assessment(business_id: int, version: int) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Profile, answers and analysis of a stored business"""
+    profile = get_business_profile(business_id)
+    answers = profile_to_answers(profile)
+    return profile, answers, get_analysis(business_id, answers)
+
+
+def get_business_assessment(business_id: int) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """
+    Stored profile plus its (memoized) analysis
+
+    Returns:
+        (profile, answers, analysis)
+    """
+    return _load_business_assessment(business_id, get_catalog_version())
+
+
+def make_assessment_handle(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    What session state keeps for a finished assessment, instead of the analysis
+
+    The pipeline's analysis is handed to the analysis cache, which stores
+    it on its next miss for these answers instead of matching and
+    analyzing again (only the stored profile is read here).
+
+    Args:
+        result: Dictionary from pipeline.run_assessment()
+
+    Returns:
+        Dictionary with business_id, fingerprint (of the stored answers) and,
+        when tracing was on, the pipeline trace
+    """
+    business_id = result['business_id']
+    fingerprint = assessment_fingerprint(profile_to_answers(get_business_profile(business_id)))
+    with _handoffs_lock:
+        _handoffs[(business_id, fingerprint, get_catalog_version())] = result['analysis']
+        while len(_handoffs) > MAX_HANDOFFS:
+            del _handoffs[next(iter(_handoffs))]
+
+    handle = {'business_id': business_id, 'fingerprint': fingerprint}
+    if result.get('trace'):
+        handle['trace'] = result['trace']
+    return handle
+
+
+def analysis_key(business_id: int, fingerprint: str) -> str:
+    """
+    Cache key for things built from a business's analysis (figures, tables)
+
+    The analysis is determined by the business, its answers and the
+    regulation version, so the key is built from those instead of hashing
+    the analysis itself.
+
+    Args:
+        business_id: Business profile ID
+        fingerprint: assessment_fingerprint() of the answers (a handle's 'fingerprint')
+    """
+    return f"{business_id}:{fingerprint}:{get_catalog_version()}"
+
+
+def resolve_assessment(handle: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Answers and analysis for an assessment handle, from the shared caches
+
+    Returns:
+        (answers, analysis)
+
+    Raises:
+        LookupError: If the stored profile no longer matches the handle
+    """
+    _, answers, analysis = get_business_assessment(handle['business_id'])
+    if assessment_fingerprint(answers) != handle['fingerprint']:
+        raise LookupError(f"Business profile {handle['business_id']} has changed since this assessment")
+    return answers, analysis
+
+
+@cached_data('profile_pages', ttl=60, max_entries=512)
+def list_profiles_page(after=None, name_prefix=None, entity_type=None, min_score=None, max_score=None) -> dict:
+    """Cached list_business_profiles_page() (default page size)"""
+    return list_business_profiles_page(
+        after=after, name_prefix=name_prefix, entity_type=entity_type,
+        min_score=min_score, max_score=max_score
+    )
+
+
+@cached_data('entity_types', ttl=300)
+def list_profile_entity_types() -> list:
+    """Cached list_entity_types()"""
+    return list_entity_types()
+
+
+@cached_data('snapshots', ttl=60, max_entries=512)
+def get_snapshots(business_ids: tuple) -> dict:
+    """Cached get_latest_snapshots() for one page of business IDs"""
+    return get_latest_snapshots(business_ids)
+
+
+def backfill_snapshot(business_id: int) -> dict:
+    """
+    Analyze a business that has no stored snapshot yet and store one
+
+    Returns:
+        The new snapshot
+    """
+    _, _, analysis = get_business_assessment(business_id)
+    save_snapshot(business_id, analysis, get_catalog_version())
+    list_profiles_page.clear()
+    get_snapshots.clear()
+    return get_latest_snapshots([business_id])[business_id]
+
+
+def invalidate_profiles() -> None:
+    """Forget cached profile pages, snapshots and stored assessments (call after saving a profile)"""
+    list_profiles_page.clear()
+    list_profile_entity_types.clear()
+    get_snapshots.clear()
+    _load_business_assessment.clear()
+
+
+# ============================================================================
+# ADMIN PANEL
+# ============================================================================
+
+def show_cache_admin() -> None:
+    """Sidebar panel with hit/miss counters and a clear button"""
+    with st.sidebar.expander("Cache statistics", expanded=False):
+        stats = get_cache_stats()
+        if stats:
+            st.dataframe(
+                [
+                    {'Cache': row['name'], 'Hits': row['hits'], 'Misses': row['misses'], 'Hit %': row['hit_rate']}
+                    for row in stats
+                ],
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.caption("No cached calls yet")
+
+        st.caption(f"Regulation version: {get_catalog_version()}")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Clear caches", use_container_width=True, key="cache_admin_clear"):
+                clear_caches()
+                st.rerun()
+        with col2:
+            if st.button("Reset counters", use_container_width=True, key="cache_admin_reset"):
+                reset_cache_stats()
+                st.rerun()
@@ -6,15 +6,13 @@ Interactive 15-question form with validation and demo mode
 import streamlit as st
 import sys
 from pathlib import Path
-import time
 
 # Add project root
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.assessment.business_profiler import create_business_profile
-from src.assessment.requirement_matcher import match_requirements
-from src.assessment.gap_analyzer import analyze_gaps
+from src.assessment.pipeline import submit_assessment, iter_progress
+from src.dashboard.cache import invalidate_profiles, make_assessment_handle
 
 # Demo data for quick testing
 DEMO_DATA = {
@@ -35,11 +33,50 @@ DEMO_DATA = {
     'has_grievance_system': True
 }
 
+def show_assessment_job():
+    """Follow the background assessment job and open the results once it finishes"""
+    job = st.session_state['assessment_job']
+    
+    progress_bar = st.progress(job['progress'])
+    status_text = st.empty()
+    status_text.text(job['message'])
+    
+    for event in iter_progress(job):
+        progress_bar.progress(event['progress'])
+        status_text.text(event['message'])
+    
+    del st.session_state['assessment_job']
+    
+    try:
+        result = job['future'].result()
+    except Exception as e:
+        progress_bar.empty()
+        status_text.empty()
+        st.error(f"Error processing assessment: {str(e)}")
+        with st.expander("Technical Details"):
+            st.code(str(e))
+        st.info("Troubleshooting: Check that the database exists and all required fields are filled.")
+        return
+    
+    invalidate_profiles()
+    
+    # Store a handle in session; the analysis stays in the shared cache
+    st.session_state['current_assessment'] = make_assessment_handle(result)
+    
+    # Navigate to results
+    st.query_params["page"] = "results"
+    st.rerun()
+
 def show():
     """Render assessment form with demo mode"""
     
     st.title("DPDPA Compliance Assessment")
     
+    # A submitted assessment still running (e.g. after a rerun)
+    if 'assessment_job' in st.session_state:
+        show_assessment_job()
+        return
+    
     # Demo mode button
     col1, col2, col3 = st.columns([1, 2, 1])
     with col2:
@@ -296,58 +333,9 @@ def show():
                 'has_grievance_system': has_grievance_system
             }
             
-            # Process with loading states
-            try:
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                # Step 1: Create profile
-                status_text.text("Creating business profile...")
-                progress_bar.progress(25)
-                time.sleep(0.3)
-                business_id = create_business_profile(answers)
-                
-                # Step 2: Match requirements
-                status_text.text("Matching applicable requirements...")
-                progress_bar.progress(50)
-                time.sleep(0.3)
-                applicable_ids = match_requirements(answers)
-                
-                # Step 3: Analyze gaps
-                status_text.text("Analyzing compliance gaps...")
-                progress_bar.progress(75)
-                time.sleep(0.3)
-                analysis = analyze_gaps(business_id, applicable_ids, answers)
-                
-                # Complete
-                progress_bar.progress(100)
-                status_text.text("Assessment complete!")
-                time.sleep(0.5)
-                
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
-                
-                # Store in session
-                st.session_state['current_assessment'] = {
-                    'business_id': business_id,
-                    'answers': answers,
-                    'analysis': analysis
-                }
-                
-                # Success message
-                st.success("Assessment completed successfully!")
-                
-                # Navigate to results
-                time.sleep(0.5)
-                st.query_params["page"] = "results"
-                st.rerun()
-                
-            except Exception as e:
-                st.error(f"Error processing assessment: {str(e)}")
-                with st.expander("Technical Details"):
-                    st.code(str(e))
-                st.info("Troubleshooting: Check that the database exists and all required fields are filled.")
+            # Run in the background; progress comes from the pipeline stages
+            st.session_state['assessment_job'] = submit_assessment(answers)
+            show_assessment_job()
 
 if __name__ == "__main__":
     show()
\ No newline at end of file
@@ -11,9 +11,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.assessment.business_profiler import get_business_profile
-from src.assessment.requirement_matcher import match_requirements
-from src.assessment.gap_analyzer import analyze_gaps
+from src.dashboard.cache import get_business_assessment, resolve_assessment
 
 def show():
     """Render documents generation page"""
@@ -26,21 +24,19 @@ def show():
     """)
     
     # Check if we have assessment data
-    if 'current_assessment' in st.session_state:
-        data = st.session_state['current_assessment']
-        business_id = data['business_id']
-        answers = data['answers']
-        analysis = data['analysis']
-    elif 'selected_business_id' in st.session_state:
-        business_id = st.session_state['selected_business_id']
+    if 'current_assessment' in st.session_state or 'selected_business_id' in st.session_state:
         try:
-            profile = get_business_profile(business_id)
-            answers = profile
-            if 'extended_data' in profile:
-                answers.update(profile['extended_data'])
-            
-            applicable_ids = match_requirements(answers)
-            analysis = analyze_gaps(business_id, applicable_ids, answers)
+            if 'current_assessment' in st.session_state:
+                # Session state holds a handle; answers and analysis come from the shared cache
+                handle = st.session_state['current_assessment']
+                business_id = handle['business_id']
+                answers, analysis = resolve_assessment(handle)
+            else:
+                business_id = st.session_state['selected_business_id']
+                profile, _, analysis = get_business_assessment(business_id)
+                answers = dict(profile)
+                if 'extended_data' in profile:
+                    answers.update(profile['extended_data'])
         except Exception as e:
             st.error(f"Error loading assessment: {e}")
             st.info("Please complete an assessment first to generate documents.")
@@ -505,7 +501,33 @@ def show():
                 except Exception as e:
                     st.error(f"Bulk generation failed: {e}")
                     st.exception(e)
-    
+
+            if st.button("Generate All Required Documents as PDF (ZIP)", use_container_width=True):
+                try:
+                    with st.spinner("Rendering all required documents to PDF..."):
+                        documents = generator.generate_all_required_documents()
+
+                        zip_path = generator.export_all_to_pdf_zip(
+                            documents,
+                            f"DPDP_Documents_PDF_{business_id}.zip"
+                        )
+
+                        with open(zip_path, 'rb') as f:
+                            st.download_button(
+                                "Download PDF Document Package (ZIP)",
+                                data=f,
+                                file_name=f"DPDP_Documents_PDF_{answers['business_name']}.zip",
+                                mime="application/zip",
+                                key="dl_bulk_pdf",
+                                use_container_width=True
+                            )
+
+                        st.success(f"Successfully rendered {len(documents)} documents to PDF.")
+
+                except Exception as e:
+                    st.error(f"PDF generation failed: {e}")
+                    st.exception(e)
+
     except ImportError:
         st.error("Document generator module not found. Ensure python-docx is installed.")
         st.code("pip install python-docx", language="bash")
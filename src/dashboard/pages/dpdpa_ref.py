@@ -4,7 +4,85 @@ Provides quick reference to DPDP Act 2023 key provisions
 """
 
 import streamlit as st
-import pandas as pd
+import sys
+from pathlib import Path
+from time import perf_counter
+
+# Add project root
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.dashboard.cache import cached_data, get_catalog_version
+from src.extraction.search_index import search
+
+@cached_data('reference_penalty_table')
+def build_penalty_table():
+    """Section 33 penalty schedule as a DataFrame"""
+    penalty_data = {
+        'Violation': [
+            'Security breach (Rule 6)',
+            'Breach notification failure (Rule 7)',
+            "Children's data violations (Rule 10)",
+            'SDF obligations (Rule 13)',
+            'General violations (Notice, Rights)',
+            'Processing without valid consent',
+            'Failure to implement technical measures',
+            'Non-compliance with Board orders'
+        ],
+        'Penalty (Rs. Crore)': [
+            '250',
+            '200',
+            '200',
+            '150',
+            '50',
+            '50',
+            '50',
+            'Up to 250'
+        ],
+        'Reference': [
+            'Section 8(5)',
+            'Section 8(6)',
+            'Section 9',
+            'Section 10',
+            'Section 6, 11',
+            'Section 6',
+            'Section 8',
+            'Section 33(1)'
+        ]
+    }
+    
+    import pandas as pd
+    return pd.DataFrame(penalty_data)
+
+@cached_data('reference_search', ttl=300, max_entries=256)
+def search_cached(query: str, version: int) -> list:
+    """search() results per query and regulation version"""
+    return search(query, limit=20)
+
+def show_search():
+    """Search box over extracted requirements and the reference guide"""
+    query = st.text_input(
+        "Search the Rules and reference guide",
+        placeholder="e.g. breach 72 hours, parental consent, Rule 6"
+    )
+    if not query.strip():
+        return
+    
+    start = perf_counter()
+    results = search_cached(query.strip(), get_catalog_version())
+    elapsed_ms = (perf_counter() - start) * 1000
+    
+    if not results:
+        st.info("No matches. Run `python src/extraction/extract_requirements.py` if the search index has not been built yet.")
+        return
+    
+    st.caption(f"{len(results)} results in {elapsed_ms:.1f} ms")
+    for result in results:
+        label = "Requirement" if result['kind'] == 'requirement' else "Reference guide"
+        st.markdown(f"**{result['title']}** · _{label}_  \n{result['snippet']}")
+    
+    st.markdown("---")
+
 def show():
     """Render DPDPA reference page"""
     
@@ -15,6 +93,8 @@ def show():
     Data Protection Act, 2023 and DPDP Rules, 2025.
     """)
     
+    show_search()
+    
     # Tabs for different sections
     tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "Overview", 
@@ -278,40 +358,7 @@ def show():
         The Data Protection Board may impose penalties for violations:
         """)
         
-        penalty_data = {
-            'Violation': [
-                'Security breach (Rule 6)',
-                'Breach notification failure (Rule 7)',
-                "Children's data violations (Rule 10)",
-                'SDF obligations (Rule 13)',
-                'General violations (Notice, Rights)',
-                'Processing without valid consent',
-                'Failure to implement technical measures',
-                'Non-compliance with Board orders'
-            ],
-            'Penalty (Rs. Crore)': [
-                '250',
-                '200',
-                '200',
-                '150',
-                '50',
-                '50',
-                '50',
-                'Up to 250'
-            ],
-            'Reference': [
-                'Section 8(5)',
-                'Section 8(6)',
-                'Section 9',
-                'Section 10',
-                'Section 6, 11',
-                'Section 6',
-                'Section 8',
-                'Section 33(1)'
-            ]
-        }
-        
-        df_penalties = pd.DataFrame(penalty_data)
+        df_penalties = build_penalty_table()
         st.dataframe(df_penalties, use_container_width=True, hide_index=True)
         
         st.warning("""
@@ -10,9 +10,117 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.assessment.business_profiler import list_business_profiles, get_business_profile
+from src.dashboard.cache import (
+    backfill_snapshot, get_snapshots, list_profile_entity_types, list_profiles_page
+)
 from datetime import datetime
 
+def show_profile_browser():
+    """Paginated, filterable table of stored assessments (scores come from snapshots)"""
+    
+    # Filters (applied in SQL)
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col1:
+        name_prefix = st.text_input("Business name starts with", key="profile_filter_name").strip()
+    with col2:
+        entity_types = ["All"] + list_profile_entity_types()
+        entity_type = st.selectbox("Entity type", entity_types, key="profile_filter_type")
+    with col3:
+        score_range = st.slider("Compliance score", 0, 100, (0, 100), key="profile_filter_score")
+    
+    filters = {
+        'name_prefix': name_prefix or None,
+        'entity_type': None if entity_type == "All" else entity_type,
+        'min_score': None if score_range == (0, 100) else score_range[0],
+        'max_score': None if score_range == (0, 100) else score_range[1]
+    }
+    
+    # Cursors of the pages visited so far; new filters start again at page 1
+    if st.session_state.get('profile_page_filters') != filters:
+        st.session_state['profile_page_filters'] = filters
+        st.session_state['profile_page_cursors'] = [None]
+    cursors = st.session_state['profile_page_cursors']
+    
+    page = list_profiles_page(after=cursors[-1], **filters)
+    profiles = page['profiles']
+    
+    if not profiles:
+        if len(cursors) == 1 and not any(value is not None for value in filters.values()):
+            st.info("No assessments yet. Start your first assessment above!")
+        else:
+            st.info("No assessments match these filters.")
+        return
+    
+    snapshots = get_snapshots(tuple(p['id'] for p in profiles))
+    
+    rows = []
+    for p in profiles:
+        snapshot = snapshots.get(p['id'])
+        rows.append({
+            'Business': p['business_name'],
+            'Type': (p['entity_type'] or 'other').title(),
+            'Users': f"{p['user_count'] or 0:,}",
+            'Score': f"{p['assessment_score']:.1f}%" if snapshot else "Not assessed",
+            'Gaps': snapshot['gap_count'] if snapshot else None,
+            'Exposure (Rs. Cr)': round(snapshot['total_penalty_exposure'] / 10_000_000) if snapshot else None,
+            'Created': p['created_at'][:10] if p.get('created_at') else 'N/A'
+        })
+    st.dataframe(rows, use_container_width=True, hide_index=True)
+    
+    # Pagination
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        if st.button("Previous", use_container_width=True, disabled=len(cursors) == 1, key="profile_page_prev"):
+            cursors.pop()
+            st.rerun()
+    with col2:
+        st.caption(f"Page {len(cursors)}")
+    with col3:
+        if st.button("Next", use_container_width=True, disabled=page['next_cursor'] is None, key="profile_page_next"):
+            cursors.append(page['next_cursor'])
+            st.rerun()
+    
+    # Details of one assessment
+    profile_options = ["Select an assessment..."] + [
+        f"{p['business_name']} ({(p['entity_type'] or 'other').title()}) - {p['created_at'][:10] if p.get('created_at') else 'N/A'}"
+        for p in profiles
+    ]
+    
+    selected = st.selectbox(
+        "Choose an assessment to view:",
+        options=profile_options,
+        key="assessment_selector"
+    )
+    
+    if selected != "Select an assessment...":
+        selected_profile = profiles[profile_options.index(selected) - 1]
+        
+        # Stored snapshot; profiles saved before snapshots existed are analyzed once
+        snapshot = snapshots.get(selected_profile['id'])
+        if snapshot is None:
+            try:
+                snapshot = backfill_snapshot(selected_profile['id'])
+            except Exception:
+                snapshot = None
+        score = snapshot['compliance_score'] if snapshot else (selected_profile.get('assessment_score') or 0.0)
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Users", f"{selected_profile['user_count'] or 0:,}")
+        with col2:
+            st.metric("Compliance", f"{score:.1f}%")
+        with col3:
+            st.metric("Open Gaps", snapshot['gap_count'] if snapshot else "N/A")
+        with col4:
+            created = selected_profile['created_at'][:10] if selected_profile.get('created_at') else 'N/A'
+            st.metric("Created", created)
+        
+        # View button
+        if st.button("View Full Report", use_container_width=True, type="primary"):
+            st.session_state['selected_business_id'] = selected_profile['id']
+            st.query_params["page"] = "results"
+            st.rerun()
+
 def show():
     """Render enhanced home page"""
     
@@ -103,78 +211,8 @@ def show():
     st.subheader("Your Past Assessments")
     
     try:
-        profiles = list_business_profiles()
-        
-        if profiles:
-            # Create options for selectbox
-            profile_options = ["Select an assessment..."] + [
-                f"{p['business_name']} ({p['entity_type'].title()}) - {p['created_at'][:10] if p.get('created_at') else 'N/A'}"
-                for p in profiles[:10]  # Show last 10
-            ]
-            
-            selected = st.selectbox(
-                "Choose an assessment to view:",
-                options=profile_options,
-                key="assessment_selector"
-            )
-            
-            if selected != "Select an assessment...":
-                # Find the selected profile
-                selected_index = profile_options.index(selected) - 1
-                selected_profile_basic = profiles[selected_index]
-                
-                # Get FULL profile with extended_data
-                from src.assessment.requirement_matcher import match_requirements
-                from src.assessment.gap_analyzer import analyze_gaps
-                
-                selected_profile = get_business_profile(selected_profile_basic['id'])
-                
-                # Build answers dict from full profile
-                answers = {
-                    'business_name': selected_profile.get('business_name', 'Unknown'),
-                    'entity_type': selected_profile.get('entity_type', 'other'),
-                    'user_count': selected_profile.get('user_count', 0),
-                    'processes_children_data': selected_profile.get('processes_children_data', False),
-                    'cross_border_transfers': selected_profile.get('cross_border_transfers', False),
-                }
-                
-                # Add extended_data
-                if 'extended_data' in selected_profile and selected_profile['extended_data']:
-                    extended = selected_profile['extended_data']
-                    answers['extended_data'] = extended
-                    answers.update(extended)
-                else:
-                    answers['extended_data'] = {}
-                
-                # Recalculate score
-                try:
-                    applicable_ids = match_requirements(answers)
-                    analysis = analyze_gaps(selected_profile['id'], applicable_ids, answers)
-                    actual_score = analysis['compliance_score']
-                except Exception as e:
-                    # Fallback to stored score if recalculation fails
-                    actual_score = selected_profile.get('assessment_score', 0.0)
-                
-                # Show details with recalculated score
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Users", f"{selected_profile['user_count']:,}")
-                with col2:
-                    st.metric("Compliance", f"{actual_score:.1f}%")
-                with col3:
-                    st.metric("Type", selected_profile['entity_type'].title())
-                with col4:
-                    created = selected_profile['created_at'][:10] if selected_profile.get('created_at') else 'N/A'
-                    st.metric("Created", created)
-                
-                # View button
-                if st.button("View Full Report", use_container_width=True, type="primary"):
-                    st.session_state['selected_business_id'] = selected_profile['id']
-                    st.query_params["page"] = "results"
-                    st.rerun()
-        else:
-            st.info("No assessments yet. Start your first assessment above!")
-            
+        show_profile_browser()
+    
     except Exception as e:
         st.error(f"Error loading assessments: {e}")
         import traceback
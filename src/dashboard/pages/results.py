@@ -7,42 +7,276 @@ ENHANCED: Dynamic "Next Steps" based on actual gaps
 import streamlit as st
 import sys
 from pathlib import Path
-import pandas as pd
 from datetime import datetime
-import plotly.graph_objects as go
 
 # Add project root
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.assessment.business_profiler import get_business_profile
-from src.assessment.requirement_matcher import match_requirements
-from src.assessment.gap_analyzer import analyze_gaps
-from src.assessment.report_generator import export_to_excel
+from src.assessment.records import get_exposure
+from src.dashboard.cache import (
+    analysis_key, assessment_fingerprint, cached_data, cached_resource, get_business_assessment,
+    resolve_assessment
+)
+from src.utils import tracing
+
+@cached_resource('results_figures', max_entries=64)
+def build_figures(key: str, is_dark: bool, _analysis: dict) -> dict:
+    """
+    Build the results page charts (cached per analysis key and theme)
+    
+    Returns:
+        Dictionary with 'pie', 'gauge' and 'bar' figures ('bar' is None
+        when there are no gaps)
+    """
+    # plotly is only loaded once there are charts to draw
+    import plotly.graph_objects as go
+    
+    analysis = _analysis
+    bg_color = '#1a1a1a' if is_dark else 'white'
+    text_color = '#e0e0e0' if is_dark else '#262730'
+    grid_color = '#404040' if is_dark else '#e0e0e0'
+    
+    # Pie chart of requirements by type
+    colors = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#00f2fe', '#43e97b']
+    
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=[t.title() for t in analysis['by_type'].keys()],
+        values=list(analysis['by_type'].values()),
+        hole=0.4,
+        marker=dict(colors=colors),
+        textinfo='label+percent',
+        textfont=dict(family='Arial', size=11, color=text_color)
+    )])
+    
+    fig_pie.update_layout(
+        title=dict(
+            text="Requirements Distribution",
+            font=dict(family='Arial', size=16, color=text_color)
+        ),
+        showlegend=True,
+        legend=dict(
+            orientation="v",
+            font=dict(family='Arial', size=10, color=text_color)
+        ),
+        height=350,
+        margin=dict(l=20, r=20, t=50, b=20),
+        font=dict(family='Arial', color=text_color),
+        paper_bgcolor=bg_color,
+        plot_bgcolor=bg_color
+    )
+    
+    # Compliance progress gauge
+    score = analysis['compliance_score']
+    
+    fig_gauge = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Compliance Score", 'font': {'family': 'Arial', 'size': 18, 'color': text_color}},
+        number={'suffix': "%", 'font': {'size': 40, 'color': text_color}},
+        gauge={
+            'axis': {'range': [None, 100], 'tickfont': {'family': 'Arial', 'color': text_color}},
+            'bar': {'color': "#667eea"},
+            'bgcolor': bg_color,
+            'borderwidth': 2,
+            'bordercolor': grid_color,
+            'steps': [
+                {'range': [0, 33], 'color': '#ffebee' if not is_dark else '#4a1a1a'},
+                {'range': [33, 66], 'color': '#fff9c4' if not is_dark else '#4a4a1a'},
+                {'range': [66, 100], 'color': '#e8f5e9' if not is_dark else '#1a4a1a'}
+            ],
+            'threshold': {
+                'line': {'color': "#43e97b", 'width': 4},
+                'thickness': 0.75,
+                'value': 100
+            }
+        }
+    ))
+    
+    fig_gauge.update_layout(
+        height=350,
+        margin=dict(l=20, r=20, t=50, b=20),
+        font={'family': 'Arial', 'size': 14, 'color': text_color},
+        paper_bgcolor=bg_color
+    )
+    
+    # Penalty breakdown of open gaps (aggregated by analyze_gaps)
+    penalty_breakdown = {
+        oblig_type or 'general': totals
+        for oblig_type, totals in get_exposure(analysis)['by_type'].items()
+        if totals['open_count']
+    }
+    
+    fig_bar = None
+    if penalty_breakdown:
+        # Create bar chart data
+        categories = []
+        exposures = []
+        colors_bar = []
+        
+        color_map = {
+            'security': '#667eea',
+            'breach': '#764ba2',
+            'children': '#f093fb',
+            'notice': '#4facfe',
+            'rights': '#00f2fe',
+            'retention': '#43e97b',
+            'sdf': '#f6d365',
+            'general': '#fda085'
+        }
+        
+        for oblig_type, data in sorted(penalty_breakdown.items(), key=lambda x: x[1]['open_exposure'], reverse=True):
+            categories.append(oblig_type.title())
+            exposures.append(data['open_exposure'] / 10_000_000)  # Convert to crores
+            colors_bar.append(color_map.get(oblig_type, '#667eea'))
+        
+        fig_bar = go.Figure()
+        
+        fig_bar.add_trace(go.Bar(
+            x=categories,
+            y=exposures,
+            name='Total Exposure (Rs. Cr)',
+            marker=dict(color=colors_bar, line=dict(color=text_color, width=1)),
+            text=[f"Rs. {e:.0f} Cr" for e in exposures],
+            textposition='auto',
+            textfont=dict(family='Arial', size=11, color=text_color),
+            hovertemplate='<b>%{x}</b><br>Exposure: Rs. %{y:.0f} Cr<br><extra></extra>'
+        ))
+        
+        fig_bar.update_layout(
+            title=dict(
+                text="Penalty Exposure by Requirement Type",
+                font=dict(family='Arial', size=16, color=text_color)
+            ),
+            xaxis=dict(
+                title=dict(
+                    text="Requirement Type",
+                    font=dict(color=text_color)
+                ),
+                tickangle=-45,
+                tickfont=dict(family='Arial', size=11, color=text_color),
+                gridcolor=grid_color
+            ),
+            yaxis=dict(
+                title=dict(
+                    text="Total Penalty Exposure (Rs. Crore)",
+                    font=dict(color=text_color)
+                ),
+                tickfont=dict(family='Arial', color=text_color),
+                gridcolor=grid_color
+            ),
+            height=400,
+            margin=dict(l=50, r=50, t=60, b=100),
+            font=dict(family='Arial', color=text_color),
+            showlegend=False,
+            hovermode='x unified',
+            paper_bgcolor=bg_color,
+            plot_bgcolor=bg_color
+        )
+    
+    return {'pie': fig_pie, 'gauge': fig_gauge, 'bar': fig_bar}
+
+@cached_data('results_priority_table', max_entries=64)
+def build_priority_table(key: str, _analysis: dict):
+    """Top 10 priority requirements as a DataFrame (cached per analysis key)"""
+    priorities_data = []
+    for req in _analysis['priority_requirements'][:10]:
+        priorities_data.append({
+            'Priority': f"{req['priority_score']:.1f}/100",
+            'Rule': req['rule_number'],
+            'Type': req['obligation_type'].title(),
+            'Penalty': f"Rs. {req['penalty_amount'] / 10_000_000:.0f} Cr",
+            'Days Left': req['days_remaining'],
+            'Description': req['requirement_text'][:80] + "..."
+        })
+    
+    import pandas as pd
+    return pd.DataFrame(priorities_data)
+
+def show_timing_breakdown(sections: dict) -> None:
+    """
+    Debug expander with per-stage timings (shown with ?trace=1)
+    
+    Args:
+        sections: Heading -> span records (e.g. the assessment run and this page render)
+    """
+    import json
+    
+    with st.expander("Debug: timing breakdown", expanded=False):
+        all_spans = []
+        for heading, spans in sections.items():
+            st.markdown(f"**{heading}**")
+            if not spans:
+                st.caption("No spans recorded (tracing was off when this ran)")
+                continue
+            all_spans.extend(spans)
+            
+            rows = tracing.summarize(spans)
+            total = sum(row['total_ms'] for row in rows if row['depth'] == 0) or 1.0
+            st.dataframe(
+                [
+                    {
+                        'Stage': '\u00a0\u00a0' * row['depth'] + row['name'],
+                        'Calls': row['calls'],
+                        'Total (ms)': round(row['total_ms'], 2),
+                        'Share': f"{row['total_ms'] / total:.0%}"
+                    }
+                    for row in rows
+                ],
+                use_container_width=True,
+                hide_index=True
+            )
+        
+        if all_spans:
+            st.download_button(
+                "Download Chrome trace",
+                data=json.dumps(tracing.to_chrome_trace(all_spans), default=str),
+                file_name="dpdpa_trace.json",
+                mime="application/json",
+                help="Open in chrome://tracing or ui.perfetto.dev",
+                key="dl_trace"
+            )
 
 def show():
+    """Render results page, timed when tracing is on (?trace=1 for this session, or DPDPA_TRACE=1)"""
+    with tracing.capture() as page_spans, tracing.span('page.results'):
+        render()
+    
+    # This session's flag, not the process-wide DPDPA_TRACE
+    if st.query_params.get("trace") == "1":
+        assessment = st.session_state.get('current_assessment', {})
+        show_timing_breakdown({
+            "Assessment run": assessment.get('trace', []),
+            "This page render": page_spans
+        })
+
+def render():
     """Render results page"""
     
     st.title("Compliance Report")
     
     # Check if we have assessment data
     if 'current_assessment' in st.session_state:
-        data = st.session_state['current_assessment']
-        business_id = data['business_id']
-        answers = data['answers']
-        analysis = data['analysis']
+        # Session state holds a handle; answers and analysis come from the shared cache
+        handle = st.session_state['current_assessment']
+        business_id = handle['business_id']
+        try:
+            answers, analysis = resolve_assessment(handle)
+        except Exception as e:
+            st.error(f"Error loading assessment: {e}")
+            return
+        cache_key = analysis_key(business_id, handle['fingerprint'])
     elif 'selected_business_id' in st.session_state:
-        # Load from database
+        # Load from database (analysis is memoized per answers and regulation version)
         business_id = st.session_state['selected_business_id']
         try:
-            profile = get_business_profile(business_id)
-            answers = profile
+            profile, stored_answers, analysis = get_business_assessment(business_id)
+            cache_key = analysis_key(business_id, assessment_fingerprint(stored_answers))
+            answers = dict(profile)
             if 'extended_data' in profile:
                 answers.update(profile['extended_data'])
-            
-            # Re-run analysis with answers
-            applicable_ids = match_requirements(answers)
-            analysis = analyze_gaps(business_id, applicable_ids, answers)
         except Exception as e:
             st.error(f"Error loading assessment: {e}")
             return
@@ -121,83 +355,16 @@ def show():
     # Requirements breakdown with visualizations
     st.subheader("Requirements Breakdown")
     
-    # Check dark mode
     is_dark = st.session_state.get('dark_mode', False)
-    bg_color = '#1a1a1a' if is_dark else 'white'
-    text_color = '#e0e0e0' if is_dark else '#262730'
-    grid_color = '#404040' if is_dark else '#e0e0e0'
+    figures = build_figures(cache_key, is_dark, analysis)
     
     col1, col2 = st.columns([1, 1])
     
     with col1:
-        # Pie chart of requirements by type
-        colors = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#00f2fe', '#43e97b']
-        
-        fig_pie = go.Figure(data=[go.Pie(
-            labels=[t.title() for t in analysis['by_type'].keys()],
-            values=list(analysis['by_type'].values()),
-            hole=0.4,
-            marker=dict(colors=colors),
-            textinfo='label+percent',
-            textfont=dict(family='Arial', size=11, color=text_color)
-        )])
-        
-        fig_pie.update_layout(
-            title=dict(
-                text="Requirements Distribution",
-                font=dict(family='Arial', size=16, color=text_color)
-            ),
-            showlegend=True,
-            legend=dict(
-                orientation="v",
-                font=dict(family='Arial', size=10, color=text_color)
-            ),
-            height=350,
-            margin=dict(l=20, r=20, t=50, b=20),
-            font=dict(family='Arial', color=text_color),
-            paper_bgcolor=bg_color,
-            plot_bgcolor=bg_color
-        )
-        
-        st.plotly_chart(fig_pie, use_container_width=True)
+        st.plotly_chart(figures['pie'], use_container_width=True)
     
     with col2:
-        # Compliance progress gauge
-        score = analysis['compliance_score']
-        
-        fig_gauge = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=score,
-            domain={'x': [0, 1], 'y': [0, 1]},
-            title={'text': "Compliance Score", 'font': {'family': 'Arial', 'size': 18, 'color': text_color}},
-            number={'suffix': "%", 'font': {'size': 40, 'color': text_color}},
-            gauge={
-                'axis': {'range': [None, 100], 'tickfont': {'family': 'Arial', 'color': text_color}},
-                'bar': {'color': "#667eea"},
-                'bgcolor': bg_color,
-                'borderwidth': 2,
-                'bordercolor': grid_color,
-                'steps': [
-                    {'range': [0, 33], 'color': '#ffebee' if not is_dark else '#4a1a1a'},
-                    {'range': [33, 66], 'color': '#fff9c4' if not is_dark else '#4a4a1a'},
-                    {'range': [66, 100], 'color': '#e8f5e9' if not is_dark else '#1a4a1a'}
-                ],
-                'threshold': {
-                    'line': {'color': "#43e97b", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 100
-                }
-            }
-        ))
-        
-        fig_gauge.update_layout(
-            height=350,
-            margin=dict(l=20, r=20, t=50, b=20),
-            font={'family': 'Arial', 'size': 14, 'color': text_color},
-            paper_bgcolor=bg_color
-        )
-        
-        st.plotly_chart(fig_gauge, use_container_width=True)
+        st.plotly_chart(figures['gauge'], use_container_width=True)
     
     # Statistics summary
     col1, col2, col3 = st.columns(3)
@@ -230,92 +397,8 @@ def show():
     # Penalty exposure bar chart
     st.subheader("Penalty Exposure Analysis")
     
-    # Create penalty breakdown
-    penalty_breakdown = {}
-    for req in analysis['gaps']:
-        oblig_type = req.get('obligation_type', 'general')
-        penalty_amt = req.get('penalty_amount', 0)
-        
-        if oblig_type not in penalty_breakdown:
-            penalty_breakdown[oblig_type] = {
-                'count': 0,
-                'total_exposure': 0,
-                'max_penalty': 0
-            }
-        
-        penalty_breakdown[oblig_type]['count'] += 1
-        penalty_breakdown[oblig_type]['total_exposure'] += penalty_amt
-        penalty_breakdown[oblig_type]['max_penalty'] = max(
-            penalty_breakdown[oblig_type]['max_penalty'], 
-            penalty_amt
-        )
-    
-    if penalty_breakdown:
-        # Create bar chart data
-        categories = []
-        exposures = []
-        colors_bar = []
-        
-        color_map = {
-            'security': '#667eea',
-            'breach': '#764ba2',
-            'children': '#f093fb',
-            'notice': '#4facfe',
-            'rights': '#00f2fe',
-            'retention': '#43e97b',
-            'sdf': '#f6d365',
-            'general': '#fda085'
-        }
-        
-        for oblig_type, data in sorted(penalty_breakdown.items(), key=lambda x: x[1]['total_exposure'], reverse=True):
-            categories.append(oblig_type.title())
-            exposures.append(data['total_exposure'] / 10_000_000)  # Convert to crores
-            colors_bar.append(color_map.get(oblig_type, '#667eea'))
-        
-        fig_bar = go.Figure()
-        
-        fig_bar.add_trace(go.Bar(
-            x=categories,
-            y=exposures,
-            name='Total Exposure (Rs. Cr)',
-            marker=dict(color=colors_bar, line=dict(color=text_color, width=1)),
-            text=[f"Rs. {e:.0f} Cr" for e in exposures],
-            textposition='auto',
-            textfont=dict(family='Arial', size=11, color=text_color),
-            hovertemplate='<b>%{x}</b><br>Exposure: Rs. %{y:.0f} Cr<br><extra></extra>'
-        ))
-        
-        fig_bar.update_layout(
-            title=dict(
-                text="Penalty Exposure by Requirement Type",
-                font=dict(family='Arial', size=16, color=text_color)
-            ),
-            xaxis=dict(
-                title=dict(
-                    text="Requirement Type",
-                    font=dict(color=text_color)
-                ),
-                tickangle=-45,
-                tickfont=dict(family='Arial', size=11, color=text_color),
-                gridcolor=grid_color
-            ),
-            yaxis=dict(
-                title=dict(
-                    text="Total Penalty Exposure (Rs. Crore)",
-                    font=dict(color=text_color)
-                ),
-                tickfont=dict(family='Arial', color=text_color),
-                gridcolor=grid_color
-            ),
-            height=400,
-            margin=dict(l=50, r=50, t=60, b=100),
-            font=dict(family='Arial', color=text_color),
-            showlegend=False,
-            hovermode='x unified',
-            paper_bgcolor=bg_color,
-            plot_bgcolor=bg_color
-        )
-        
+    fig_bar = figures['bar']
+    if fig_bar is not None:
         st.plotly_chart(fig_bar, use_container_width=True)
     
     st.markdown("---")
@@ -323,18 +406,7 @@ def show():
     # Top priorities
     st.subheader("Top 10 Priority Requirements")
     
-    priorities_data = []
-    for req in analysis['priority_requirements'][:10]:
-        priorities_data.append({
-            'Priority': f"{req['priority_score']:.1f}/100",
-            'Rule': req['rule_number'],
-            'Type': req['obligation_type'].title(),
-            'Penalty': f"Rs. {req['penalty_amount'] / 10_000_000:.0f} Cr",
-            'Days Left': req['days_remaining'],
-            'Description': req['requirement_text'][:80] + "..."
-        })
-    
-    df_priorities = pd.DataFrame(priorities_data)
+    df_priorities = build_priority_table(cache_key, analysis)
     st.dataframe(df_priorities, use_container_width=True, hide_index=True)
     
     st.markdown("---")
@@ -359,6 +431,7 @@ def show():
                 profile = get_business_profile(business_id)
                 profile.update(answers)
                 
+                from src.assessment.report_generator import export_to_excel
                 export_to_excel(profile, analysis, str(filepath))
                 
                 # Provide download
@@ -0,0 +1,277 @@
+"""
+Dashboard Profiling
+cProfile around each page's show(), saved per rerun, with a summary in the app
+
+Opt in with ?profile=1 or DPDPA_PROFILE=1. Each rerun of the current page
+is profiled, written to data/cache/profiles/ as a pstats file (open with
+`python -m pstats` or snakeviz) and summarized at the bottom of the page:
+time by library (plotly, pandas, sqlite3, streamlit, imports, project code), the
+top functions by cumulative time, and recent rerun times per page.
+
+Usage:
+    from src.dashboard import profiling
+
+    if profiling.is_enabled():
+        profiling.run_profiled("results", results.show)
+    else:
+        results.show()
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+import streamlit as st
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+PROFILE_DIR = project_root / "data" / "cache" / "profiles"
+
+# Saved profiles kept on disk (oldest deleted first)
+MAX_PROFILES = 200
+
+# Functions listed in the in-app summary
+TOP_N = 25
+
+# Reruns remembered for the per-page table (process-wide)
+HISTORY_SIZE = 100
+
+# A function belongs to the first library whose marker appears in its file
+# path (or, for C functions, its name)
+LIBRARY_MARKERS = [
+    ('imports', ('<frozen importlib', 'marshal.loads', '_imp.')),
+    ('plotly', ('/plotly/', '/_plotly_utils/')),
+    ('pandas', ('/pandas/',)),
+    ('numpy', ('/numpy/',)),
+    ('sqlite3', ('sqlite3',)),
+    ('streamlit', ('/streamlit/',)),
+    ('project', (str(project_root / "src"), str(project_root / "app.py"))),
+]
+
+_history = deque(maxlen=HISTORY_SIZE)
+_history_lock = threading.Lock()
+
+# One cProfile at a time per process: from Python 3.12 it is built on
+# sys.monitoring, and enabling a second profiler raises ValueError
+_profiler_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    """Profiling requested by ?profile=1 or DPDPA_PROFILE=1"""
+    return st.query_params.get("profile") == "1" or os.environ.get('DPDPA_PROFILE') == '1'
+
+
+def _library(filename: str, function: str) -> str:
+    target = function if filename == '~' else filename.replace('\\', '/')
+    for label, markers in LIBRARY_MARKERS:
+        if any(marker.replace('\\', '/') in target for marker in markers):
+            return label
+    return 'other'
+
+
+def _function_label(filename: str, line: int, function: str) -> str:
+    if filename == '~':
+        return function  # C function, e.g. <method 'execute' of 'sqlite3.Cursor' objects>
+    path = filename.replace('\\', '/')
+    root = str(project_root).replace('\\', '/') + '/'
+    if path.startswith(root):
+        path = path[len(root):]
+    elif '/site-packages/' in path:
+        path = path.split('/site-packages/', 1)[1]
+    return f"{path}:{line}({function})"
+
+
+def _attribute_libraries(stats: pstats.Stats) -> Dict[tuple, str]:
+    """
+    Library for every function, with stdlib and C functions (e.g. re, typing,
+    marshal) attributed to the library of their most expensive caller
+    """
+    own = {func: _library(func[0], func[2]) for func in stats.stats}
+    resolved = {}
+
+    def resolve(func, seen):
+        if func in resolved:
+            return resolved[func]
+        library = own.get(func, 'other')
+        if library == 'other' and func not in seen:
+            callers = stats.stats[func][4] if func in stats.stats else {}
+            if callers:
+                caller = max(callers, key=lambda c: callers[c][3])
+                library = resolve(caller, seen | {func})
+        resolved[func] = library
+        return library
+
+    for func in stats.stats:
+        resolve(func, frozenset())
+    return resolved
+
+
+def summarize_profile(stats: pstats.Stats, elapsed_ms: float, top: int = TOP_N) -> Dict[str, Any]:
+    """
+    Time per library and top functions of a profile
+
+    Library times are self time, with stdlib and C functions counted under
+    the library that called them, so the shares add up to the whole rerun.
+
+    Returns:
+        Dictionary with by_library (library, self_ms, share) and functions
+        (function, library, calls, self_ms, cumulative_ms), both largest first
+    """
+    libraries = _attribute_libraries(stats)
+    by_library = {}
+    functions = []
+    for func, (_, calls, own, cumulative, _) in stats.stats.items():
+        filename, line, function = func
+        library = libraries[func]
+        by_library[library] = by_library.get(library, 0.0) + own
+        functions.append({
+            'function': _function_label(filename, line, function),
+            'library': library,
+            'calls': calls,
+            'self_ms': round(own * 1000, 2),
+            'cumulative_ms': round(cumulative * 1000, 2)
+        })
+
+    total = sum(by_library.values()) or 1.0
+    return {
+        'by_library': [
+            {'library': library, 'self_ms': round(seconds * 1000, 2), 'share': seconds / total}
+            for library, seconds in sorted(by_library.items(), key=lambda item: item[1], reverse=True)
+        ],
+        'functions': sorted(functions, key=lambda row: row['cumulative_ms'], reverse=True)[:top]
+    }
+
+
+def save_profile(profiler: cProfile.Profile, page: str, elapsed_ms: float) -> Path:
+    """Write a pstats file for one rerun and prune old ones"""
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    path = PROFILE_DIR / f"{timestamp}_{page}_{elapsed_ms:.0f}ms.prof"
+    profiler.dump_stats(str(path))
+
+    saved = sorted(PROFILE_DIR.glob("*.prof"))
+    for old in saved[:max(len(saved) - MAX_PROFILES, 0)]:
+        old.unlink(missing_ok=True)
+    return path
+
+
+def run_profiled(page: str, show: Callable[[], None]) -> None:
+    """
+    Run a page's show() under cProfile, save the profile and render a summary
+
+    Streamlit control flow (st.rerun, st.stop) still ends the run; the
+    profile is saved, but the summary only renders when show() returns.
+    Only one rerun per process is profiled at a time; an overlapping
+    rerun (another session, or DPDPA_PROFILE=1 under load) runs show()
+    unprofiled with a caption saying so.
+    """
+    if not _profiler_lock.acquire(blocking=False):
+        st.caption("Profiler busy with another rerun; this rerun was not profiled")
+        show()
+        return
+
+    profiler = cProfile.Profile()
+    start = perf_counter()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiling tool (e.g. a debugger or coverage) holds the hook
+        _profiler_lock.release()
+        st.caption("Another profiler is active in this process; this rerun was not profiled")
+        show()
+        return
+    try:
+        show()
+    finally:
+        profiler.disable()
+        _profiler_lock.release()
+        elapsed_ms = (perf_counter() - start) * 1000
+        path = save_profile(profiler, page, elapsed_ms)
+        run = {
+            'page': page,
+            'time': datetime.now().strftime("%H:%M:%S"),
+            'elapsed_ms': round(elapsed_ms, 1),
+            'path': path
+        }
+        with _history_lock:
+            _history.append(run)
+
+    show_profile_summary(run, summarize_profile(pstats.Stats(profiler), elapsed_ms))
+
+
+def get_history(page: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Recent profiled reruns, newest first (optionally for one page)"""
+    with _history_lock:
+        runs = list(_history)
+    return [run for run in reversed(runs) if page is None or run['page'] == page]
+
+
+def page_latency() -> List[Dict[str, Any]]:
+    """Rerun count, median and max time per page from the recent history"""
+    by_page = {}
+    for run in get_history():
+        by_page.setdefault(run['page'], []).append(run['elapsed_ms'])
+
+    rows = []
+    for page, times in sorted(by_page.items()):
+        ordered = sorted(times)
+        rows.append({
+            'Page': page,
+            'Reruns': len(times),
+            'Median (ms)': ordered[len(ordered) // 2],
+            'Max (ms)': ordered[-1]
+        })
+    return rows
+
+
+def show_profile_summary(run: Dict[str, Any], summary: Dict[str, Any]) -> None:
+    """Expander with the profile of this rerun"""
+    with st.expander(f"Profile: {run['page']} rerun took {run['elapsed_ms']:.0f} ms", expanded=False):
+        st.caption(f"Saved to {run['path']}")
+
+        st.markdown("**Time by library** (stdlib and C calls count under their caller)")
+        st.dataframe(
+            [
+                {'Library': row['library'], 'Time (ms)': row['self_ms'], 'Share': f"{row['share']:.0%}"}
+                for row in summary['by_library']
+            ],
+            use_container_width=True,
+            hide_index=True
+        )
+
+        st.markdown(f"**Top {len(summary['functions'])} functions** (cumulative time)")
+        st.dataframe(
+            [
+                {
+                    'Function': row['function'],
+                    'Library': row['library'],
+                    'Calls': row['calls'],
+                    'Self (ms)': row['self_ms'],
+                    'Cumulative (ms)': row['cumulative_ms']
+                }
+                for row in summary['functions']
+            ],
+            use_container_width=True,
+            hide_index=True
+        )
+
+        st.markdown("**Recent reruns by page**")
+        st.dataframe(page_latency(), use_container_width=True, hide_index=True)
+
+        st.download_button(
+            "Download profile (.prof)",
+            data=Path(run['path']).read_bytes(),
+            file_name=Path(run['path']).name,
+            mime="application/octet-stream",
+            help="Open with python -m pstats or snakeviz",
+            key="dl_profile"
+        )
@@ -0,0 +1,167 @@
+"""
+Session State Footprint
+Bytes held in st.session_state per browser session, for sizing the dashboard server
+
+The pickled size of each session's state is sampled at most once per
+SAMPLE_INTERVAL_SECONDS per session (app.py calls record_session_size()
+before routing, and forces a sample under ?admin=1), so ordinary reruns
+don't pay for pickling every value. show_session_admin() (sidebar,
+?admin=1) lists the largest keys of the current session and the sizes of
+all sessions seen recently in this process; the totals are also exported
+as the dpdpa_session_state_bytes and dpdpa_dashboard_sessions gauges.
+
+Assessments are kept in session state as handles (see
+cache.make_assessment_handle()), so a typical session is a few KB; a key
+that grows well beyond that is worth moving into a shared cache.
+
+Usage:
+    from src.dashboard.session_stats import record_session_size, show_session_admin
+
+    record_session_size()     # every rerun; measures when the sample is due
+    show_session_admin()      # sidebar panel
+"""
+
+import pickle
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.metrics import DASHBOARD_SESSIONS, SESSION_STATE_BYTES
+
+# Sessions without a rerun for this long are dropped from the table
+SESSION_TTL_SECONDS = 3600
+
+# Minimum seconds between two measurements of the same session
+SAMPLE_INTERVAL_SECONDS = 60
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def measure_state(state: Optional[Any] = None) -> List[Dict[str, Any]]:
+    """
+    Size of each session-state key, largest first
+
+    Values are measured pickled (what they cost to hold and copy); values
+    that can't be pickled (e.g. a running job's future) fall back to
+    sys.getsizeof(), which only counts the outer object.
+
+    Returns:
+        Rows with key, bytes and pickled (False for the fallback)
+    """
+    state = st.session_state if state is None else state
+    rows = []
+    for key in list(state.keys()):
+        value = state[key]
+        try:
+            size, pickled = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)), True
+        except Exception:
+            size, pickled = sys.getsizeof(value), False
+        rows.append({'key': str(key), 'bytes': size, 'pickled': pickled})
+    return sorted(rows, key=lambda row: row['bytes'], reverse=True)
+
+
+def record_session_size(force: bool = False) -> Optional[int]:
+    """
+    Measure the current session's state and update the process-wide table
+
+    Sessions measured less than SAMPLE_INTERVAL_SECONDS ago are skipped.
+
+    Args:
+        force: Measure even if the last sample is recent (e.g. ?admin=1)
+
+    Returns:
+        Total bytes (the last sample's when skipped), or None outside a
+        Streamlit script run
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    if ctx is None:
+        return None
+
+    now = time.time()
+    with _sessions_lock:
+        last = _sessions.get(ctx.session_id)
+    if last is not None and not force and now - last['updated'] < SAMPLE_INTERVAL_SECONDS:
+        return last['bytes']
+
+    rows = measure_state()
+    total = sum(row['bytes'] for row in rows)
+    with _sessions_lock:
+        _sessions[ctx.session_id] = {
+            'bytes': total,
+            'keys': len(rows),
+            'largest_key': rows[0]['key'] if rows else '',
+            'updated': now
+        }
+        for session_id in [s for s, info in _sessions.items() if now - info['updated'] > SESSION_TTL_SECONDS]:
+            del _sessions[session_id]
+        sizes = [info['bytes'] for info in _sessions.values()]
+
+    DASHBOARD_SESSIONS.set(len(sizes))
+    SESSION_STATE_BYTES.set(sum(sizes), stat='total')
+    SESSION_STATE_BYTES.set(max(sizes), stat='max')
+    SESSION_STATE_BYTES.set(sum(sizes) / len(sizes), stat='mean')
+    return total
+
+
+def get_session_sizes() -> List[Dict[str, Any]]:
+    """Recently active sessions in this process, largest first"""
+    now = time.time()
+    with _sessions_lock:
+        sessions = list(_sessions.items())
+    return [
+        {
+            'session': session_id[:8],
+            'bytes': info['bytes'],
+            'keys': info['keys'],
+            'largest_key': info['largest_key'],
+            'sample_age_s': round(now - info['updated'])
+        }
+        for session_id, info in sorted(sessions, key=lambda item: item[1]['bytes'], reverse=True)
+    ]
+
+
+def show_session_admin() -> None:
+    """Sidebar panel with bytes per session and this session's largest keys"""
+    with st.sidebar.expander("Session state", expanded=False):
+        rows = measure_state()
+        st.caption(f"This session: {sum(row['bytes'] for row in rows):,} bytes in {len(rows)} keys")
+        st.dataframe(
+            [
+                {'Key': row['key'], 'Bytes': row['bytes'], 'Pickled': row['pickled']}
+                for row in rows
+            ],
+            use_container_width=True,
+            hide_index=True
+        )
+
+        sessions = get_session_sizes()
+        if sessions:
+            total = sum(row['bytes'] for row in sessions)
+            st.caption(
+                f"{len(sessions)} sessions in the last {SESSION_TTL_SECONDS // 60} min: "
+                f"{total:,} bytes total, {total // len(sessions):,} per session on average"
+            )
+            st.dataframe(
+                [
+                    {
+                        'Session': row['session'],
+                        'Bytes': row['bytes'],
+                        'Keys': row['keys'],
+                        'Largest key': row['largest_key'],
+                        'Sample age (s)': row['sample_age_s']
+                    }
+                    for row in sessions
+                ],
+                use_container_width=True,
+                hide_index=True
+            )
@@ -0,0 +1,153 @@
+"""
+Dashboard Startup Probe
+Measures the cold import cost of each dashboard page with `python -X importtime`
+
+Each page is imported in a fresh interpreter after streamlit itself, so the
+reported time is what routing to that page adds on a cold container. Heavy
+optional dependencies (pandas, plotly, python-docx, reportlab, ...) that a
+page pulls in at import time are listed; they should only load when a
+page actually renders a chart, table or document.
+
+Usage:
+    python src/dashboard/startup_probe.py [--repeats 3] [--json]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Any, List
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# Route name (?page=...) -> page module, as in app.py
+PAGES = {
+    'home': 'src.dashboard.pages.home',
+    'assessment': 'src.dashboard.pages.assessment',
+    'results': 'src.dashboard.pages.results',
+    'documents': 'src.dashboard.pages.documents',
+    'reference': 'src.dashboard.pages.dpdpa_ref',
+    'about': 'src.dashboard.pages.about',
+}
+
+BASELINE_MODULE = 'streamlit'
+
+HEAVY_MODULES = ('pandas', 'numpy', 'pyarrow', 'plotly', 'docx', 'reportlab', 'openpyxl', 'fitz')
+
+
+def parse_importtime(stderr: str) -> List[tuple]:
+    """
+    Parse `-X importtime` output
+
+    Returns:
+        List of (depth, module, self_us, cumulative_us) in output order
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((depth, name.strip(), int(self_us), int(cumulative_us)))
+    return entries
+
+
+def probe_module(module: str, baseline: str = BASELINE_MODULE) -> Dict[str, Any]:
+    """
+    Import a module in a fresh interpreter (after the baseline) and measure it
+
+    Returns:
+        Dictionary with import_ms, heavy (heavy top-level packages loaded)
+        and top_imports [(module, ms)] of the module's direct imports
+    """
+    code = f"import {baseline}; import {module}" if baseline else f"import {module}"
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=project_root, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+
+    entries = parse_importtime(completed.stderr)
+
+    # Everything after the baseline's own top-level line belongs to the module
+    start = 0
+    if baseline:
+        for index, (depth, name, _, _) in enumerate(entries):
+            if depth == 0 and name == baseline:
+                start = index + 1
+                break
+    entries = entries[start:]
+
+    total_us = sum(cumulative for depth, _, _, cumulative in entries if depth == 0)
+    loaded = {name.split('.')[0] for _, name, _, _ in entries}
+    direct = sorted(
+        ((name, cumulative / 1000) for depth, name, _, cumulative in entries if depth == 1),
+        key=lambda item: item[1], reverse=True
+    )
+
+    return {
+        'import_ms': total_us / 1000,
+        'heavy': sorted(loaded.intersection(HEAVY_MODULES)),
+        'top_imports': direct[:3]
+    }
+
+
+def probe_pages(repeats: int = 3) -> Dict[str, Any]:
+    """
+    Probe streamlit and every page, keeping the fastest of several runs
+
+    Returns:
+        {'baseline_ms': float, 'pages': {route: probe result}}
+    """
+    baseline_ms = min(probe_module(BASELINE_MODULE, baseline=None)['import_ms'] for _ in range(repeats))
+
+    pages = {}
+    for route, module in PAGES.items():
+        runs = [probe_module(module) for _ in range(repeats)]
+        pages[route] = min(runs, key=lambda run: run['import_ms'])
+        pages[route]['module'] = module
+
+    return {'baseline_ms': baseline_ms, 'pages': pages}
+
+
+def main():
+    """Print the per-page import cost table"""
+    parser = argparse.ArgumentParser(description="Measure cold import cost of dashboard pages")
+    parser.add_argument('--repeats', type=int, default=3, help="Runs per page (fastest is kept)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = probe_pages(args.repeats)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print("=" * 70)
+    print("DASHBOARD STARTUP PROBE (python -X importtime)")
+    print("=" * 70)
+    print()
+    print(f"  {BASELINE_MODULE} (baseline): {results['baseline_ms']:.0f} ms")
+    print()
+    print(f"  {'Page':12s} {'Import (ms)':>11s}   Heavy modules at import")
+    print("  " + "-" * 66)
+    for route, result in results['pages'].items():
+        heavy = ', '.join(result['heavy']) or '-'
+        print(f"  {route:12s} {result['import_ms']:11.0f}   {heavy}")
+    print()
+
+    print("  Largest direct imports per page:")
+    for route, result in results['pages'].items():
+        top = ', '.join(f"{name} {ms:.0f}ms" for name, ms in result['top_imports'])
+        print(f"    {route:12s} {top}")
+    print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
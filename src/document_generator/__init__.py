@@ -7,9 +7,27 @@ from .generator import DocumentGenerator, DocumentGenerationError
 from .constants import DATA_TYPE_DISPLAY_NAMES, RETENTION_REQUIREMENTS, LEGAL_BASIS_MAP
 from .validators import validate_profile, sanitize_input, ValidationError
 
+# PDF output is optional (only available when reportlab is installed) and
+# loaded on first access, so importing the package doesn't pull in reportlab
+_PDF_EXPORTS = ('PdfRenderer', 'register_font', 'benchmark_pdf_vs_docx')
+
+def __getattr__(name):
+    if name in _PDF_EXPORTS:
+        try:
+            from . import pdf_renderer
+            value = getattr(pdf_renderer, name)
+        except ImportError:
+            value = None
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'DocumentGenerator',
     'DocumentGenerationError',
+    'PdfRenderer',
+    'register_font',
+    'benchmark_pdf_vs_docx',
     'validate_profile',
     'sanitize_input',
     'ValidationError',
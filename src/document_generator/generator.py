@@ -20,6 +20,8 @@ from .constants import (
     THIRD_SCHEDULE_THRESHOLDS
 )
 from .validators import validate_profile, sanitize_input, ValidationError
+from ..utils.metrics import DOCUMENTS_GENERATED
+from ..utils.tracing import traced
 
 class DocumentGenerationError(Exception):
     """Raised when document generation fails"""
@@ -76,7 +78,7 @@ class DocumentGenerator:
         if not template_path.exists():
             raise DocumentGenerationError(f"Template not found: {template_path}")
         
-        doc = Document(str(template_path))
+        doc = self._load_template(template_path)
         
         replacements = {
             '{{BUSINESS_NAME}}': self._get_safe_value('business_name'),
@@ -110,7 +112,7 @@ class DocumentGenerator:
         if not template_path.exists():
             raise DocumentGenerationError(f"Template not found: {template_path}")
         
-        doc = Document(str(template_path))
+        doc = self._load_template(template_path)
         
         replacements = {
             '{{BUSINESS_NAME}}': self._get_safe_value('business_name'),
@@ -141,7 +143,7 @@ class DocumentGenerator:
         if not template_path.exists():
             raise DocumentGenerationError(f"Template not found: {template_path}")
         
-        doc = Document(str(template_path))
+        doc = self._load_template(template_path)
         
         replacements = {
             '{{BUSINESS_NAME}}': self._get_safe_value('business_name'),
@@ -170,7 +172,7 @@ class DocumentGenerator:
         if not template_path.exists():
             raise DocumentGenerationError(f"Template not found: {template_path}")
         
-        doc = Document(str(template_path))
+        doc = self._load_template(template_path)
         
         # Populate retention table
         self._populate_retention_table(doc)
@@ -201,7 +203,7 @@ class DocumentGenerator:
         if not template_dpb.exists():
             raise DocumentGenerationError(f"Template not found: {template_dpb}")
         
-        doc_dpb = Document(str(template_dpb))
+        doc_dpb = self._load_template(template_dpb)
         
         replacements_dpb = {
             '{{BUSINESS_NAME}}': self._get_safe_value('business_name'),
@@ -225,7 +227,7 @@ class DocumentGenerator:
         if not template_users.exists():
             raise DocumentGenerationError(f"Template not found: {template_users}")
         
-        doc_users = Document(str(template_users))
+        doc_users = self._load_template(template_users)
         
         replacements_users = {
             '{{BUSINESS_NAME}}': self._get_safe_value('business_name'),
@@ -259,7 +261,7 @@ class DocumentGenerator:
         if not template_path.exists():
             raise DocumentGenerationError(f"Template not found: {template_path}")
         
-        doc = Document(str(template_path))
+        doc = self._load_template(template_path)
         
         replacements = {
             '{{BUSINESS_NAME}}': self._get_safe_value('business_name'),
@@ -354,6 +356,7 @@ class DocumentGenerator:
         
         return doc
     
+    @traced('docs.generate')
     def generate_all_required_documents(self) -> Dict[str, Document]:
         """
         Generate all documents required based on profile and gaps.
@@ -406,6 +409,7 @@ class DocumentGenerator:
         
         return filepath
     
+    @traced('docs.zip')
     def export_all_to_zip(self, documents: Dict[str, Document], zip_filename: str) -> Path:
         """
         Export all documents to ZIP file.
@@ -428,7 +432,45 @@ class DocumentGenerator:
                 zipf.write(temp_path, f"{doc_name}.docx")
         
         return zip_path
-    
+
+    def export_to_pdf(self, document: Document, filename: str) -> Path:
+        """
+        Export document to PDF file (rendered with reportlab).
+
+        Args:
+            document: Document object to export
+            filename: Output filename
+
+        Returns:
+            Path to exported file
+        """
+        from .pdf_renderer import PdfRenderer
+
+        output_dir = Path("data/processed/generated_documents")
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        filepath = output_dir / filename
+        filepath.write_bytes(PdfRenderer().render(document, title=Path(filename).stem))
+
+        return filepath
+
+    @traced('docs.pdf_zip')
+    def export_all_to_pdf_zip(self, documents: Dict[str, Document], zip_filename: str) -> Path:
+        """
+        Export all documents as PDFs in a ZIP file.
+
+        Args:
+            documents: Dictionary of document name to Document object
+            zip_filename: Output ZIP filename
+
+        Returns:
+            Path to ZIP file
+        """
+        from .pdf_renderer import PdfRenderer
+
+        output_dir = Path("data/processed/generated_documents")
+        return PdfRenderer().export_pack_to_zip(documents, output_dir / zip_filename)
+
     # ========================================================================
     # PRIVATE HELPER METHODS
     # ========================================================================
@@ -589,6 +631,12 @@ Penalty: Rs. 50 crore"""
         
         return LEGAL_BASIS_MAP['consent']
     
+    @traced('docs.template_load')
+    def _load_template(self, template_path: Path) -> Document:
+        """Open a .docx template"""
+        return Document(str(template_path))
+    
+    @traced('docs.placeholders')
     def _replace_all_placeholders(self, doc: Document, replacements: Dict[str, str]):
         """Replace placeholders throughout document"""
         # Paragraphs
@@ -678,7 +726,9 @@ Penalty: Rs. 50 crore"""
             row.cells[3].text = '48-hour warning + user confirmation'
 
     def _add_document_metadata(self, doc: Document, doc_name: str, rule_ref: str):
-        """Add metadata footer"""
+        """Add metadata footer (every generated document gets one, so it is counted here)"""
+        DOCUMENTS_GENERATED.inc(document=doc_name)
+        
         section = doc.sections[0]
         footer = section.footer
         
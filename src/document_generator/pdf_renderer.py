@@ -0,0 +1,363 @@
+"""
+PDF renderer for generated DPDP documents.
+Converts the python-docx Document objects produced by DocumentGenerator into
+PDF using reportlab, without requiring LibreOffice or Word.
+
+Usage:
+    renderer = PdfRenderer()
+    pdf_bytes = renderer.render(document)
+    pack = renderer.render_pack(generator.generate_all_required_documents())
+"""
+
+from io import BytesIO
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Iterator, Optional
+from xml.sax.saxutils import escape
+import zipfile
+
+from docx.document import Document as DocxDocument
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.table import Table as DocxTable
+from docx.text.paragraph import Paragraph as DocxParagraph
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Flowable, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from .generator import DocumentGenerationError
+
+# Body tags in the WordprocessingML namespace
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_TAG_PARAGRAPH = f'{_W_NS}p'
+_TAG_TABLE = f'{_W_NS}tbl'
+
+_ALIGNMENT_MAP = {
+    WD_ALIGN_PARAGRAPH.CENTER: TA_CENTER,
+    WD_ALIGN_PARAGRAPH.RIGHT: TA_RIGHT,
+    WD_ALIGN_PARAGRAPH.JUSTIFY: TA_JUSTIFY,
+}
+
+# Fonts registered once per process and shared by every renderer
+_REGISTERED_FONTS: Dict[str, str] = {}
+
+# Stylesheets built once per font family and shared by every renderer
+_STYLESHEETS: Dict[str, Dict[str, ParagraphStyle]] = {}
+
+
+def register_font(font_name: str, ttf_path: Path) -> str:
+    """
+    Register a TrueType font with reportlab (once per process).
+
+    Use this for a font that covers the Rupee sign or Indic scripts; the
+    built-in Helvetica family only covers Latin-1.
+
+    Args:
+        font_name: Name to register the font under
+        ttf_path: Path to the .ttf file
+
+    Returns:
+        The registered font name
+    """
+    if font_name not in _REGISTERED_FONTS:
+        ttf_path = Path(ttf_path)
+        if not ttf_path.exists():
+            raise DocumentGenerationError(f"Font file not found: {ttf_path}")
+        pdfmetrics.registerFont(TTFont(font_name, str(ttf_path)))
+        _REGISTERED_FONTS[font_name] = str(ttf_path)
+    return font_name
+
+
+def get_stylesheet(font_name: str = 'Helvetica') -> Dict[str, ParagraphStyle]:
+    """Return the cached paragraph styles (read-only once built) for a font family"""
+    if font_name in _STYLESHEETS:
+        return _STYLESHEETS[font_name]
+
+    base = getSampleStyleSheet()
+    bold_font = 'Helvetica-Bold' if font_name == 'Helvetica' else font_name
+
+    styles = {
+        'Normal': ParagraphStyle(
+            'DPDPNormal', parent=base['Normal'], fontName=font_name,
+            fontSize=10, leading=13, spaceAfter=4, alignment=TA_LEFT
+        ),
+        'Title': ParagraphStyle(
+            'DPDPTitle', parent=base['Title'], fontName=bold_font,
+            fontSize=18, leading=22, spaceAfter=12
+        ),
+        'Heading 1': ParagraphStyle(
+            'DPDPHeading1', parent=base['Heading1'], fontName=bold_font,
+            fontSize=15, leading=19, spaceBefore=8, spaceAfter=6
+        ),
+        'Heading 2': ParagraphStyle(
+            'DPDPHeading2', parent=base['Heading2'], fontName=bold_font,
+            fontSize=12, leading=15, spaceBefore=6, spaceAfter=4
+        ),
+        'Heading 3': ParagraphStyle(
+            'DPDPHeading3', parent=base['Heading3'], fontName=bold_font,
+            fontSize=11, leading=14, spaceBefore=4, spaceAfter=3
+        ),
+        'TableCell': ParagraphStyle(
+            'DPDPTableCell', parent=base['Normal'], fontName=font_name,
+            fontSize=8.5, leading=10.5
+        ),
+        'Footer': ParagraphStyle(
+            'DPDPFooter', parent=base['Normal'], fontName=font_name,
+            fontSize=6.5, leading=8, textColor=colors.grey, alignment=TA_CENTER
+        ),
+    }
+
+    # Alignment variants are built here so the shared stylesheet is never
+    # written to while documents render concurrently
+    for style in list(styles.values()):
+        for alignment in set(_ALIGNMENT_MAP.values()) - {style.alignment}:
+            variant = f'{style.name}-{alignment}'
+            styles[variant] = ParagraphStyle(variant, parent=style, alignment=alignment)
+
+    _STYLESHEETS[font_name] = styles
+    return styles
+
+
+class PdfRenderer:
+    """
+    Render python-docx documents to PDF via a reportlab flowables pipeline.
+
+    Body elements are converted to a list of flowables in reading order
+    (reportlab's build() consumes a list) and the PDF is written into an
+    in-memory buffer. Fonts and styles are shared across all documents
+    rendered in the process.
+
+    Usage:
+        renderer = PdfRenderer()
+        pdf_bytes = renderer.render(doc)
+        zip_path = renderer.export_pack_to_zip(documents, 'output_dir/pack.zip')
+    """
+
+    def __init__(self, font_name: str = 'Helvetica', pagesize=A4):
+        """
+        Initialize renderer.
+
+        Args:
+            font_name: Built-in or previously registered font family
+            pagesize: reportlab page size tuple
+        """
+        if font_name != 'Helvetica' and font_name not in _REGISTERED_FONTS:
+            raise DocumentGenerationError(
+                f"Font not registered: {font_name}. Call register_font() first."
+            )
+
+        self.font_name = font_name
+        self.pagesize = pagesize
+        self.styles = get_stylesheet(font_name)
+
+    def render(self, document: DocxDocument, title: str = '') -> bytes:
+        """
+        Render a single document to PDF.
+
+        Args:
+            document: python-docx Document object
+            title: Optional PDF title metadata
+
+        Returns:
+            PDF file contents
+        """
+        buffer = BytesIO()
+        footer_lines = self._footer_lines(document)
+
+        pdf = SimpleDocTemplate(
+            buffer,
+            pagesize=self.pagesize,
+            leftMargin=20 * mm,
+            rightMargin=20 * mm,
+            topMargin=18 * mm,
+            bottomMargin=(18 + 3 * len(footer_lines)) * mm if footer_lines else 18 * mm,
+            title=title,
+            author='DPDPA Compliance Dashboard'
+        )
+
+        def draw_footer(canvas, doc_template):
+            if not footer_lines:
+                return
+            canvas.saveState()
+            style = self.styles['Footer']
+            canvas.setFont(style.fontName, style.fontSize)
+            canvas.setFillColor(style.textColor)
+            y = 10 * mm + (len(footer_lines) - 1) * style.leading
+            for line in footer_lines:
+                canvas.drawCentredString(self.pagesize[0] / 2, y, line)
+                y -= style.leading
+            canvas.restoreState()
+
+        try:
+            pdf.build(list(self.iter_flowables(document)), onFirstPage=draw_footer, onLaterPages=draw_footer)
+        except Exception as e:
+            raise DocumentGenerationError(f"PDF rendering failed: {e}") from e
+
+        return buffer.getvalue()
+
+    def render_pack(self, documents: Dict[str, DocxDocument]) -> Dict[str, bytes]:
+        """
+        Render a whole document pack.
+
+        Args:
+            documents: Dictionary of document name to Document object
+                (as returned by DocumentGenerator.generate_all_required_documents)
+
+        Returns:
+            Dictionary of document name to PDF bytes
+        """
+        return {
+            doc_name: self.render(doc, title=doc_name.split('_', 1)[-1].replace('_', ' '))
+            for doc_name, doc in documents.items()
+        }
+
+    def export_pack_to_zip(self, documents: Dict[str, DocxDocument], zip_path: Path) -> Path:
+        """
+        Render a document pack and write all PDFs into a ZIP file.
+
+        Args:
+            documents: Dictionary of document name to Document object
+            zip_path: Output ZIP path
+
+        Returns:
+            Path to ZIP file
+        """
+        zip_path = Path(zip_path)
+        zip_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for doc_name, doc in documents.items():
+                zipf.writestr(f"{doc_name}.pdf", self.render(doc, title=doc_name))
+
+        return zip_path
+
+    def iter_flowables(self, document: DocxDocument) -> Iterator[Flowable]:
+        """Yield flowables for the document body in reading order"""
+        # Resolve style ids once per document; paragraph.style walks the whole styles part
+        style_names = {style.style_id: style.name for style in document.styles}
+
+        for element in document.element.body.iterchildren():
+            if element.tag == _TAG_PARAGRAPH:
+                paragraph = DocxParagraph(element, document)
+                yield self._paragraph_flowable(paragraph, style_names.get(element.style, 'Normal'))
+            elif element.tag == _TAG_TABLE:
+                yield self._table_flowable(DocxTable(element, document))
+
+    # ========================================================================
+    # PRIVATE HELPER METHODS
+    # ========================================================================
+
+    def _paragraph_flowable(self, paragraph: DocxParagraph, style_name: str) -> Flowable:
+        """Convert a docx paragraph to a reportlab Paragraph"""
+        markup = self._runs_to_markup(paragraph)
+        if not markup.strip():
+            return Spacer(1, 6)
+
+        style = self.styles.get(style_name, self.styles['Normal'])
+
+        alignment = _ALIGNMENT_MAP.get(paragraph.alignment)
+        if alignment is not None and alignment != style.alignment:
+            style = self.styles[f'{style.name}-{alignment}']
+
+        return Paragraph(markup, style)
+
+    def _table_flowable(self, table: DocxTable) -> Flowable:
+        """Convert a docx table to a reportlab Table"""
+        cell_style = self.styles['TableCell']
+        data = [
+            [Paragraph(self._cell_markup(cell), cell_style) for cell in row.cells]
+            for row in table.rows
+        ]
+
+        col_count = max((len(row) for row in data), default=1)
+        available_width = self.pagesize[0] - 40 * mm
+        pdf_table = Table(data, colWidths=[available_width / col_count] * col_count, repeatRows=1)
+        pdf_table.setStyle(TableStyle([
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#edf2f7')),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 4),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+        ]))
+        return pdf_table
+
+    def _cell_markup(self, cell) -> str:
+        """Join cell paragraphs into one markup string"""
+        return '<br/>'.join(self._runs_to_markup(p) for p in cell.paragraphs)
+
+    def _runs_to_markup(self, paragraph: DocxParagraph) -> str:
+        """Convert paragraph runs to reportlab inline markup"""
+        parts = []
+        for run in paragraph.runs:
+            if not run.text:
+                continue
+
+            text = escape(run.text).replace('\n', '<br/>').replace('\t', '&nbsp;&nbsp;&nbsp;&nbsp;')
+            if run.bold:
+                text = f'<b>{text}</b>'
+            if run.italic:
+                text = f'<i>{text}</i>'
+            if run.underline:
+                text = f'<u>{text}</u>'
+            if run.font.highlight_color is not None:
+                text = f'<span backColor="#fff59d">{text}</span>'
+            if run.font.size is not None:
+                text = f'<font size="{run.font.size.pt:.1f}">{text}</font>'
+            parts.append(text)
+
+        return ''.join(parts)
+
+    def _footer_lines(self, document: DocxDocument) -> list:
+        """Collect first-section footer text as plain lines"""
+        if not document.sections:
+            return []
+
+        lines = []
+        for paragraph in document.sections[0].footer.paragraphs:
+            lines.extend(line for line in paragraph.text.split('\n') if line.strip())
+        return lines
+
+
+def benchmark_pdf_vs_docx(documents: Dict[str, DocxDocument], iterations: int = 3,
+                          renderer: Optional[PdfRenderer] = None) -> Dict[str, float]:
+    """
+    Compare in-memory PDF rendering against the DOCX save path.
+
+    Args:
+        documents: Document pack from generate_all_required_documents()
+        iterations: Number of timed passes over the pack
+        renderer: Optional renderer (default: Helvetica A4)
+
+    Returns:
+        Dictionary with per-pack timings in seconds and output sizes in bytes
+    """
+    renderer = renderer or PdfRenderer()
+
+    docx_times, pdf_times = [], []
+    docx_bytes = pdf_bytes = 0
+
+    for _ in range(iterations):
+        start = perf_counter()
+        docx_bytes = 0
+        for doc in documents.values():
+            buffer = BytesIO()
+            doc.save(buffer)
+            docx_bytes += buffer.tell()
+        docx_times.append(perf_counter() - start)
+
+        start = perf_counter()
+        pdf_bytes = sum(len(pdf) for pdf in renderer.render_pack(documents).values())
+        pdf_times.append(perf_counter() - start)
+
+    return {
+        'documents': len(documents),
+        'iterations': iterations,
+        'docx_seconds_per_pack': min(docx_times),
+        'pdf_seconds_per_pack': min(pdf_times),
+        'docx_bytes_per_pack': docx_bytes,
+        'pdf_bytes_per_pack': pdf_bytes,
+    }
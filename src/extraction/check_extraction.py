@@ -20,9 +20,9 @@ def main():
     cursor = conn.cursor()
 
     # Check total unique requirements
-    cursor.execute('SELECT COUNT(DISTINCT rule_number || requirement_text) FROM requirements')
+    cursor.execute('SELECT COUNT(DISTINCT rule_number || requirement_text) FROM requirements WHERE is_active = 1')
     unique_count = cursor.fetchone()[0]
-    cursor.execute('SELECT COUNT(*) FROM requirements')
+    cursor.execute('SELECT COUNT(*) FROM requirements WHERE is_active = 1')
     total_count = cursor.fetchone()[0]
     duplicates = total_count - unique_count
     
@@ -42,6 +42,7 @@ def main():
     cursor.execute('''
         SELECT rule_number, COUNT(*) as count 
         FROM requirements 
+        WHERE is_active = 1
         GROUP BY rule_number 
         ORDER BY CAST(SUBSTR(rule_number, 6) AS INTEGER)
     ''')
@@ -88,7 +89,7 @@ def main():
         print()
 
     # Sample requirement text
-    cursor.execute('SELECT rule_number, requirement_text FROM requirements WHERE rule_number = ? LIMIT 1', ('Rule 6(1(a))',))
+    cursor.execute('SELECT rule_number, requirement_text FROM requirements WHERE rule_number = ? AND is_active = 1 LIMIT 1', ('Rule 6(1(a))',))
     sample = cursor.fetchone()
     if sample:
         print("📝 SAMPLE REQUIREMENT")
@@ -0,0 +1,231 @@
+"""
+Regression check and benchmark for the rule tokenizer
+
+Compares the tokenizer-backed extraction in extract_requirements.py with
+the original multi-pass regex implementation (kept below as the reference)
+on the bundled Rules text, then times both on a 10x concatenated corpus.
+The regression part also runs under pytest (tests/unit/test_rule_tokenizer.py).
+
+Usage:
+    python src/extraction/parse_rules.py          # if not run yet
+    python src/extraction/check_tokenizer.py [--repeat 10]
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from time import perf_counter
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.extraction.extract_requirements import (
+    clean_text, extract_rules, extract_subrules, load_pages, _subrule_entries
+)
+from src.extraction.rule_tokenizer import tokenize_rules
+
+# ============================================================================
+# REFERENCE IMPLEMENTATION (multi-pass regex pipeline)
+# ============================================================================
+
+def legacy_clean_text(text: str) -> str:
+    """Remove page markers and noise"""
+    text = re.sub(r'={70,}\s*\r?\n\s*PAGE \d+\s*\r?\n\s*={70,}\s*\r?\n', '\n', text)
+    text = re.sub(r'\[भाग[^\]]*\]\s*\r?\n', '', text)
+    text = re.sub(r'भारत का रािपत्र[^\n]*\r?\n', '', text)
+    text = re.sub(r'THE GAZETTE OF INDIA[^\n]*\r?\n[^\n]*\r?\n', '', text, flags=re.IGNORECASE)
+    text = re.sub(r'^\s*\d+\s*$', '', text, flags=re.MULTILINE)
+    text = re.sub(r'[ \t]+', ' ', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    return text
+
+def legacy_extract_rules(text: str) -> list:
+    """Extract individual rules with their content (Rules 1-16 only, exclude schedules)"""
+    rules = []
+    first_schedule_match = re.search(r'\n\s*FIRST SCHEDULE\s*\n|^FIRST SCHEDULE\s*\n', text, re.IGNORECASE | re.MULTILINE)
+    main_text = text[:first_schedule_match.start()] if first_schedule_match else text
+
+    rule_pattern = r'(\d{1,2})\.\s+([A-Z].*?)\s*\.(?:\s+|)[—–-\u2014\u2013]'
+    rule_starts = []
+    for match in re.finditer(rule_pattern, main_text, re.MULTILINE | re.DOTALL):
+        title = re.sub(r'\s+', ' ', match.group(2).strip()).strip()
+        rule_starts.append((int(match.group(1).strip()), title, match.end(), match.start()))
+
+    for i, (rule_num, title, content_start, rule_start) in enumerate(rule_starts):
+        if rule_num > 16:
+            continue
+        content_end = rule_starts[i + 1][3] if i + 1 < len(rule_starts) else len(main_text)
+        content = main_text[content_start:content_end].strip()
+        content = re.sub(r'[ \t]+', ' ', content)
+        content = re.sub(r'\n+', ' ', content)
+        content = re.sub(r'\s+', ' ', content)
+        content = content.strip()
+        if content:
+            rules.append((str(rule_num), title, content))
+
+    return rules
+
+def legacy_strip_examples(content: str) -> str:
+    """Remove illustrations/examples that might interfere"""
+    content = re.sub(r'\bIllustration\.?\s+.*?(?=\s*\([a-z]\)|\s*\(\d+\)|$)', '', content, flags=re.DOTALL | re.IGNORECASE)
+    return re.sub(r'\bCase \d+:.*?(?=\s*Case \d+:|$)', '', content, flags=re.DOTALL | re.IGNORECASE)
+
+def legacy_extract_subrules(content: str) -> list:
+    """Extract sub-rules from rule content"""
+    subrules = []
+    lettered_positions = [(m.start(), m.end(), m.group(1)) for m in re.finditer(r'\(([a-z])\)\s+', content)]
+    numbered_positions = [(m.start(), m.end(), m.group(1)) for m in re.finditer(r'\((\d+)\)\s+', content)]
+
+    if lettered_positions and (not numbered_positions or lettered_positions[0][0] < numbered_positions[0][0]):
+        positions, is_lettered = lettered_positions, True
+    elif numbered_positions:
+        positions, is_lettered = numbered_positions, False
+    else:
+        return subrules
+
+    for i, (start, end, identifier) in enumerate(positions):
+        if i + 1 < len(positions):
+            text = content[end:positions[i + 1][0]].strip()
+        else:
+            text = content[end:].strip()
+        text = re.sub(r'\s+', ' ', text).strip()
+        if len(text) > 30:
+            subrules.append((identifier, text))
+
+    if not is_lettered and subrules:
+        enhanced_subrules = []
+        for identifier, text in subrules:
+            nested_lettered = list(re.finditer(r'\(([a-z]+)\)\s+([^()]+?)(?=\s*\([a-z]+\)|$)', text, re.DOTALL))
+            if nested_lettered and len(nested_lettered) > 1:
+                for nested in nested_lettered:
+                    nested_text = re.sub(r'\s+', ' ', nested.group(2).strip())
+                    if len(nested_text) > 30:
+                        enhanced_subrules.append((f"{identifier}({nested.group(1)})", nested_text))
+            else:
+                enhanced_subrules.append((identifier, text))
+        return enhanced_subrules
+
+    return subrules
+
+# ============================================================================
+# PIPELINES
+# ============================================================================
+
+def legacy_structure(cleaned: str) -> list:
+    """Original structure passes: extract rules, strip examples, split sub-rules"""
+    output = []
+    for rule_num, title, content in legacy_extract_rules(cleaned):
+        body = legacy_strip_examples(content)
+        output.append((rule_num, title, content, body, legacy_extract_subrules(body)))
+    return output
+
+def tokenizer_structure(cleaned: str) -> list:
+    """One tokenizer pass over the cleaned text"""
+    output = []
+    for rule in tokenize_rules(cleaned):
+        if int(rule['number']) <= 16 and rule['content']:
+            output.append((str(int(rule['number'])), rule['title'], rule['content'],
+                           rule['body'], _subrule_entries(rule['subrules'])))
+    return output
+
+def legacy_pipeline(text: str) -> list:
+    """Original pipeline end to end"""
+    return legacy_structure(legacy_clean_text(text))
+
+def tokenizer_pipeline(text: str) -> list:
+    """Tokenizer pipeline end to end"""
+    return tokenizer_structure(clean_text(text))
+
+def pages_to_text(pages) -> str:
+    """Rebuild the combined TXT layout (page markers) from extracted pages"""
+    return ''.join(f"\n{'='*70}\nPAGE {n}\n{'='*70}\n\n{text}\n" for n, text in enumerate(pages, 1))
+
+def time_best(function, argument, repeats: int = 3) -> float:
+    """Best wall-clock time of several runs"""
+    timings = []
+    for _ in range(repeats):
+        start = perf_counter()
+        function(argument)
+        timings.append(perf_counter() - start)
+    return min(timings)
+
+def compare(label: str, expected: list, actual: list) -> bool:
+    """Print a comparison line and the first difference, if any"""
+    if expected == actual:
+        print(f"  ✓ {label}: identical ({len(actual)} rules)")
+        return True
+
+    print(f"  ✗ {label}: outputs differ")
+    for index, (old, new) in enumerate(zip(expected, actual)):
+        if old != new:
+            print(f"    First difference in rule #{index + 1} ({old[0]} / {new[0]})")
+            break
+    else:
+        print(f"    Rule count differs: {len(expected)} vs {len(actual)}")
+    return False
+
+def main():
+    """Run the regression check and benchmark"""
+    parser = argparse.ArgumentParser(description="Check the rule tokenizer against the regex pipeline")
+    parser.add_argument('--repeat', type=int, default=10, help="Corpus multiplier for the benchmark")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("RULE TOKENIZER CHECK")
+    print("=" * 70)
+    print()
+
+    try:
+        with load_pages('rules_2025_extracted') as store:
+            text = pages_to_text(store.iter_texts())
+            streamed = tokenizer_structure(clean_text(store.iter_texts()))
+    except FileNotFoundError:
+        print("✗ rules_2025_extracted.jsonl not found")
+        print("  Run: python src/extraction/parse_rules.py")
+        return 1
+
+    # Regression: bundled Rules text
+    print("Regression (bundled Rules text)")
+    print("-" * 70)
+    expected = legacy_pipeline(text)
+    passed = compare("rules/bodies/sub-rules", expected, tokenizer_pipeline(text))
+    passed &= compare("streamed from JSONL pages", expected, streamed)
+
+    legacy_rules = legacy_extract_rules(legacy_clean_text(text))
+    passed &= compare("extract_rules()", legacy_rules, extract_rules(clean_text(text)))
+
+    subrules_match = all(
+        legacy_extract_subrules(content) == extract_subrules(content)
+        for _, _, content in legacy_rules
+    )
+    print(f"  {'✓' if subrules_match else '✗'} extract_subrules() on raw rule content")
+    passed &= subrules_match
+    print()
+
+    # Benchmark: the rules section repeated N times, followed by the schedules
+    schedule_at = re.search(r'\n\s*FIRST SCHEDULE\s*\n', text, re.IGNORECASE)
+    split = schedule_at.start() if schedule_at else len(text)
+    corpus = text[:split] * args.repeat + text[split:]
+
+    print(f"Benchmark ({args.repeat}x corpus, {len(corpus):,} characters)")
+    print("-" * 70)
+    passed &= compare(f"{args.repeat}x corpus", legacy_pipeline(corpus), tokenizer_pipeline(corpus))
+
+    cleaned = clean_text(corpus)
+    timings = [
+        ("clean_text", time_best(legacy_clean_text, corpus), time_best(clean_text, corpus)),
+        ("rules + sub-rules", time_best(legacy_structure, cleaned), time_best(tokenizer_structure, cleaned)),
+        ("end to end", time_best(legacy_pipeline, corpus), time_best(tokenizer_pipeline, corpus)),
+    ]
+    print(f"  {'Stage':20s} {'Regex (ms)':>11s} {'Tokenizer (ms)':>15s} {'Speedup':>8s}")
+    for stage, legacy_time, tokenizer_time in timings:
+        print(f"  {stage:20s} {legacy_time * 1000:11.1f} {tokenizer_time * 1000:15.1f} {legacy_time / tokenizer_time:7.1f}x")
+    print()
+
+    print("✓ All checks passed" if passed else "✗ Regression check failed")
+    return 0 if passed else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,13 @@
 Requirements Extraction
 Extracts requirements from parsed PDFs and inserts into database
 
+Pages are read one at a time from the JSONL output of parse_rules.py, so
+text cleaning and rule/schedule extraction run with bounded memory.
+
+Requirements are diffed against the active set by clause key and text
+hash; only added, changed and removed clauses are written (see
+versioning.py).
+
 """
 
 import re
@@ -9,12 +16,28 @@ import sqlite3
 from pathlib import Path
 import sys
 from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Iterable, Iterator, Union
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from config.config import DB_PATH, RULES_NOTIFICATION_DATE, FULL_COMPLIANCE_DEADLINE
+from src.extraction.init_db import (
+    ensure_assessment_schema, ensure_unique_constraints, ensure_versioning_schema,
+    requirement_text_hash
+)
+from src.extraction.page_store import PageStore
+from src.extraction.parse_rules import load_output_state
+from src.extraction.rule_tokenizer import (
+    iter_rule_spans, normalize_whitespace, tokenize_content, tokenize_rules
+)
+from src.extraction.search_index import reindex_on_change, sync_search_index
+from src.extraction.versioning import (
+    apply_requirement_diff, diff_requirements, register_change_listener
+)
+from src.assessment.reassessment import on_requirements_changed
 
 # Paths
 PROCESSED_DATA_PATH = project_root / "data" / "processed"
@@ -29,172 +52,106 @@ PENALTY_MAP = {
     # Default to general_violations for other rules
 }
 
-def load_text_file(filename: str) -> str:
-    """Load extracted text file"""
-    filepath = PROCESSED_DATA_PATH / filename
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return f.read()
+# Noise removal passes, applied in order (later passes rely on earlier removals)
+PAGE_BREAK_PATTERN = re.compile(r'={70,}\s*\r?\n\s*PAGE \d+\s*\r?\n\s*={70,}\s*\r?\n')
+NOISE_PASSES = [
+    # Hindi headings
+    (re.compile(r'\[भाग[^\]]*\]\s*\r?\n'), ''),
+    (re.compile(r'भारत का रािपत्र[^\n]*\r?\n'), ''),
+    # Gazette headings (multi-line)
+    (re.compile(r'THE GAZETTE OF INDIA[^\n]*\r?\n[^\n]*\r?\n', re.IGNORECASE), ''),
+    # Standalone page numbers
+    (re.compile(r'^\s*\d+\s*$', re.MULTILINE), ''),
+    # Normalize whitespace but preserve structure (patterns start with a
+    # literal so lone spaces and single/double newlines are skipped quickly)
+    (re.compile(r' [ \t]+|\t[ \t]*'), ' '),  # Multiple spaces to single
+    (re.compile(r'\n\n\n+'), '\n\n'),        # Multiple newlines to double
+]
 
-def clean_text(text: str) -> str:
-    """Remove page markers and noise"""
-    # Remove page breaks
-    text = re.sub(r'={70,}\s*\r?\n\s*PAGE \d+\s*\r?\n\s*={70,}\s*\r?\n', '\n', text)
-    
-    # Remove Hindi headings
-    text = re.sub(r'\[भाग[^\]]*\]\s*\r?\n', '', text)
-    text = re.sub(r'भारत का रािपत्र[^\n]*\r?\n', '', text)
-    
-    # Remove gazette headings (multi-line)
-    text = re.sub(r'THE GAZETTE OF INDIA[^\n]*\r?\n[^\n]*\r?\n', '', text, flags=re.IGNORECASE)
+THIRD_SCHEDULE_PATTERN = re.compile(r'THIRD SCHEDULE', re.IGNORECASE)
+FOURTH_SCHEDULE_PATTERN = re.compile(r'FOURTH SCHEDULE', re.IGNORECASE)
+
+def load_pages(output_name: str) -> PageStore:
+    """Open an extracted JSONL page file (memory-mapped, read page by page)"""
+    return PageStore(PROCESSED_DATA_PATH / output_name)
+
+def _remove_noise(text: str) -> str:
+    """Apply the noise removal passes to a chunk of text (no page markers)"""
+    for pattern, replacement in NOISE_PASSES:
+        text = pattern.sub(replacement, text)
+    return text
+
+def _iter_clean_pages(pages: Iterable[str]) -> Iterator[str]:
+    """Clean pages one at a time (each page ends with a newline, like the TXT layout)"""
+    for page in pages:
+        yield _remove_noise('\n' + page + '\n')
+
+def clean_text(text: Union[str, Iterable[str]]) -> Union[str, Iterator[str]]:
+    """
+    Remove page markers and noise
     
-    # Remove standalone page numbers
-    text = re.sub(r'^\s*\d+\s*$', '', text, flags=re.MULTILINE)
+    Accepts either the full TXT text (returns a string) or an iterable of
+    page texts, e.g. PageStore.iter_texts() (returns a generator of cleaned
+    pages, so only one page is held at a time).
+    """
+    if not isinstance(text, str):
+        return _iter_clean_pages(text)
     
-    # Normalize whitespace but preserve structure
-    text = re.sub(r'[ \t]+', ' ', text)  # Multiple spaces to single
-    text = re.sub(r'\n{3,}', '\n\n', text)  # Multiple newlines to double
+    # Remove page breaks
+    text = PAGE_BREAK_PATTERN.sub('\n', text)
     
-    return text
+    return _remove_noise(text)
 
-def extract_rules(text: str) -> list:
+def extract_rules(text: Union[str, Iterable[str]]) -> list:
     """
     Extract individual rules with their content (Rules 1-16 only, exclude schedules)
     
+    View over rule_tokenizer.iter_rule_spans(); accepts the full text or an
+    iterable of cleaned page chunks (streamed with bounded memory).
+    
     Returns: List of (rule_number, title, content) tuples
     """
     rules = []
     
-    # Find FIRST SCHEDULE marker and stop there
-    # Make it more specific: look for "FIRST SCHEDULE" as a heading (usually on its own line or after newline)
-    # This avoids matching "First Schedule" mentioned in rule content
-    first_schedule_match = re.search(r'\n\s*FIRST SCHEDULE\s*\n|^FIRST SCHEDULE\s*\n', text, re.IGNORECASE | re.MULTILINE)
-    if first_schedule_match:
-        main_text = text[:first_schedule_match.start()]
-    else:
-        main_text = text
-    
-    # Find all rule starts: pattern "number. Title. —"
-    rule_starts = []
-    # Pattern: number. Title (can span lines) ending with period, then dash
-    # Simpler approach: match "number. Title" where Title ends with ". " or "." followed by dash
-    # Use lookahead to ensure we match the period-dash pattern
-    # Match any characters (including newlines with DOTALL) until we find ". " + dash or "." + dash
-    rule_pattern = r'(\d{1,2})\.\s+([A-Z].*?)\s*\.(?:\s+|)[—–-\u2014\u2013]'
-    
-    all_matches = list(re.finditer(rule_pattern, main_text, re.MULTILINE | re.DOTALL))
-    
-    for match in all_matches:
-        rule_num = match.group(1).strip()
-        title = match.group(2).strip()
-        # Clean title - remove newlines, normalize spaces
-        title = re.sub(r'\s+', ' ', title).strip()
-        start_pos = match.end()  # Start of content after em dash
-        rule_starts.append((int(rule_num), title, start_pos, match.start()))
-    
-    # Extract content for each rule
-    for i, (rule_num, title, content_start, rule_start) in enumerate(rule_starts):
-        # Only include Rules 1-16
-        if rule_num > 16:
-            continue
-        
-        # Find end of this rule's content (start of next rule or end of text)
-        if i + 1 < len(rule_starts):
-            content_end = rule_starts[i + 1][3]  # Start position of next rule
-        else:
-            content_end = len(main_text)
-        
-        # Extract content
-        content = main_text[content_start:content_end].strip()
-        
-        # Clean up content - normalize whitespace but preserve structure
-        content = re.sub(r'[ \t]+', ' ', content)  # Multiple spaces/tabs to single space
-        content = re.sub(r'\n+', ' ', content)  # Newlines to space
-        content = re.sub(r'\s+', ' ', content)  # Multiple spaces to single
-        content = content.strip()
+    for span in iter_rule_spans(text):
+        rule_num = int(span['number'])
+        content = normalize_whitespace(span['raw'])
         
-        if content:  # Only add if content exists
-            rules.append((str(rule_num), title, content))
+        # Only include Rules 1-16, and only rules with content
+        if rule_num <= 16 and content:
+            rules.append((str(rule_num), span['title'], content))
     
     return rules
 
+def _subrule_entries(subrules: list) -> list:
+    """
+    Flatten sub-rule nodes to (identifier, text) tuples
+    
+    Numbered sub-rules with more than one nested lettered clause are
+    replaced by their clauses, identified like '1(a)'.
+    """
+    entries = []
+    for subrule in subrules:
+        clauses = subrule['clauses']
+        if len(clauses) > 1:
+            for clause in clauses:
+                if len(clause['text']) > 30:
+                    entries.append((f"{subrule['id']}({clause['id']})", clause['text']))
+        else:
+            entries.append((subrule['id'], subrule['text']))
+    return entries
+
 def extract_subrules(content: str) -> list:
     """
     Extract sub-rules from rule content.
     Handles both lettered sub-rules: (a), (b), (c) and numbered: (1), (2), (3)
     Includes all nested content within each sub-rule
     
+    View over rule_tokenizer.tokenize_content().
+    
     Returns: List of (identifier, text) tuples where identifier is like 'a', 'b', '1', '2'
     """
-    subrules = []
-    
-    # Find all potential sub-rule markers at the start
-    # Look for patterns like "(a)", "(b)" or "(1)", "(2)" at word boundaries
-    
-    # First, try to find lettered sub-rules (a-z) - these are top-level
-    lettered_pattern = r'\(([a-z])\)\s+'
-    lettered_positions = [(m.start(), m.end(), m.group(1)) for m in re.finditer(lettered_pattern, content)]
-    
-    # Also find numbered sub-rules (1-9) - these might be top-level
-    numbered_pattern = r'\((\d+)\)\s+'
-    numbered_positions = [(m.start(), m.end(), m.group(1)) for m in re.finditer(numbered_pattern, content)]
-    
-    # Determine which type is top-level by checking which appears first and more frequently
-    if lettered_positions and (not numbered_positions or lettered_positions[0][0] < numbered_positions[0][0]):
-        # Lettered sub-rules are top-level
-        positions = lettered_positions
-        is_lettered = True
-    elif numbered_positions:
-        # Numbered sub-rules are top-level
-        positions = numbered_positions
-        is_lettered = False
-    else:
-        # No sub-rules found
-        return subrules
-    
-    # Extract each sub-rule with its content
-    for i, (start, end, identifier) in enumerate(positions):
-        # Find the end of this sub-rule (start of next sub-rule at same level, or end of content)
-        if i + 1 < len(positions):
-            # Content until next sub-rule
-            next_start = positions[i + 1][0]
-            text = content[end:next_start].strip()
-        else:
-            # Last sub-rule - content until end
-            text = content[end:].strip()
-        
-        # Clean up text
-        text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-        text = text.strip()
-        
-        # Skip if too short or empty
-        if len(text) > 30:
-            subrules.append((identifier, text))
-    
-    # If we found numbered top-level sub-rules, check if they contain lettered nested sub-rules
-    # and extract those separately for better granularity
-    if not is_lettered and subrules:
-        # Re-examine: if numbered sub-rules contain lettered sub-rules, extract nested ones
-        enhanced_subrules = []
-        for identifier, text in subrules:
-            # Check if this numbered sub-rule contains lettered sub-rules
-            nested_lettered = list(re.finditer(r'\(([a-z]+)\)\s+([^()]+?)(?=\s*\([a-z]+\)|$)', text, re.DOTALL))
-            
-            if nested_lettered and len(nested_lettered) > 1:
-                # Extract nested lettered sub-rules separately
-                for nested in nested_lettered:
-                    nested_id = nested.group(1)
-                    nested_text = nested.group(2).strip()
-                    nested_text = re.sub(r'\s+', ' ', nested_text)
-                    if len(nested_text) > 30:
-                        # Format: "1(a)" for nested sub-rules
-                        enhanced_subrules.append((f"{identifier}({nested_id})", nested_text))
-            else:
-                # Keep the numbered sub-rule as-is
-                enhanced_subrules.append((identifier, text))
-        
-        return enhanced_subrules
-    
-    return subrules
+    return _subrule_entries(tokenize_content(content, strip_examples=False)['subrules'])
 
 def is_mandatory(text: str) -> bool:
     """Check if requirement contains 'shall' (mandatory)"""
@@ -204,26 +161,40 @@ def get_penalty_category(rule_num: str) -> str:
     """Map rule number to penalty category"""
     return PENALTY_MAP.get(rule_num, 'general_violations')
 
-def extract_third_schedule(text: str) -> list:
+def extract_third_schedule(text: Union[str, Iterable[str]]) -> list:
     """
     Extract Third Schedule retention requirements
     
+    Accepts the full text or an iterable of cleaned page chunks; only the
+    Third Schedule section itself is buffered.
+    
     Returns: List of (entity_class, threshold, retention_days) tuples
     """
     schedule_data = []
     
-    # Find Third Schedule section
-    schedule_match = re.search(
-        r'THIRD SCHEDULE.*?(?=FOURTH SCHEDULE|$)',
-        text,
-        re.DOTALL | re.IGNORECASE
-    )
-    
-    if not schedule_match:
+    # Find Third Schedule section (up to the Fourth Schedule or end of text)
+    schedule_text = None
+    carry = ''
+    for chunk in ([text] if isinstance(text, str) else text):
+        if schedule_text is None:
+            window = carry + chunk
+            start_match = THIRD_SCHEDULE_PATTERN.search(window)
+            if not start_match:
+                carry = window[-len('THIRD SCHEDULE'):]
+                continue
+            schedule_text = ''
+            chunk = window[start_match.start():]
+        
+        search_from = max(0, len(schedule_text) - len('FOURTH SCHEDULE'))
+        schedule_text += chunk
+        end_match = FOURTH_SCHEDULE_PATTERN.search(schedule_text, search_from)
+        if end_match:
+            schedule_text = schedule_text[:end_match.start()]
+            break
+    
+    if not schedule_text:
         return schedule_data
     
-    schedule_text = schedule_match.group(0)
-    
     # Extract e-commerce entities
     if 'e-commerce entity' in schedule_text and 'two crore' in schedule_text:
         schedule_data.append(('ecommerce', 20000000, 1095))
@@ -238,66 +209,45 @@ def extract_third_schedule(text: str) -> list:
     
     return schedule_data
 
-def insert_requirement(cursor, rule_number, text, obligation_type, is_sdf=False):
-    """Insert requirement into database (skip if duplicate)"""
-    
-    # Check if this requirement already exists
-    cursor.execute('''
-        SELECT id FROM requirements 
-        WHERE rule_number = ? AND requirement_text = ?
-    ''', (rule_number, text))
-    if cursor.fetchone():
-        return  # Skip duplicate
-    
+def load_penalty_ids(cursor) -> dict:
+    """Resolve penalty category names to ids in one query"""
+    cursor.execute('SELECT category_name, id FROM penalties')
+    return dict(cursor.fetchall())
+
+def build_requirement_row(rule_number, text, obligation_type, penalty_ids, is_sdf=False) -> tuple:
+    """Build a requirements row for bulk_insert_requirements()"""
     # Get penalty category for the main rule
     main_rule = rule_number.split('(')[0].replace('Rule ', '').strip()
-    penalty_category = get_penalty_category(main_rule)
+    penalty_category_id = penalty_ids.get(get_penalty_category(main_rule))
     
-    # Get penalty_category_id for the penalty category
-    cursor.execute(
-        'SELECT id FROM penalties WHERE category_name = ?',
-        (penalty_category,)
-    )
-    result = cursor.fetchone()
-    penalty_category_id = result[0] if result else None
-    
-    # Insert requirement into the database [SQLite database]
-    cursor.execute('''
-        INSERT INTO requirements (
-            rule_number,
-            requirement_text,
-            obligation_type,
-            penalty_category_id,
-            deadline,
-            is_sdf_specific
-        ) VALUES (?, ?, ?, ?, ?, ?)
-    ''', (
+    return (
         rule_number,
         text,
+        requirement_text_hash(text),
         obligation_type,
         penalty_category_id,
         FULL_COMPLIANCE_DEADLINE.isoformat(),
         is_sdf
-    ))
+    )
 
-def insert_third_schedule_entry(cursor, entity_class, threshold, retention_days):
-    """Insert Third Schedule entry (skip if duplicate)"""
-    # Check if this entry already exists
-    cursor.execute('''
-        SELECT id FROM schedule_references 
-        WHERE schedule_name = ? AND entity_class = ?
-    ''', ('Third Schedule', entity_class))
-    if cursor.fetchone():
-        return  # Skip duplicate
-    
-    cursor.execute('''
+def bulk_insert_third_schedule(cursor, entries: list) -> tuple:
+    """
+    Insert Third Schedule (entity_class, threshold, retention_days) entries,
+    skipping entity classes already present
+    
+    Returns: (inserted, skipped) counts
+    """
+    cursor.executemany('''
         INSERT INTO schedule_references (
             schedule_name,
             entity_class,
             threshold_users,
             retention_period_days
-        ) VALUES (?, ?, ?, ?)
-    ''', ('Third Schedule', entity_class, threshold, retention_days))
+        ) VALUES ('Third Schedule', ?, ?, ?)
+        ON CONFLICT (schedule_name, entity_class) DO NOTHING
+    ''', entries)
+    inserted = max(cursor.rowcount, 0)
+    return inserted, len(entries) - inserted
 
 def main():
     """Main extraction process"""
@@ -306,15 +256,15 @@ def main():
     print("=" * 70)
     print()
     
-    # Load extracted text
-    print("Loading extracted text files...")
-    rules_text = load_text_file('rules_2025_extracted.txt')
-    print(f"✓ Loaded Rules 2025 ({len(rules_text):,} characters)")
-    
-    # Clean text
-    print("Cleaning text...")
-    rules_text = clean_text(rules_text)
-    print("✓ Text cleaned")
+    # Open extracted pages (streamed from the memory-mapped JSONL file)
+    print("Loading extracted pages...")
+    try:
+        rules_pages = load_pages('rules_2025_extracted')
+    except FileNotFoundError:
+        print("✗ rules_2025_extracted.jsonl not found")
+        print("  Run: python src/extraction/parse_rules.py")
+        return
+    print(f"✓ Opened Rules 2025 ({len(rules_pages)} pages)")
     print()
     
     # Connect to database
@@ -323,52 +273,36 @@ def main():
     cursor = conn.cursor()
     print(f"✓ Connected to {DB_PATH}")
     
-    # Clean up duplicates before inserting
-    print("Cleaning up duplicates...")
-    cursor.execute('''
-        DELETE FROM requirements 
-        WHERE id NOT IN (
-            SELECT MIN(id) 
-            FROM requirements 
-            GROUP BY rule_number, requirement_text
-        )
-    ''')
-    req_duplicates = cursor.rowcount
-    
-    cursor.execute('''
-        DELETE FROM schedule_references 
-        WHERE id NOT IN (
-            SELECT MIN(id) 
-            FROM schedule_references 
-            WHERE schedule_name = 'Third Schedule'
-            GROUP BY entity_class
-        ) AND schedule_name = 'Third Schedule'
-    ''')
-    schedule_duplicates = cursor.rowcount
-    
-    if req_duplicates > 0 or schedule_duplicates > 0:
-        print(f"  Removed {req_duplicates} duplicate requirements")
-        print(f"  Removed {schedule_duplicates} duplicate Third Schedule entries")
-        conn.commit()
-    else:
-        print("  No duplicates found")
+    # Unique indexes replace the old pre-run duplicate cleanup
+    # (migrates databases created before requirement_text_hash existed)
+    ensure_unique_constraints(cursor)
+    ensure_versioning_schema(cursor)
+    # Snapshot table and profile indexes, which save_snapshots() relies on
+    ensure_assessment_schema(cursor)
+    conn.commit()
+    penalty_ids = load_penalty_ids(cursor)
     print()
     
     # Extract rules
     print("Extracting rules...")
-    rules = extract_rules(rules_text)
+    # One tokenizer pass builds the rule -> sub-rule -> clause tree
+    rules = [
+        rule for rule in tokenize_rules(clean_text(rules_pages.iter_texts()))
+        if int(rule['number']) <= 16 and rule['content']
+    ]
     print(f"✓ Found {len(rules)} rules")
     if rules:
-        print("  Extracted rules:", [f"Rule {r[0]}: {r[1][:40]}..." for r in rules])
+        print("  Extracted rules:", [f"Rule {int(r['number'])}: {r['title'][:40]}..." for r in rules])
     print()
     
     # Process key rules (3, 6, 7, 8, 9, 10, 13, 14)
     target_rules = ['3', '6', '7', '8', '9', '10', '13', '14']
-    requirements_count = 0
+    requirement_rows = []
     
     print("Processing requirements...")
     
-    for rule_num, title, content in rules:
+    for rule in rules:
+        rule_num, title, content = str(int(rule['number'])), rule['title'], rule['content']
         if rule_num not in target_rules:
             continue
         
@@ -398,13 +332,11 @@ def main():
         # Check if SDF-specific
         is_sdf = (rule_num == '13')
         
-        # Remove illustrations/examples that might interfere
-        # Look for "Illustration." or "Case" patterns and remove them
-        content_clean = re.sub(r'\bIllustration\.?\s+.*?(?=\s*\([a-z]\)|\s*\(\d+\)|$)', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content_clean = re.sub(r'\bCase \d+:.*?(?=\s*Case \d+:|$)', '', content_clean, flags=re.DOTALL | re.IGNORECASE)
+        # Body has illustrations/examples ("Illustration." / "Case N:") removed
+        content_clean = rule['body']
         
-        # Extract sub-rules
-        subrules = extract_subrules(content_clean)
+        # Sub-rules were split out by the tokenizer
+        subrules = _subrule_entries(rule['subrules'])
         print(f"    Found {len(subrules)} sub-rules")
         if subrules:
             print(f"    Sub-rule identifiers: {[s[0] for s in subrules]}")
@@ -422,10 +354,9 @@ def main():
                         # Simple identifier
                         rule_ref = f"Rule {rule_num}({identifier})"
                     
-                    insert_requirement(
-                        cursor, rule_ref, text, obligation_type, is_sdf
-                    )
-                    requirements_count += 1
+                    requirement_rows.append(build_requirement_row(
+                        rule_ref, text, obligation_type, penalty_ids, is_sdf
+                    ))
         else:
             # Insert whole rule if no sub-rules found
             if len(content_clean) > 50:
@@ -434,30 +365,61 @@ def main():
                 rule_content = content_clean
                 if len(rule_content) > 2000:
                     rule_content = rule_content[:2000] + "..."
-                insert_requirement(
-                    cursor, rule_ref, rule_content, obligation_type, is_sdf
-                )
-                requirements_count += 1
+                requirement_rows.append(build_requirement_row(
+                    rule_ref, rule_content, obligation_type, penalty_ids, is_sdf
+                ))
     
-    print(f"✓ Inserted {requirements_count} requirements")
+    print(f"✓ Extracted {len(requirement_rows)} requirements")
     print()
     
     # Extract Third Schedule
     print("Extracting Third Schedule...")
-    schedule_entries = extract_third_schedule(rules_text)
+    schedule_entries = extract_third_schedule(clean_text(rules_pages.iter_texts()))
+    rules_pages.close()
     
     for entity_class, threshold, retention_days in schedule_entries:
-        insert_third_schedule_entry(cursor, entity_class, threshold, retention_days)
         print(f"  ✓ {entity_class}: {threshold:,} users, {retention_days} days retention")
+    print(f"✓ Extracted {len(schedule_entries)} Third Schedule entries")
+    print()
     
-    print(f"✓ Inserted {len(schedule_entries)} Third Schedule entries")
+    # Apply only the difference from the active requirement set
+    print("Loading into database...")
+    start = perf_counter()
+    diff = diff_requirements(cursor, requirement_rows)
+    # Businesses affected by changed clauses are re-assessed after commit
+    register_change_listener(on_requirements_changed)
+    # Changed requirements are re-indexed for full-text search
+    register_change_listener(reindex_on_change)
+    version = apply_requirement_diff(
+        conn, diff, 'rules_2025_extracted',
+        load_output_state().get('rules_2025_extracted', {}).get('sha256')
+    )
+    with conn:
+        sched_inserted, sched_skipped = bulk_insert_third_schedule(cursor, schedule_entries)
+    elapsed_ms = (perf_counter() - start) * 1000
+    
+    if version['version_id']:
+        print(f"✓ Regulation version {version['version_id']}: "
+              f"{version['added']} added, {version['changed']} changed, "
+              f"{version['removed']} removed, {version['unchanged']} unchanged")
+        print(f"  {len(version['changed_ids'])} changed requirement ids")
+    else:
+        print(f"✓ Requirements unchanged ({version['unchanged']} clauses)")
+    print(f"✓ Third Schedule: {sched_inserted} inserted, {sched_skipped} skipped (already present)")
+    print(f"  Loaded in {elapsed_ms:.1f} ms")
     print()
     
-    # Commit changes
-    conn.commit()
+    # Full-text search index (only documents whose content changed are rewritten)
+    search_counts = sync_search_index()
+    if search_counts:
+        print("✓ Search index up to date")
+        for name, counts in search_counts.items():
+            print(f"  {name}: {counts['added']} added, {counts['updated']} updated, "
+                  f"{counts['removed']} removed, {counts['unchanged']} unchanged")
+        print()
     
     # Verify insertion
-    cursor.execute('SELECT COUNT(*) FROM requirements')
+    cursor.execute('SELECT COUNT(*) FROM requirements WHERE is_active = 1')
     total_requirements = cursor.fetchone()[0]
     
     cursor.execute('SELECT COUNT(*) FROM schedule_references WHERE schedule_name = "Third Schedule"')
@@ -470,7 +432,7 @@ def main():
     print("EXTRACTION COMPLETE")
     print("=" * 70)
     print()
-    print(f"Total requirements in database: {total_requirements}")
+    print(f"Active requirements in database: {total_requirements}")
     print(f"Total Third Schedule entries: {total_schedule}")
     print()
     print("Next step: Verify data with query:")
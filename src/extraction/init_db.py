@@ -11,8 +11,12 @@ Tables:
 6. schedule_references - Third Schedule data retention requirements
 7. document_templates - Document template metadata
 8. assessment_questions - Assessment questionnaire
+9. regulation_versions - One row per extraction run that changed requirements
+10. requirement_changes - Added/changed/removed clauses per regulation version
+11. assessment_snapshots - Stored gap analysis summaries per business profile
 """
 
+import hashlib
 import sqlite3
 from pathlib import Path
 from datetime import datetime
@@ -20,20 +24,209 @@ from datetime import datetime
 # Database path
 DB_PATH = Path(__file__).parent.parent.parent / "data" / "processed" / "dpdpa_compliance.db"
 
-def init_database():
-    """Initialize database with complete schema and pre-populated data"""
+def requirement_text_hash(text: str) -> str:
+    """SHA-256 of requirement text (key for the requirements unique index)"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def ensure_unique_constraints(cursor):
+    """
+    Create the unique indexes that make re-running extraction idempotent
+    
+    Databases created before requirement_text_hash existed are migrated once:
+    the column is added and backfilled, existing duplicates are removed
+    (keeping the lowest id), then the indexes are created.
+    """
+    cursor.execute("PRAGMA table_info(requirements)")
+    columns = [col[1] for col in cursor.fetchall()]
+    
+    if 'requirement_text_hash' not in columns:
+        cursor.execute("ALTER TABLE requirements ADD COLUMN requirement_text_hash TEXT")
+    
+    cursor.execute("SELECT id, requirement_text FROM requirements WHERE requirement_text_hash IS NULL")
+    missing = [(requirement_text_hash(text), req_id) for req_id, text in cursor.fetchall()]
+    if missing:
+        cursor.executemany(
+            "UPDATE requirements SET requirement_text_hash = ? WHERE id = ?", missing
+        )
+    
+    cursor.execute("""
+        SELECT 1 FROM sqlite_master
+        WHERE type = 'index' AND name = 'idx_requirements_rule_text_hash'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            DELETE FROM requirements
+            WHERE id NOT IN (
+                SELECT MIN(id)
+                FROM requirements
+                GROUP BY rule_number, requirement_text_hash
+            )
+        """)
+        cursor.execute("""
+            CREATE UNIQUE INDEX idx_requirements_rule_text_hash
+            ON requirements (rule_number, requirement_text_hash)
+        """)
+    
+    cursor.execute("""
+        SELECT 1 FROM sqlite_master
+        WHERE type = 'index' AND name = 'idx_schedule_references_entity'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            DELETE FROM schedule_references
+            WHERE id NOT IN (
+                SELECT MIN(id)
+                FROM schedule_references
+                GROUP BY schedule_name, entity_class
+            )
+        """)
+        cursor.execute("""
+            CREATE UNIQUE INDEX idx_schedule_references_entity
+            ON schedule_references (schedule_name, entity_class)
+        """)
+
+def assign_clause_keys(rule_numbers: list) -> list:
+    """
+    Stable clause keys for requirement rows, in document order
+    
+    The key is the rule reference (e.g. "Rule 6(1(a))"); a reference that
+    occurs more than once gets an occurrence suffix ("Rule 3(a)#2").
+    """
+    seen = {}
+    keys = []
+    for rule_number in rule_numbers:
+        seen[rule_number] = seen.get(rule_number, 0) + 1
+        keys.append(rule_number if seen[rule_number] == 1 else f"{rule_number}#{seen[rule_number]}")
+    return keys
+
+def ensure_versioning_schema(cursor):
+    """
+    Create the regulation versioning tables and requirement columns
+    
+    Existing requirements are treated as active and get clause keys
+    assigned in id order.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS regulation_versions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            source_name TEXT NOT NULL,
+            source_sha256 TEXT,
+            added_count INTEGER DEFAULT 0,
+            changed_count INTEGER DEFAULT 0,
+            removed_count INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS requirement_changes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            version_id INTEGER NOT NULL,
+            requirement_id INTEGER NOT NULL,
+            clause_key TEXT NOT NULL,
+            change_type TEXT NOT NULL,
+            old_text_hash TEXT,
+            new_text_hash TEXT,
+            old_text TEXT,
+            FOREIGN KEY (version_id) REFERENCES regulation_versions(id),
+            FOREIGN KEY (requirement_id) REFERENCES requirements(id)
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_requirement_changes_version
+        ON requirement_changes (version_id)
+    """)
+    
+    cursor.execute("PRAGMA table_info(requirements)")
+    columns = [col[1] for col in cursor.fetchall()]
+    
+    if 'clause_key' not in columns:
+        cursor.execute("ALTER TABLE requirements ADD COLUMN clause_key TEXT")
+    if 'version_id' not in columns:
+        cursor.execute("ALTER TABLE requirements ADD COLUMN version_id INTEGER")
+    if 'is_active' not in columns:
+        cursor.execute("ALTER TABLE requirements ADD COLUMN is_active BOOLEAN DEFAULT 1")
+    
+    cursor.execute("SELECT id, rule_number FROM requirements WHERE clause_key IS NULL ORDER BY id")
+    unkeyed = cursor.fetchall()
+    if unkeyed:
+        keys = assign_clause_keys([rule_number for _, rule_number in unkeyed])
+        cursor.executemany(
+            "UPDATE requirements SET clause_key = ?, is_active = 1 WHERE id = ?",
+            [(key, req_id) for key, (req_id, _) in zip(keys, unkeyed)]
+        )
+    
+    # At most one active requirement per clause
+    cursor.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_requirements_active_clause
+        ON requirements (clause_key) WHERE is_active = 1
+    """)
+
+def ensure_assessment_schema(cursor):
+    """
+    Create the assessment snapshot table and the business profile indexes
+    
+    The indexes back keyset pagination (newest first) and the filters in
+    business_profiler.list_business_profiles_page(). Score ranges are
+    filtered while walking the created_at index: an index on
+    assessment_score makes wide ranges sort most of the table.
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS assessment_snapshots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            business_profile_id INTEGER NOT NULL,
+            version_id INTEGER,
+            compliance_score REAL NOT NULL,
+            total_requirements INTEGER NOT NULL,
+            completed INTEGER NOT NULL,
+            gap_count INTEGER NOT NULL,
+            total_penalty_exposure INTEGER NOT NULL,
+            max_penalty_exposure INTEGER NOT NULL,
+            by_type TEXT,
+            top_gaps TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (business_profile_id) REFERENCES business_profiles(id)
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_assessment_snapshots_business
+        ON assessment_snapshots (business_profile_id, id DESC)
+    """)
+    
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_business_profiles_created
+        ON business_profiles (created_at DESC, id DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_business_profiles_entity_created
+        ON business_profiles (entity_type, created_at DESC, id DESC)
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_business_profiles_name
+        ON business_profiles (business_name COLLATE NOCASE)
+    """)
+
+def init_database(db_path=None):
+    """
+    Initialize database with complete schema and pre-populated data
+    
+    Args:
+        db_path: Database file (default: data/processed/dpdpa_compliance.db);
+                 benchmarks and tests pass a scratch file
+    """
+    db_path = Path(db_path) if db_path else DB_PATH
     
     # Ensure directory exists
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Connect to database
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
     print("=" * 70)
     print("DPDPA Compliance Database Initialization")
     print("=" * 70)
-    print(f"\nDatabase location: {DB_PATH}\n")
+    print(f"\nDatabase location: {db_path}\n")
     
     # =========================================================================
     # TABLE 1: REQUIREMENTS
@@ -50,6 +243,10 @@ def init_database():
             penalty_category_id INTEGER,
             schedule_reference TEXT,
             is_sdf_specific BOOLEAN DEFAULT 0,
+            requirement_text_hash TEXT,
+            clause_key TEXT,
+            version_id INTEGER,
+            is_active BOOLEAN DEFAULT 1,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (penalty_category_id) REFERENCES penalties(id)
         )
@@ -156,6 +353,10 @@ def init_database():
     """)
     print("✓ Created table: schedule_references")
     
+    # Unique keys used by the extraction loader (INSERT ... ON CONFLICT DO NOTHING)
+    ensure_unique_constraints(cursor)
+    print("✓ Created unique indexes: requirements, schedule_references")
+    
     # Pre-populate Third Schedule data
     third_schedule_data = [
         ("Third Schedule", "ecommerce", 20_000_000, 1095, 
@@ -206,6 +407,20 @@ def init_database():
     """)
     print("✓ Created table: assessment_questions")
     
+    # =========================================================================
+    # TABLES 9-10: REGULATION VERSIONS AND REQUIREMENT CHANGES
+    # =========================================================================
+    
+    ensure_versioning_schema(cursor)
+    print("✓ Created tables: regulation_versions, requirement_changes")
+    
+    # =========================================================================
+    # TABLE 11: ASSESSMENT SNAPSHOTS (+ business profile indexes)
+    # =========================================================================
+    
+    ensure_assessment_schema(cursor)
+    print("✓ Created table: assessment_snapshots")
+    
     # =========================================================================
     # COMMIT AND VERIFY
     # =========================================================================
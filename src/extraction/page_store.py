@@ -0,0 +1,145 @@
+"""
+Page Store
+Streaming on-disk format for extracted PDF text
+
+Each output is a JSONL file (one page object per line) plus a byte-offset
+index (.idx) so pages can be read one at a time from a memory-mapped view
+instead of loading the whole document.
+
+Usage:
+    from src.extraction.page_store import PageStore
+
+    with PageStore(PROCESSED_DATA_PATH / "rules_2025_extracted") as store:
+        for text in store.iter_texts():
+            ...
+"""
+
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator
+import json
+import mmap
+
+# Index layout: unsigned 64-bit byte offsets of each line start, plus end of file
+INDEX_TYPECODE = 'Q'
+
+def write_pages(pages: Iterable[dict], base_path: Path, write_txt: bool = False) -> dict:
+    """
+    Stream pages to <base>.jsonl and <base>.idx (optionally a combined <base>.txt)
+
+    Args:
+        pages: Iterable of {'page_num', 'content_hash', 'text'} dictionaries
+        base_path: Output path without extension
+        write_txt: Also write a human-readable TXT copy with page markers
+
+    Returns:
+        Summary dict with total_pages, total_chars and bytes written
+    """
+    base_path = Path(base_path)
+    offsets = array(INDEX_TYPECODE, [0])
+    total_chars = 0
+
+    txt_file = open(base_path.with_suffix('.txt'), 'w', encoding='utf-8') if write_txt else None
+    try:
+        with open(base_path.with_suffix('.jsonl'), 'wb') as jsonl_file:
+            for page in pages:
+                line = json.dumps(page, ensure_ascii=False).encode('utf-8') + b"\n"
+                jsonl_file.write(line)
+                offsets.append(offsets[-1] + len(line))
+                total_chars += len(page['text'])
+
+                if txt_file:
+                    txt_file.write(f"\n{'='*70}\n")
+                    txt_file.write(f"PAGE {page['page_num']}\n")
+                    txt_file.write(f"{'='*70}\n\n")
+                    txt_file.write(page['text'])
+                    txt_file.write("\n")
+    finally:
+        if txt_file:
+            txt_file.close()
+
+    # Index is written last so a present index always matches a complete JSONL file
+    with open(base_path.with_suffix('.idx'), 'wb') as idx_file:
+        offsets.tofile(idx_file)
+
+    return {
+        'total_pages': len(offsets) - 1,
+        'total_chars': total_chars,
+        'bytes': offsets[-1]
+    }
+
+class PageStore:
+    """
+    Read-only, memory-mapped view of an extracted JSONL page file
+
+    Pages are decoded on demand; nothing beyond the offset index is kept in memory.
+    """
+
+    def __init__(self, base_path: Path):
+        """
+        Args:
+            base_path: Output path without extension (e.g. data/processed/rules_2025_extracted)
+        """
+        self.base_path = Path(base_path)
+        self.jsonl_path = self.base_path.with_suffix('.jsonl')
+        self.index_path = self.base_path.with_suffix('.idx')
+
+        self._file = open(self.jsonl_path, 'rb')
+        size = self.jsonl_path.stat().st_size
+        # mmap cannot map an empty file
+        self._view = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._offsets = self._load_index(size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def close(self):
+        """Release the memory map and file handle"""
+        if isinstance(self._view, mmap.mmap):
+            self._view.close()
+        self._file.close()
+
+    def get_page(self, page_num: int) -> dict:
+        """Return a single page (1-based page number)"""
+        if not 1 <= page_num <= len(self):
+            raise IndexError(f"Page {page_num} out of range (1-{len(self)})")
+        start, end = self._offsets[page_num - 1], self._offsets[page_num]
+        return json.loads(self._view[start:end])
+
+    def iter_pages(self) -> Iterator[dict]:
+        """Yield pages in order"""
+        for page_num in range(1, len(self) + 1):
+            yield self.get_page(page_num)
+
+    def iter_texts(self) -> Iterator[str]:
+        """Yield the text of each page in order"""
+        for page in self.iter_pages():
+            yield page['text']
+
+    # ========================================================================
+    # PRIVATE HELPER METHODS
+    # ========================================================================
+
+    def _load_index(self, size: int) -> array:
+        """Load the offset index, rebuilding it by scanning if missing or stale"""
+        offsets = array(INDEX_TYPECODE)
+        if self.index_path.exists():
+            with open(self.index_path, 'rb') as idx_file:
+                offsets.frombytes(idx_file.read())
+            if offsets and offsets[-1] == size:
+                return offsets
+
+        # No usable index: one sequential scan over the mapped file
+        offsets = array(INDEX_TYPECODE, [0])
+        position = 0
+        while position < size:
+            newline = self._view.find(b"\n", position)
+            position = size if newline == -1 else newline + 1
+            offsets.append(position)
+        return offsets
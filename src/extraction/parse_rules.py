@@ -1,9 +1,30 @@
 """
 Extracts text from DPDP PDFs using PyMuPDF (fitz)
+
+Pages are extracted across a process pool (--workers) and streamed to a
+JSONL file with a byte-offset index (see page_store.py) as they are merged
+back in page order.
+
+Extraction is incremental: pages are cached under data/cache/extraction/ by
+the hash of their content stream, and each PDF version is recorded by its
+SHA-256. Re-running against an unchanged PDF is a no-op, and a re-issued
+gazette only re-extracts the pages that were amended.
+
+Only extraction is incremental. The changed page numbers are reported and
+recorded in the version manifest, but extract_requirements.py still
+re-parses the full page stream (rules run across page boundaries); what
+it writes is incremental at the requirement level, through the diff in
+versioning.py.
 """
 
 import fitz  # PyMuPDF
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from time import perf_counter
+from typing import Iterable, Iterator, Optional
+import argparse
+import hashlib
 import sys
 import json
 
@@ -11,76 +32,363 @@ import json
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from config.config import EXTRACTION_WORKERS
+from src.extraction.page_store import write_pages
+
 # Paths
 RAW_DATA_PATH = project_root / "data" / "raw"
 PROCESSED_DATA_PATH = project_root / "data" / "processed"
+CACHE_PATH = project_root / "data" / "cache" / "extraction"
+PAGE_CACHE_PATH = CACHE_PATH / "pages"          # <content_hash>.txt
+MANIFEST_PATH = CACHE_PATH / "manifests"        # <pdf_sha256>.json (one per PDF version)
+OUTPUT_STATE_PATH = CACHE_PATH / "outputs.json" # last extracted version per output
+
+# Pool start-up (~50-100ms) outweighs parallel extraction on short documents
+PARALLEL_MIN_PAGES = 64
+
+def compute_file_sha256(path: Path) -> str:
+    """Compute SHA-256 of a file without loading it into memory"""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def compute_page_hash(page) -> str:
+    """
+    Hash a page by its raw content stream and geometry.
+    Reading the content stream is much cheaper than running text extraction,
+    so unchanged pages can be recognised without calling get_text().
+    """
+    sha = hashlib.sha256()
+    sha.update(page.read_contents())
+    sha.update(repr(tuple(page.rect)).encode('ascii'))
+    return sha.hexdigest()
+
+def load_cached_page(content_hash: str) -> Optional[str]:
+    """Return cached page text, or None if the page has not been extracted before"""
+    cache_file = PAGE_CACHE_PATH / f"{content_hash}.txt"
+    if not cache_file.exists():
+        return None
+    return cache_file.read_text(encoding='utf-8')
+
+def save_cached_page(content_hash: str, text: str):
+    """Store extracted page text under its content hash"""
+    PAGE_CACHE_PATH.mkdir(parents=True, exist_ok=True)
+    (PAGE_CACHE_PATH / f"{content_hash}.txt").write_text(text, encoding='utf-8')
+
+def load_manifest(pdf_sha256: str) -> Optional[dict]:
+    """Load the page manifest recorded for a PDF version"""
+    manifest_file = MANIFEST_PATH / f"{pdf_sha256}.json"
+    if not manifest_file.exists():
+        return None
+    with open(manifest_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_manifest(filename: str, pdf_sha256: str, page_hashes: list):
+    """Record the page hashes of a PDF version (kept for every version seen)"""
+    MANIFEST_PATH.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        'filename': filename,
+        'sha256': pdf_sha256,
+        'total_pages': len(page_hashes),
+        'page_hashes': page_hashes,
+        'extracted_at': datetime.now().isoformat()
+    }
+    with open(MANIFEST_PATH / f"{pdf_sha256}.json", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+def load_output_state() -> dict:
+    """Load the output name -> last extracted version mapping"""
+    if not OUTPUT_STATE_PATH.exists():
+        return {}
+    with open(OUTPUT_STATE_PATH, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_output_state(state: dict):
+    """Persist the output name -> last extracted version mapping"""
+    CACHE_PATH.mkdir(parents=True, exist_ok=True)
+    with open(OUTPUT_STATE_PATH, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
+
+def diff_page_hashes(previous_hashes: list, current_hashes: list) -> list:
+    """
+    Compare two versions of a document page by page
+
+    Returns: List of 1-based page numbers that were added or changed
+    """
+    changed = []
+    for index, content_hash in enumerate(current_hashes):
+        if index >= len(previous_hashes) or previous_hashes[index] != content_hash:
+            changed.append(index + 1)
+    return changed
+
+def scan_page_hashes(pdf_path: Path) -> list:
+    """Hash every page's content stream (cheap; no text extraction)"""
+    doc = fitz.open(pdf_path)
+    try:
+        return [compute_page_hash(doc[page_num]) for page_num in range(len(doc))]
+    finally:
+        doc.close()
+
+def _extract_page_range(task: tuple) -> list:
+    """
+    Process pool worker: extract text for a list of pages
+    Each worker opens its own document handle (fitz documents are not shareable)
+
+    Returns: List of (page_num, text) tuples
+    """
+    pdf_path, page_numbers = task
+    doc = fitz.open(pdf_path)
+    try:
+        return [(page_num, doc[page_num - 1].get_text()) for page_num in page_numbers]
+    finally:
+        doc.close()
+
+def _split_into_ranges(page_numbers: list, workers: int) -> list:
+    """Split pages into contiguous chunks, a few per worker for load balancing"""
+    chunk_count = max(1, min(len(page_numbers), workers * 4))
+    chunk_size = -(-len(page_numbers) // chunk_count)  # ceiling division
+    return [page_numbers[i:i + chunk_size] for i in range(0, len(page_numbers), chunk_size)]
+
+
+def iter_extracted_pages(pdf_path: Path, page_hashes: list = None, workers: int = 1,
+                         use_cache: bool = True, stats: dict = None,
+                         min_parallel_pages: int = PARALLEL_MIN_PAGES,
+                         verbose: bool = True) -> Iterator[dict]:
+    """
+    Yield extracted pages in page order
+
+    Pages found in the page cache are read from it; the remaining pages are
+    split into ranges and extracted across a process pool. At most
+    `workers` chunks are submitted at a time; the next one is submitted as
+    each result is consumed, and results are merged back in page order, so
+    a slow consumer holds only the chunks in that window, not the whole
+    document's text.
+
+    Args:
+        pdf_path: PDF to extract
+        page_hashes: Pre-computed page content hashes (scanned if omitted)
+        workers: Number of extraction processes (1 = in-process)
+        use_cache: Reuse cached page text
+        stats: Optional dict updated with 'extracted_pages' / 'cached_pages'
+        min_parallel_pages: Below this many pages to extract, stay in-process
+            (process start-up costs more than it saves on short documents)
+        verbose: Print progress every 5 pages
+
+    Yields:
+        {'page_num', 'content_hash', 'text'} dictionaries
+    """
+    if page_hashes is None:
+        page_hashes = scan_page_hashes(pdf_path)
+    if stats is None:
+        stats = {}
+    stats.update({'extracted_pages': 0, 'cached_pages': 0})
+
+    # Only pages missing from the cache need extraction
+    missing = [
+        page_num for page_num, content_hash in enumerate(page_hashes, 1)
+        if not use_cache or not (PAGE_CACHE_PATH / f"{content_hash}.txt").exists()
+    ]
+
+    chunks = _split_into_ranges(missing, workers) if missing else []
+    chunk_of_page = {page_num: index for index, chunk in enumerate(chunks) for page_num in chunk}
+    chunk_results = {}
+
+    use_pool = workers > 1 and len(chunks) > 1 and len(missing) >= min_parallel_pages
+    executor = ProcessPoolExecutor(max_workers=workers) if use_pool else None
+    try:
+        # Chunk index -> future, for the window of chunks in flight
+        futures = {}
+        next_chunk = 0
+        if executor:
+            while next_chunk < min(workers, len(chunks)):
+                futures[next_chunk] = executor.submit(_extract_page_range, (str(pdf_path), chunks[next_chunk]))
+                next_chunk += 1
+
+        for page_num, content_hash in enumerate(page_hashes, 1):
+            chunk_index = chunk_of_page.get(page_num)
 
-def extract_text_from_pdf(pdf_path: Path) -> dict:
+            if chunk_index is None:
+                text = load_cached_page(content_hash)
+                stats['cached_pages'] += 1
+            else:
+                if chunk_index not in chunk_results:
+                    if executor:
+                        extracted = futures.pop(chunk_index).result()  # releases the future's copy
+                        if next_chunk < len(chunks):
+                            futures[next_chunk] = executor.submit(
+                                _extract_page_range, (str(pdf_path), chunks[next_chunk])
+                            )
+                            next_chunk += 1
+                    else:
+                        extracted = _extract_page_range((str(pdf_path), chunks[chunk_index]))
+                    chunk_results[chunk_index] = dict(extracted)
+                text = chunk_results[chunk_index].pop(page_num)
+                if not chunk_results[chunk_index]:
+                    del chunk_results[chunk_index]
+                save_cached_page(content_hash, text)
+                stats['extracted_pages'] += 1
+
+            yield {
+                'page_num': page_num,
+                'content_hash': content_hash,
+                'text': text
+            }
+
+            # Progress indicator
+            if verbose and page_num % 5 == 0:
+                print(f"  Processed {page_num}/{len(page_hashes)} pages...")
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+
+def extract_text_from_pdf(pdf_path: Path, use_cache: bool = True, workers: int = 1) -> dict:
     """
     Extract text from PDF page by page
     Returns a dictionary with the total number of pages and the text of each page
+
+    Holds every page in memory; main() streams pages to disk with
+    iter_extracted_pages() + write_pages_jsonl() instead.
     """
     try:
-        doc = fitz.open(pdf_path)
+        stats = {}
+        page_hashes = scan_page_hashes(pdf_path)
+        pages = list(iter_extracted_pages(pdf_path, page_hashes, workers, use_cache, stats))
         
-        result = {
+        return {
             'filename': pdf_path.name,
-            'total_pages': len(doc),
-            'pages': []
+            'sha256': compute_file_sha256(pdf_path),
+            'total_pages': len(pages),
+            'pages': pages,
+            'extracted_pages': stats['extracted_pages'],
+            'cached_pages': stats['cached_pages']
         }
         
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            text = page.get_text()
-            
-            result['pages'].append({
-                'page_num': page_num + 1,
-                'text': text
-            })
-            
-            # Progress indicator
-            if (page_num + 1) % 5 == 0:
-                print(f"  Processed {page_num + 1}/{len(doc)} pages...")
-        
-        doc.close()
-        return result
-        
     except Exception as e:
         print(f"✗ Error extracting text: {e}")
         return None
 
-def save_extracted_text(data: dict, output_filename: str):
+def is_output_current(pdf_sha256: str, output_filename: str) -> bool:
+    """Check whether outputs already hold the extraction of this exact PDF version"""
+    state = load_output_state().get(output_filename)
+    if not state or state.get('sha256') != pdf_sha256:
+        return False
+    return all(
+        (PROCESSED_DATA_PATH / f"{output_filename}{ext}").exists()
+        for ext in ('.jsonl', '.idx')
+    )
+
+def get_changed_pages(page_hashes: list, output_filename: str) -> list:
     """
-    Save extracted text to JSON and TXT files
-    
+    Compare page hashes against the previously extracted version of the same output
+
+    Returns: List of page numbers changed since that version (all pages if none)
+    """
+    previous = load_output_state().get(output_filename, {})
+
+    previous_manifest = load_manifest(previous['sha256']) if previous.get('sha256') else None
+    if not previous_manifest:
+        return list(range(1, len(page_hashes) + 1))
+
+    return diff_page_hashes(previous_manifest['page_hashes'], page_hashes)
+
+def record_output_version(filename: str, pdf_sha256: str, output_filename: str, changed_pages: list):
+    """Record the PDF version now held by an output (call after outputs are written)"""
+    state = load_output_state()
+    previous = state.get(output_filename, {})
+
+    history = previous.get('history', [])
+    if pdf_sha256 not in history:
+        history.append(pdf_sha256)
+
+    state[output_filename] = {
+        'filename': filename,
+        'sha256': pdf_sha256,
+        'previous_sha256': previous.get('sha256'),
+        'changed_pages': changed_pages,
+        'history': history,
+        'updated_at': datetime.now().isoformat()
+    }
+    save_output_state(state)
+
+def write_pages_jsonl(pages: Iterable[dict], output_filename: str, write_txt: bool = False) -> dict:
+    """
+    Stream pages to JSONL (one page per line) with a byte-offset index
+
+    Pages are written as they arrive, so the full page list is never held in
+    memory. Read them back with PageStore.
+
     Args:
-        data: Extraction result dictionary
+        pages: Iterable of page dictionaries (from iter_extracted_pages)
         output_filename: Base filename (without extension)
+        write_txt: Also write the combined TXT file (for manual review)
+
+    Returns:
+        Summary dict with total_pages and total_chars
     """
-    # Save as JSON (structured)
-    json_path = PROCESSED_DATA_PATH / f"{output_filename}.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"  ✓ Saved JSON: {json_path.name}")
+    summary = write_pages(pages, PROCESSED_DATA_PATH / output_filename, write_txt)
     
-    # Save as TXT (all text combined)
-    txt_path = PROCESSED_DATA_PATH / f"{output_filename}.txt"
-    with open(txt_path, 'w', encoding='utf-8') as f:
-        for page in data['pages']:
-            f.write(f"\n{'='*70}\n")
-            f.write(f"PAGE {page['page_num']}\n")
-            f.write(f"{'='*70}\n\n")
-            f.write(page['text'])
-            f.write("\n")
-    print(f"  ✓ Saved TXT: {txt_path.name}")
+    print(f"  ✓ Saved JSONL: {output_filename}.jsonl ({summary['bytes']:,} bytes)")
+    print(f"  ✓ Saved index: {output_filename}.idx")
+    if write_txt:
+        print(f"  ✓ Saved TXT: {output_filename}.txt")
+    print(f"  Total pages: {summary['total_pages']}")
+    print(f"  Total characters: {summary['total_chars']:,}")
     
-    # Save summary
-    total_chars = sum(len(page['text']) for page in data['pages'])
-    print(f"  Total pages: {data['total_pages']}")
-    print(f"  Total characters: {total_chars:,}")
+    return summary
+
+def benchmark_extraction(pdf_paths: list, worker_counts: list = None, repeats: int = 3) -> list:
+    """
+    Time uncached extraction of each PDF at different worker counts
+
+    Args:
+        pdf_paths: PDFs to extract
+        worker_counts: Process counts to compare (default: 1, 2, 4, EXTRACTION_WORKERS)
+        repeats: Timed runs per configuration (best time is reported)
+
+    Returns:
+        List of result dicts (file, pages, workers, seconds, pages_per_second)
+    """
+    worker_counts = worker_counts or sorted({1, 2, 4, EXTRACTION_WORKERS})
+    results = []
+
+    for pdf_path in pdf_paths:
+        page_hashes = scan_page_hashes(pdf_path)
+        for workers in worker_counts:
+            timings = []
+            for _ in range(repeats):
+                start = perf_counter()
+                pages = iter_extracted_pages(pdf_path, page_hashes, workers, use_cache=False,
+                                             min_parallel_pages=0, verbose=False)
+                for page in pages:
+                    pass
+                timings.append(perf_counter() - start)
+
+            best = min(timings)
+            results.append({
+                'file': Path(pdf_path).name,
+                'pages': len(page_hashes),
+                'workers': workers,
+                'seconds': round(best, 4),
+                'pages_per_second': round(len(page_hashes) / best, 1) if best else None
+            })
+
+    return results
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(description="Extract text from DPDP PDFs")
+    parser.add_argument('--workers', type=int, default=EXTRACTION_WORKERS,
+                        help=f"Extraction processes (default: {EXTRACTION_WORKERS})")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Re-extract every page even if unchanged")
+    parser.add_argument('--txt', action='store_true',
+                        help="Also write a combined TXT copy for manual review")
+    parser.add_argument('--benchmark', action='store_true',
+                        help="Benchmark extraction at different worker counts and exit")
+    args = parser.parse_args()
+
     print("=" * 70)
     print("DPDPA PDF Text Extraction")
     print("=" * 70)
@@ -102,6 +410,14 @@ def main():
         }
     ]
     
+    if args.benchmark:
+        pdf_paths = [RAW_DATA_PATH / p['filename'] for p in pdfs if (RAW_DATA_PATH / p['filename']).exists()]
+        print(f"{'File':40s} {'Pages':>5s} {'Workers':>7s} {'Seconds':>8s} {'Pages/s':>8s}")
+        print("-" * 70)
+        for row in benchmark_extraction(pdf_paths):
+            print(f"{row['file']:40s} {row['pages']:5d} {row['workers']:7d} {row['seconds']:8.3f} {row['pages_per_second']:8.1f}")
+        return
+    
     # Processing PDFs
     for pdf_info in pdfs:
         pdf_path = RAW_DATA_PATH / pdf_info['filename']
@@ -115,15 +431,35 @@ def main():
             print()
             continue
         
-        # Text extraction
-        data = extract_text_from_pdf(pdf_path)
+        # Skip entirely if this exact PDF version was already extracted
+        pdf_sha256 = compute_file_sha256(pdf_path)
+        if not args.no_cache and is_output_current(pdf_sha256, pdf_info['output']):
+            print(f"  ✓ Unchanged (SHA-256 {pdf_sha256[:12]}...) - outputs are current, skipping")
+            print()
+            continue
         
-        if data:
-            # Save results
-            save_extracted_text(data, pdf_info['output'])
+        try:
+            page_hashes = scan_page_hashes(pdf_path)
+            
+            # Report pages amended since the last extracted version
+            changed_pages = get_changed_pages(page_hashes, pdf_info['output'])
+            if len(changed_pages) < len(page_hashes):
+                print(f"  Changed pages since last version: {changed_pages if changed_pages else 'none'} "
+                      f"(re-extracted; requirements are re-parsed in full)")
+            
+            # Stream pages to disk (cached pages are reused, the rest extracted in parallel)
+            stats = {}
+            pages = iter_extracted_pages(pdf_path, page_hashes, args.workers, not args.no_cache, stats)
+            write_pages_jsonl(pages, pdf_info['output'], args.txt)
+            print(f"  Re-extracted {stats['extracted_pages']} page(s) with {args.workers} worker(s), "
+                  f"reused {stats['cached_pages']} from cache")
+            
+            # Record the version the outputs now hold
+            save_manifest(pdf_path.name, pdf_sha256, page_hashes)
+            record_output_version(pdf_path.name, pdf_sha256, pdf_info['output'], changed_pages)
             print()
-        else:
-            print(f"✗ Failed to extract text from {pdf_info['filename']}")
+        except Exception as e:
+            print(f"✗ Failed to extract text from {pdf_info['filename']}: {e}")
             print()
     
     # Final summary
@@ -132,12 +468,10 @@ def main():
     print("=" * 70)
     print()
     print("Output files in: data/processed/")
-    print("  - rules_2025_extracted.json")
-    print("  - rules_2025_extracted.txt")
-    print("  - act_2023_extracted.json")
-    print("  - act_2023_extracted.txt")
+    print("  - rules_2025_extracted.jsonl (+ .idx)")
+    print("  - act_2023_extracted.jsonl (+ .idx)")
     print()
     print("Next step: python src/extraction/extract_requirements.py")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
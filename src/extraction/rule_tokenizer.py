@@ -0,0 +1,352 @@
+"""
+Rule Tokenizer
+Single-pass tokenizer for DPDP Rules text
+
+Scans cleaned Rules text once with precompiled patterns and builds a tree:
+
+    rule     -> {'number', 'title', 'start', 'content_start', 'end', 'content', 'body', 'subrules'}
+    subrule  -> {'id', 'kind', 'start', 'end', 'text', 'clauses'}
+    clause   -> {'id', 'start', 'end', 'text'}
+
+Rule offsets index the cleaned document text. Sub-rule offsets index the
+rule's 'body' (normalized content with illustrations/cases removed), and
+clause offsets index the sub-rule's 'text'.
+
+The tree reproduces the behaviour of the original regex pipeline in
+extract_requirements.py (see check_tokenizer.py for the regression check),
+in linear time and without DOTALL/lazy backtracking.
+
+Usage:
+    from src.extraction.rule_tokenizer import tokenize_rules
+
+    for rule in tokenize_rules(text):
+        print(rule['number'], rule['title'], len(rule['subrules']))
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+# ============================================================================
+# DOCUMENT-LEVEL TOKENS
+# ============================================================================
+
+# Every token starts with "." or a newline, so the scan skips ahead with a
+# literal-prefix search instead of trying each alternative at every position.
+#   heading:  "." followed by whitespace and a capital (digits checked before it)
+#   dash:     ". —" ending a heading title
+#   schedule: FIRST SCHEDULE as a heading (on its own line)
+DOCUMENT_TOKEN = re.compile(
+    r'\.(?:(?=(?P<heading>\s+)[A-Z])|(?P<dash>\s*[—–]))'
+    r'|(?P<schedule>\n\s*(?i:FIRST SCHEDULE)\s*\n)'
+)
+DOCUMENT_START_SCHEDULE = re.compile(r'(?i:FIRST SCHEDULE)\s*\n')
+
+# Characters that must follow a token before it is trusted when streaming
+TOKEN_LOOKAHEAD = 64
+
+# ============================================================================
+# CONTENT-LEVEL TOKENS
+# ============================================================================
+
+# marker: (a) / (A) / (1) - ends an illustration; (a) and (1) delimit sub-rules
+# illustration / case: start of an example block (removed from the body)
+# The leading lookahead lets the scan skip to candidate characters.
+CONTENT_TOKEN = re.compile(
+    r'(?=[(IiCc])(?:'
+    r'(?P<marker>\((?:(?P<letter>[a-z])|(?P<upper>[A-Z])|(?P<digits>\d+))\))'
+    r'|(?P<illustration>\b(?i:illustration)\.?\s+)'
+    r'|(?P<case>(?i:case) \d+:)'
+    r')'
+)
+
+# Parenthesised lowercase identifiers inside a numbered sub-rule: (a), (iv), ...
+CLAUSE_TOKEN = re.compile(r'\((?P<id>[a-z]+)\)|[()]')
+
+WHITESPACE = re.compile(r'\s+')
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse all whitespace runs to single spaces and strip"""
+    # str.split() splits on the same characters as \s, without a regex pass
+    return ' '.join(text.split())
+
+# ============================================================================
+# DOCUMENT SCAN
+# ============================================================================
+
+def iter_rule_spans(text: Union[str, Iterable[str]]) -> Iterator[Dict[str, Any]]:
+    """
+    Yield rule headings and raw content spans in document order
+
+    Accepts the full text or an iterable of chunks (e.g. cleaned pages).
+    Chunks are scanned once; the buffer only holds the rule currently being
+    read plus a short look-ahead, so memory stays bounded on large corpora.
+
+    Yields:
+        {'number', 'title', 'start', 'content_start', 'end', 'raw'} dictionaries
+        (offsets are absolute positions in the concatenated text)
+    """
+    chunks = iter([text] if isinstance(text, str) else text)
+
+    buffer = ''
+    base = 0            # Absolute offset of buffer[0]
+    scan_pos = 0        # Buffer position where the next token search starts
+    current = None      # Rule whose content is being read
+    pending = None      # Heading seen, waiting for its ". —"
+
+    next_chunk = next(chunks, None)
+    if next_chunk is not None and DOCUMENT_START_SCHEDULE.match(next_chunk):
+        return
+
+    while next_chunk is not None:
+        # Drop text no longer needed: before the current rule's content,
+        # the pending heading, or the look-ahead window
+        if current is not None:
+            keep_from = current['content_start'] - base
+        elif pending is not None:
+            keep_from = pending['start']
+        else:
+            keep_from = max(0, scan_pos - TOKEN_LOOKAHEAD)
+        if keep_from:
+            buffer = buffer[keep_from:]
+            base += keep_from
+            scan_pos -= keep_from
+            if pending is not None:
+                pending['start'] -= keep_from
+                pending['title_start'] -= keep_from
+
+        buffer += next_chunk
+        next_chunk = next(chunks, None)
+        # Tokens near the end of the buffer may still grow with the next chunk
+        safe_end = len(buffer) if next_chunk is None else len(buffer) - TOKEN_LOOKAHEAD
+
+        for token in DOCUMENT_TOKEN.finditer(buffer, scan_pos):
+            if token.start() >= safe_end:
+                break
+            scan_pos = token.end()
+            kind = token.lastgroup
+
+            if kind == 'schedule':
+                # Everything from here on belongs to the schedules
+                buffer = buffer[:token.start()]
+                next_chunk = None
+                break
+
+            if kind == 'heading' and pending is None:
+                # Heading number: the one or two digits right before the period
+                period = token.start()
+                start = period
+                while start > period - 2 and start > 0 and buffer[start - 1].isdecimal():
+                    start -= 1
+                if start < period:
+                    pending = {
+                        'number': buffer[start:period],
+                        'start': start,
+                        'title_start': period + 1 + len(token.group('heading'))
+                    }
+            elif kind == 'dash' and pending is not None and token.start() > pending['title_start']:
+                if current is not None:
+                    current['end'] = base + pending['start']
+                    current['raw'] = buffer[current['content_start'] - base:pending['start']]
+                    yield current
+
+                current = {
+                    'number': pending['number'],
+                    'title': normalize_whitespace(buffer[pending['title_start']:token.start()]),
+                    'start': base + pending['start'],
+                    'content_start': base + token.end(),
+                }
+                pending = None
+
+        scan_pos = max(scan_pos, safe_end)
+
+    if current is not None:
+        current['end'] = base + len(buffer)
+        current['raw'] = buffer[current['content_start'] - base:]
+        yield current
+
+# ============================================================================
+# CONTENT SCAN
+# ============================================================================
+
+def _is_word_char(char: str) -> bool:
+    """Same characters as \\w"""
+    return char.isalnum() or char == '_'
+
+def _whitespace_start(text: str, position: int, floor: int) -> int:
+    """Start of the whitespace run ending at position (not before floor)"""
+    while position > floor and text[position - 1].isspace():
+        position -= 1
+    return position
+
+def tokenize_content(content: str, strip_examples: bool = True) -> Dict[str, Any]:
+    """
+    Tokenize normalized rule content in one pass
+
+    Illustration blocks ("Illustration. ..." up to the next (a)/(A)/(1)
+    marker) and worked examples ("Case 1: ..." up to the next "case N:" or
+    the end of the rule) are removed from the body while sub-rule markers
+    are collected.
+
+    Args:
+        content: Rule content (whitespace-normalized)
+        strip_examples: Remove illustrations and cases
+
+    Returns:
+        {'body': str, 'subrules': [subrule nodes]}
+    """
+    pieces = []
+    body_length = 0
+    copy_from = 0             # Next content position to copy into the body
+    illustration_end = None   # Set while inside an illustration block
+    in_cases = False          # Inside a worked example ("Case N: ...")
+    case_end = 0              # End of the last case heading seen
+    markers = []              # (body_offset, kind, identifier, length)
+
+    for token in CONTENT_TOKEN.finditer(content):
+        kind = token.lastgroup
+
+        if not strip_examples and kind != 'marker':
+            continue
+
+        if illustration_end is not None:
+            if kind != 'marker':
+                continue
+            # Illustration ends at the whitespace before the marker
+            copy_from = max(_whitespace_start(content, token.start(), illustration_end), illustration_end)
+            illustration_end = None
+
+        if kind == 'illustration':
+            if not in_cases:
+                pieces.append(content[copy_from:token.start()])
+                body_length += token.start() - copy_from
+            illustration_end = token.end()
+            copy_from = token.end()
+
+        elif kind == 'case':
+            # Only "Case N:" at a word start opens a case, but any "case N:" closes one
+            is_heading = token.start() == 0 or not _is_word_char(content[token.start() - 1])
+            if in_cases:
+                gap_start = max(_whitespace_start(content, token.start(), case_end), case_end)
+                if is_heading:
+                    # Only the whitespace separating consecutive cases survives
+                    pieces.append(content[gap_start:token.start()])
+                    body_length += token.start() - gap_start
+                    case_end = token.end()
+                else:
+                    # Ordinary text resumes after the case
+                    in_cases = False
+                    copy_from = gap_start
+            elif is_heading:
+                pieces.append(content[copy_from:token.start()])
+                body_length += token.start() - copy_from
+                in_cases = True
+                case_end = token.end()
+
+        elif not in_cases and (token.group('letter') or token.group('digits')):
+            body_offset = body_length + token.start() - copy_from
+            marker_kind = 'letter' if token.group('letter') else 'number'
+            markers.append((body_offset, marker_kind, token.group('letter') or token.group('digits'),
+                            token.end() - token.start()))
+
+    if illustration_end is None and not in_cases:
+        pieces.append(content[copy_from:])
+
+    body = ''.join(pieces)
+    return {'body': body, 'subrules': _build_subrules(body, markers)}
+
+def _build_subrules(body: str, markers: List[tuple]) -> List[Dict[str, Any]]:
+    """Split the body at top-level markers: (a) or (1), whichever comes first"""
+    lettered = []
+    numbered = []
+    for offset, kind, identifier, length in markers:
+        # A marker only counts when followed by whitespace
+        gap = WHITESPACE.match(body, offset + length)
+        if not gap:
+            continue
+        entry = (offset, gap.end(), identifier)
+        (lettered if kind == 'letter' else numbered).append(entry)
+
+    if lettered and (not numbered or lettered[0][0] < numbered[0][0]):
+        positions, kind = lettered, 'letter'
+    elif numbered:
+        positions, kind = numbered, 'number'
+    else:
+        return []
+
+    subrules = []
+    for i, (start, text_start, identifier) in enumerate(positions):
+        end = positions[i + 1][0] if i + 1 < len(positions) else len(body)
+        text = normalize_whitespace(body[text_start:end])
+
+        # Skip if too short or empty
+        if len(text) > 30:
+            subrules.append({
+                'id': identifier,
+                'kind': kind,
+                'start': start,
+                'end': end,
+                'text': text,
+                'clauses': tokenize_clauses(text) if kind == 'number' else []
+            })
+
+    return subrules
+
+def tokenize_clauses(text: str) -> List[Dict[str, Any]]:
+    """
+    Find lettered clauses (a), (b), (iv) ... nested in a numbered sub-rule
+
+    A clause runs to the next parenthesised lowercase identifier (or the
+    end of the text) and may not contain other parentheses.
+    """
+    clauses = []
+    tokens = list(CLAUSE_TOKEN.finditer(text))
+
+    for i, token in enumerate(tokens):
+        if not token.group('id'):
+            continue
+
+        clause_start = token.end()
+        if clause_start >= len(text) or not text[clause_start].isspace():
+            continue
+
+        following = tokens[i + 1] if i + 1 < len(tokens) else None
+        if following is not None and not following.group('id'):
+            continue  # Stray parenthesis before the next clause
+
+        end = following.start() if following is not None else len(text)
+        if end - clause_start < 2:
+            continue
+
+        clauses.append({
+            'id': token.group('id'),
+            'start': token.start(),
+            'end': end,
+            'text': normalize_whitespace(text[clause_start:end])
+        })
+
+    return clauses
+
+# ============================================================================
+# TREE
+# ============================================================================
+
+def tokenize_rules(text: Union[str, Iterable[str]], strip_examples: bool = True) -> Iterator[Dict[str, Any]]:
+    """
+    Yield rule nodes (with sub-rules and clauses) in document order
+
+    Args:
+        text: Cleaned Rules text, or an iterable of cleaned page chunks
+        strip_examples: Remove illustrations and worked examples from bodies
+
+    Yields:
+        Rule node dictionaries (see module docstring)
+    """
+    for span in iter_rule_spans(text):
+        content = normalize_whitespace(span.pop('raw'))
+        span['content'] = content
+        span.update(tokenize_content(content, strip_examples))
+        yield span
+
+def build_tree(text: Union[str, Iterable[str]]) -> Dict[str, Any]:
+    """Tokenize a whole document into {'rules': [rule nodes]}"""
+    return {'rules': list(tokenize_rules(text))}
@@ -0,0 +1,398 @@
+"""
+Full-Text Search Index
+SQLite FTS5 index over requirement text, rule numbers and the DPDPA reference guide
+
+Each indexed document (a requirement or a reference guide section) has a
+row in search_documents holding its content hash; syncing only rewrites
+documents whose hash changed, so rebuilding after an extraction diff
+touches just the changed rows. Results are ranked with BM25 (titles
+weighted above body text) and returned with highlighted snippets.
+
+Usage:
+    python src/extraction/search_index.py                     # sync the index
+    python src/extraction/search_index.py --query "breach 72 hours"
+    python src/extraction/search_index.py --benchmark
+
+    from src.extraction.search_index import search
+    results = search("parental consent", limit=10)
+"""
+
+import argparse
+import hashlib
+import re
+import sqlite3
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Set
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.config import DB_PATH
+
+REFERENCE_PATH = project_root / "DPDPA_reference.md"
+
+# BM25 column weights: title (rule number / section heading), body
+TITLE_WEIGHT = 5.0
+BODY_WEIGHT = 1.0
+
+# Snippet highlighting (markdown bold, as rendered by the dashboard)
+SNIPPET_START = '**'
+SNIPPET_END = '**'
+SNIPPET_TOKENS = 16
+
+HEADING_PATTERN = re.compile(r'^(#{1,3})\s+(.*\S)\s*$')
+MARKDOWN_NOISE = re.compile(r'\*\*|`|^\s*---+\s*$', re.MULTILINE)
+QUERY_TERM = re.compile(r'\w+')
+
+def ensure_search_schema(cursor) -> bool:
+    """
+    Create the FTS5 index tables if missing
+
+    Returns:
+        False if this SQLite build has no FTS5 support
+    """
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS search_index
+            USING fts5(title, body, tokenize = 'porter unicode61')
+        """)
+    except sqlite3.OperationalError as e:
+        print(f"⚠️  Full-text search unavailable: {e}")
+        return False
+
+    # search_index.rowid = search_documents.id
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS search_documents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            doc_key TEXT UNIQUE NOT NULL,
+            kind TEXT NOT NULL,
+            content_hash TEXT NOT NULL
+        )
+    """)
+    return True
+
+def _content_hash(title: str, body: str) -> str:
+    """Hash of an indexed document's title and body"""
+    return hashlib.sha256(f"{title}\n{body}".encode('utf-8')).hexdigest()
+
+def _slugify(text: str) -> str:
+    """Lowercase, hyphen-separated section slug"""
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+def load_reference_sections(path: Path = REFERENCE_PATH) -> List[Dict[str, str]]:
+    """
+    Split the reference guide into sections at level 1-3 headings
+
+    Returns:
+        List of {'key', 'title', 'body'} dictionaries in document order
+    """
+    if not Path(path).exists():
+        return []
+
+    sections = []
+    seen = {}
+    title = None
+    lines = []
+
+    def flush():
+        body = ' '.join(MARKDOWN_NOISE.sub(' ', '\n'.join(lines)).split())
+        if title and body:
+            slug = _slugify(title) or 'section'
+            seen[slug] = seen.get(slug, 0) + 1
+            key = slug if seen[slug] == 1 else f"{slug}-{seen[slug]}"
+            sections.append({'key': f"reference:{key}", 'title': title, 'body': body})
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            heading = HEADING_PATTERN.match(line)
+            if heading:
+                flush()
+                title = heading.group(2).replace('**', '').strip()
+                lines = []
+            else:
+                lines.append(line)
+    flush()
+
+    return sections
+
+def load_requirement_documents(cursor, requirement_ids: Iterable[int] = None) -> List[Dict[str, Any]]:
+    """
+    Active requirements as index documents
+
+    Args:
+        cursor: Database cursor
+        requirement_ids: Only these requirements (default: all active)
+
+    Returns:
+        List of {'key', 'title', 'body'} dictionaries
+    """
+    if requirement_ids is None:
+        cursor.execute("""
+            SELECT id, rule_number, requirement_text FROM requirements
+            WHERE is_active = 1
+        """)
+    else:
+        requirement_ids = list(requirement_ids)
+        if not requirement_ids:
+            return []
+        placeholders = ','.join('?' * len(requirement_ids))
+        cursor.execute(f"""
+            SELECT id, rule_number, requirement_text FROM requirements
+            WHERE is_active = 1 AND id IN ({placeholders})
+        """, requirement_ids)
+
+    return [
+        {'key': f"requirement:{req_id}", 'title': rule_number, 'body': text}
+        for req_id, rule_number, text in cursor.fetchall()
+    ]
+
+def _apply_documents(cursor, kind: str, documents: List[Dict[str, str]], stale_keys: Set[str]) -> Dict[str, int]:
+    """
+    Write changed documents and delete stale ones
+
+    Args:
+        cursor: Database cursor
+        kind: 'requirement' or 'reference'
+        documents: Current documents
+        stale_keys: Indexed keys to delete unless present in documents
+
+    Returns:
+        Dictionary with added, updated, removed, unchanged counts
+    """
+    counts = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+
+    for document in documents:
+        stale_keys.discard(document['key'])
+        content_hash = _content_hash(document['title'], document['body'])
+
+        cursor.execute(
+            "SELECT id, content_hash FROM search_documents WHERE doc_key = ?",
+            (document['key'],)
+        )
+        existing = cursor.fetchone()
+
+        if existing and existing[1] == content_hash:
+            counts['unchanged'] += 1
+            continue
+
+        if existing:
+            cursor.execute("DELETE FROM search_index WHERE rowid = ?", (existing[0],))
+            cursor.execute(
+                "UPDATE search_documents SET content_hash = ? WHERE id = ?",
+                (content_hash, existing[0])
+            )
+            doc_id = existing[0]
+            counts['updated'] += 1
+        else:
+            cursor.execute(
+                "INSERT INTO search_documents (doc_key, kind, content_hash) VALUES (?, ?, ?)",
+                (document['key'], kind, content_hash)
+            )
+            doc_id = cursor.lastrowid
+            counts['added'] += 1
+
+        cursor.execute(
+            "INSERT INTO search_index (rowid, title, body) VALUES (?, ?, ?)",
+            (doc_id, document['title'], document['body'])
+        )
+
+    for key in stale_keys:
+        cursor.execute("SELECT id FROM search_documents WHERE doc_key = ?", (key,))
+        existing = cursor.fetchone()
+        if existing:
+            cursor.execute("DELETE FROM search_index WHERE rowid = ?", (existing[0],))
+            cursor.execute("DELETE FROM search_documents WHERE id = ?", (existing[0],))
+            counts['removed'] += 1
+
+    return counts
+
+def sync_search_index(db_path=DB_PATH, reference_path: Path = REFERENCE_PATH) -> Dict[str, Dict[str, int]]:
+    """
+    Bring the index up to date with the requirements table and reference guide
+
+    Only documents whose content hash changed are rewritten.
+
+    Returns:
+        {'requirements': counts, 'reference': counts} (empty if FTS5 is unavailable)
+    """
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        if not ensure_search_schema(cursor):
+            return {}
+
+        with conn:
+            result = {}
+            for kind, documents in (
+                ('requirement', load_requirement_documents(cursor)),
+                ('reference', load_reference_sections(reference_path))
+            ):
+                cursor.execute("SELECT doc_key FROM search_documents WHERE kind = ?", (kind,))
+                indexed_keys = {row[0] for row in cursor.fetchall()}
+                result['requirements' if kind == 'requirement' else 'reference'] = _apply_documents(
+                    cursor, kind, documents, indexed_keys
+                )
+    finally:
+        conn.close()
+
+    return result
+
+def reindex_requirements(requirement_ids: Iterable[int], db_path=DB_PATH) -> Dict[str, int]:
+    """
+    Re-index specific requirements (removed or inactive ones are dropped)
+
+    Args:
+        requirement_ids: Added, changed or removed requirement IDs
+
+    Returns:
+        Dictionary with added, updated, removed, unchanged counts
+    """
+    requirement_ids = list(requirement_ids)
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        if not ensure_search_schema(cursor):
+            return {}
+
+        with conn:
+            documents = load_requirement_documents(cursor, requirement_ids)
+            stale_keys = {f"requirement:{req_id}" for req_id in requirement_ids}
+            counts = _apply_documents(cursor, 'requirement', documents, stale_keys)
+    finally:
+        conn.close()
+
+    return counts
+
+def reindex_on_change(changed_ids: Set[int], version_id: int) -> None:
+    """Change listener for src.extraction.versioning (register_change_listener)"""
+    counts = reindex_requirements(changed_ids)
+    if counts:
+        print(f"✓ Search index: {counts['added']} added, {counts['updated']} updated, "
+              f"{counts['removed']} removed (version {version_id})")
+
+def build_match_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 query
+
+    Every word must match (quoted, so FTS5 operators in user input are
+    literal); the last word also matches as a prefix for search-as-you-type.
+    """
+    terms = QUERY_TERM.findall(query)
+    if not terms:
+        return ''
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += '*'
+    return ' '.join(quoted)
+
+def search(query: str, limit: int = 10, kind: str = None, db_path=DB_PATH) -> List[Dict[str, Any]]:
+    """
+    Search requirements and reference guide sections
+
+    Args:
+        query: Free-text query
+        limit: Maximum number of results
+        kind: Optional filter: 'requirement' or 'reference'
+
+    Returns:
+        List of dictionaries with kind, ref (requirement ID or section key),
+        title, snippet (matches in **bold**) and score (lower is better)
+    """
+    match_query = build_match_query(query)
+    if not match_query:
+        return []
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    kind_filter = "AND d.kind = ?" if kind else ""
+    params = [match_query] + ([kind] if kind else []) + [limit]
+
+    try:
+        cursor.execute(f"""
+            SELECT
+                d.kind,
+                d.doc_key,
+                search_index.title,
+                snippet(search_index, 1, ?, ?, ' … ', ?),
+                bm25(search_index, ?, ?) AS score
+            FROM search_index
+            JOIN search_documents d ON d.id = search_index.rowid
+            WHERE search_index MATCH ? {kind_filter}
+            ORDER BY score
+            LIMIT ?
+        """, [SNIPPET_START, SNIPPET_END, SNIPPET_TOKENS, TITLE_WEIGHT, BODY_WEIGHT] + params)
+        rows = cursor.fetchall()
+    except sqlite3.OperationalError:
+        rows = []  # Index not built (or no FTS5 support)
+    finally:
+        conn.close()
+
+    results = []
+    for doc_kind, doc_key, title, snippet, score in rows:
+        ref = doc_key.split(':', 1)[1]
+        results.append({
+            'kind': doc_kind,
+            'ref': int(ref) if doc_kind == 'requirement' else ref,
+            'title': title,
+            'snippet': snippet,
+            'score': round(score, 3)
+        })
+
+    return results
+
+def benchmark_search(queries: List[str], repeats: int = 50) -> List[tuple]:
+    """Median query time in milliseconds for each query"""
+    timings = []
+    for query in queries:
+        samples = []
+        for _ in range(repeats):
+            start = perf_counter()
+            results = search(query)
+            samples.append((perf_counter() - start) * 1000)
+        samples.sort()
+        timings.append((query, len(results), samples[len(samples) // 2], samples[-1]))
+    return timings
+
+def main():
+    """Sync the index, then optionally search or benchmark"""
+    parser = argparse.ArgumentParser(description="DPDPA full-text search index")
+    parser.add_argument('--query', help="Run a search and print the results")
+    parser.add_argument('--limit', type=int, default=10, help="Maximum results for --query")
+    parser.add_argument('--benchmark', action='store_true', help="Time a set of representative queries")
+    args = parser.parse_args()
+
+    start = perf_counter()
+    result = sync_search_index()
+    if not result:
+        return 1
+    print(f"✓ Search index synced in {(perf_counter() - start) * 1000:.1f} ms")
+    for name, counts in result.items():
+        print(f"  {name:12s}: {counts['added']} added, {counts['updated']} updated, "
+              f"{counts['removed']} removed, {counts['unchanged']} unchanged")
+    print()
+
+    if args.query:
+        for item in search(args.query, args.limit):
+            print(f"  [{item['kind']}] {item['title']} ({item['score']})")
+            print(f"      {item['snippet']}")
+        print()
+
+    if args.benchmark:
+        queries = ['breach', 'parental consent', 'Rule 6', 'encryption logs', 'data retention three years',
+                   'significant data fiduciary audit', 'grievance 90 days', 'cons']
+        print(f"  {'Query':36s} {'Hits':>5s} {'Median (ms)':>12s} {'Max (ms)':>9s}")
+        for query, hits, median, worst in benchmark_search(queries):
+            print(f"  {query:36s} {hits:5d} {median:12.2f} {worst:9.2f}")
+        print()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,314 @@
+"""
+Regulation Versioning
+Diffs extracted requirements against the active set and applies only the changes
+
+Requirements are identified by a stable clause key (the rule reference,
+e.g. "Rule 6(1(a))", with an occurrence suffix for repeated references)
+and compared by text hash. Each run that changes anything records a
+regulation version plus one requirement_changes row per added, changed
+or removed clause. Changed clauses keep their requirement id, removed
+clauses are deactivated (is_active = 0) rather than deleted, so
+compliance_status rows stay valid.
+
+Downstream caches can subscribe to the changed requirement ids in-process
+(register_change_listener) or poll get_changed_requirement_ids() with the
+last version they have seen.
+
+Usage:
+    from src.extraction.versioning import diff_requirements, apply_requirement_diff
+
+    diff = diff_requirements(cursor, requirement_rows)
+    result = apply_requirement_diff(conn, diff, 'rules_2025_extracted', pdf_sha256)
+    print(result['changed_ids'])
+"""
+
+import sqlite3
+from pathlib import Path
+import sys
+from typing import Callable, Dict, Any, List, Optional, Set
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.config import DB_PATH
+from src.extraction.init_db import assign_clause_keys
+
+# Callbacks invoked as callback(changed_ids, version_id) after a version is committed
+CHANGE_LISTENERS: List[Callable[[Set[int], int], None]] = []
+
+def register_change_listener(callback: Callable[[Set[int], int], None]):
+    """Subscribe to changed requirement ids (e.g. to invalidate a cache)"""
+    if callback not in CHANGE_LISTENERS:
+        CHANGE_LISTENERS.append(callback)
+
+def unregister_change_listener(callback: Callable[[Set[int], int], None]):
+    """Remove a previously registered listener"""
+    if callback in CHANGE_LISTENERS:
+        CHANGE_LISTENERS.remove(callback)
+
+def notify_change_listeners(changed_ids: Set[int], version_id: int):
+    """Call every registered listener; a failing listener does not stop the others"""
+    for callback in list(CHANGE_LISTENERS):
+        try:
+            callback(changed_ids, version_id)
+        except Exception as e:
+            print(f"⚠️  Change listener {getattr(callback, '__name__', callback)} failed: {e}")
+
+def load_active_requirements(cursor) -> Dict[str, tuple]:
+    """
+    Load the active requirement set
+
+    Returns:
+        {clause_key: (requirement_id, requirement_text_hash, requirement_text)}
+    """
+    cursor.execute("""
+        SELECT clause_key, id, requirement_text_hash, requirement_text
+        FROM requirements
+        WHERE is_active = 1
+    """)
+    return {row[0]: row[1:] for row in cursor.fetchall()}
+
+def diff_requirements(cursor, rows: list) -> Dict[str, Any]:
+    """
+    Compare extracted requirement rows with the active set
+
+    Args:
+        cursor: Database cursor
+        rows: Rows from build_requirement_row(), in document order:
+              (rule_number, text, text_hash, obligation_type,
+               penalty_category_id, deadline, is_sdf)
+
+    Returns:
+        Dictionary with:
+            added: [(clause_key, row)]
+            changed: [(requirement_id, clause_key, old_hash, old_text, row)]
+            removed: [(requirement_id, clause_key, old_hash, old_text)]
+            unchanged: count of identical clauses
+            duplicates: count of repeated (rule_number, text) rows dropped
+    """
+    # The same clause text under the same reference is only loaded once
+    unique_rows = []
+    seen = set()
+    for row in rows:
+        if (row[0], row[2]) not in seen:
+            seen.add((row[0], row[2]))
+            unique_rows.append(row)
+
+    active = load_active_requirements(cursor)
+    keys = assign_clause_keys([row[0] for row in unique_rows])
+
+    added = []
+    changed = []
+    unchanged = 0
+    for clause_key, row in zip(keys, unique_rows):
+        current = active.pop(clause_key, None)
+        if current is None:
+            added.append((clause_key, row))
+        elif current[1] != row[2]:
+            changed.append((current[0], clause_key, current[1], current[2], row))
+        else:
+            unchanged += 1
+
+    # Whatever is left in the active set no longer appears in the text
+    removed = [
+        (req_id, clause_key, text_hash, text)
+        for clause_key, (req_id, text_hash, text) in active.items()
+    ]
+
+    return {
+        'added': added,
+        'changed': changed,
+        'removed': removed,
+        'unchanged': unchanged,
+        'duplicates': len(rows) - len(unique_rows)
+    }
+
+def apply_requirement_diff(conn, diff: Dict[str, Any], source_name: str,
+                           source_sha256: Optional[str] = None, notify: bool = True) -> Dict[str, Any]:
+    """
+    Apply a diff from diff_requirements() in one transaction
+
+    Nothing is written when the diff is empty.
+
+    Args:
+        conn: Database connection
+        diff: Output of diff_requirements()
+        source_name: Name of the extracted source (e.g. 'rules_2025_extracted')
+        source_sha256: SHA-256 of the source PDF, if known
+        notify: Call registered change listeners after committing
+
+    Returns:
+        Dictionary with version_id (None if nothing changed), added, changed,
+        removed, unchanged counts and the set of changed_ids
+    """
+    result = {
+        'version_id': None,
+        'added': 0,
+        'changed': 0,
+        'removed': 0,
+        'unchanged': diff['unchanged'],
+        'changed_ids': set()
+    }
+    if not (diff['added'] or diff['changed'] or diff['removed']):
+        return result
+
+    # (requirement_id, clause_key, change_type, old_hash, new_hash, old_text)
+    changes = []
+
+    with conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "INSERT INTO regulation_versions (source_name, source_sha256) VALUES (?, ?)",
+            (source_name, source_sha256)
+        )
+        version_id = cursor.lastrowid
+
+        # Removals first so their clause keys and texts can be reused below
+        cursor.executemany(
+            "UPDATE requirements SET is_active = 0, version_id = ? WHERE id = ?",
+            [(version_id, req_id) for req_id, _, _, _ in diff['removed']]
+        )
+        for req_id, clause_key, old_hash, old_text in diff['removed']:
+            changes.append((req_id, clause_key, 'removed', old_hash, None, old_text))
+
+        added = list(diff['added'])
+        for req_id, clause_key, old_hash, old_text, row in diff['changed']:
+            try:
+                cursor.execute("""
+                    UPDATE requirements
+                    SET requirement_text = ?, requirement_text_hash = ?, obligation_type = ?,
+                        penalty_category_id = ?, deadline = ?, is_sdf_specific = ?, version_id = ?
+                    WHERE id = ?
+                """, (row[1], row[2], row[3], row[4], row[5], row[6], version_id, req_id))
+                changes.append((req_id, clause_key, 'changed', old_hash, row[2], old_text))
+            except sqlite3.IntegrityError:
+                # New text matches another (inactive) row: retire this one
+                # and reactivate that row under this clause key instead
+                cursor.execute(
+                    "UPDATE requirements SET is_active = 0, version_id = ? WHERE id = ?",
+                    (version_id, req_id)
+                )
+                changes.append((req_id, clause_key, 'removed', old_hash, None, old_text))
+                added.append((clause_key, row))
+
+        for clause_key, row in added:
+            # Reactivate a previously removed row with the same text, if any
+            cursor.execute("""
+                INSERT INTO requirements (
+                    rule_number,
+                    requirement_text,
+                    requirement_text_hash,
+                    obligation_type,
+                    penalty_category_id,
+                    deadline,
+                    is_sdf_specific,
+                    clause_key,
+                    version_id,
+                    is_active
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+                ON CONFLICT (rule_number, requirement_text_hash) DO UPDATE
+                SET is_active = 1, clause_key = excluded.clause_key, version_id = excluded.version_id
+                WHERE is_active = 0
+                RETURNING id
+            """, (*row, clause_key, version_id))
+            inserted = cursor.fetchone()
+            if inserted:
+                changes.append((inserted[0], clause_key, 'added', None, row[2], None))
+
+        cursor.executemany("""
+            INSERT INTO requirement_changes (
+                version_id, requirement_id, clause_key, change_type,
+                old_text_hash, new_text_hash, old_text
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, [(version_id, *change) for change in changes])
+
+        counts = {change_type: 0 for change_type in ('added', 'changed', 'removed')}
+        for change in changes:
+            counts[change[2]] += 1
+        cursor.execute("""
+            UPDATE regulation_versions
+            SET added_count = ?, changed_count = ?, removed_count = ?
+            WHERE id = ?
+        """, (counts['added'], counts['changed'], counts['removed'], version_id))
+
+    result.update(counts)
+    result['version_id'] = version_id
+    result['changed_ids'] = {change[0] for change in changes}
+
+    if notify:
+        notify_change_listeners(result['changed_ids'], version_id)
+
+    return result
+
+def get_latest_version_id(db_path=DB_PATH) -> int:
+    """Id of the newest regulation version (0 if none recorded)"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("SELECT MAX(id) FROM regulation_versions")
+        latest = cursor.fetchone()[0]
+    except sqlite3.OperationalError:
+        latest = None  # Database predates versioning
+    finally:
+        conn.close()
+
+    return latest or 0
+
+def get_changed_requirement_ids(since_version_id: int = 0, db_path=DB_PATH) -> Set[int]:
+    """
+    Requirement ids added, changed or removed after a given version
+
+    Args:
+        since_version_id: Last version the caller has seen (0 = all)
+
+    Returns:
+        Set of requirement IDs
+    """
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute(
+            "SELECT DISTINCT requirement_id FROM requirement_changes WHERE version_id > ?",
+            (since_version_id,)
+        )
+        ids = {row[0] for row in cursor.fetchall()}
+    except sqlite3.OperationalError:
+        ids = set()
+    finally:
+        conn.close()
+
+    return ids
+
+def get_version_history(limit: int = 20, db_path=DB_PATH) -> List[Dict[str, Any]]:
+    """Most recent regulation versions, newest first"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("""
+            SELECT id, source_name, source_sha256, added_count, changed_count, removed_count, created_at
+            FROM regulation_versions
+            ORDER BY id DESC
+            LIMIT ?
+        """, (limit,))
+        rows = cursor.fetchall()
+    except sqlite3.OperationalError:
+        rows = []
+    finally:
+        conn.close()
+
+    return [
+        {
+            'version_id': row[0],
+            'source_name': row[1],
+            'source_sha256': row[2],
+            'added': row[3],
+            'changed': row[4],
+            'removed': row[5],
+            'created_at': row[6]
+        }
+        for row in rows
+    ]
@@ -0,0 +1,81 @@
+"""
+Shared SQLite connections
+One connection per thread and database, opened on first use and reused
+
+Long-running processes (the API service, benchmarks) call get_connection()
+instead of opening a connection per query. Connections use WAL journaling,
+so readers don't block the writer, and a busy timeout, so concurrent
+writers wait instead of failing with "database is locked".
+
+The database path defaults to config.DB_PATH (override with the
+DPDPA_DB_PATH environment variable).
+
+Usage:
+    from src.utils.db import get_connection
+
+    conn = get_connection()
+    conn.execute("SELECT COUNT(*) FROM requirements").fetchone()
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+import sys
+from typing import Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.config import DB_PATH
+from src.utils.metrics import instrument_connection
+
+# Milliseconds a connection waits for a lock before raising
+BUSY_TIMEOUT_MS = 5000
+
+_local = threading.local()
+
+
+def configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Enable WAL journaling, the busy timeout and statement counting on a connection"""
+    instrument_connection(conn)
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    try:
+        # Persistent for the database file; needs a brief write lock once
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+    except sqlite3.OperationalError as e:
+        print(f"⚠️  Could not enable WAL mode: {e}")
+    return conn
+
+
+def get_connection(db_path: Optional[str] = None) -> sqlite3.Connection:
+    """
+    Connection for the current thread (opened and configured on first use)
+
+    Do not close it; use close_connection() when a thread is done.
+
+    Args:
+        db_path: Database file (default: config.DB_PATH)
+
+    Returns:
+        sqlite3.Connection owned by the calling thread
+    """
+    db_path = str(db_path or DB_PATH)
+    connections = getattr(_local, 'connections', None)
+    if connections is None:
+        connections = _local.connections = {}
+
+    conn = connections.get(db_path)
+    if conn is None:
+        conn = configure_connection(sqlite3.connect(db_path))
+        connections[db_path] = conn
+    return conn
+
+
+def close_connection(db_path: Optional[str] = None) -> None:
+    """Close the current thread's connection to a database, if open"""
+    connections = getattr(_local, 'connections', {})
+    conn = connections.pop(str(db_path or DB_PATH), None)
+    if conn is not None:
+        conn.close()
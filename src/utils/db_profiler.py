@@ -0,0 +1,526 @@
+"""
+SQLite Query Profiler
+Per-statement call counts, timings and rows, a slow-query log and query plans
+
+Connections opened inside profile_queries() are profiled: a trace callback
+counts every statement SQLite runs (including implicit BEGIN/COMMIT and
+each executemany row), a progress handler counts virtual-machine steps per
+statement, and the cursor measures time spent in execute/fetch calls and
+the rows returned. Statements are grouped by normalized text (literals and
+IN lists replaced), so the same query with different parameters is one row.
+
+Executions slower than slow_ms are appended to a JSON-lines slow-query
+log. explain_top() runs EXPLAIN QUERY PLAN for the most expensive
+statements, flagging full table scans, to confirm the indexes are used.
+
+profile_queries() swaps sqlite3.connect for the duration of the block, so
+connections opened before it (e.g. src.utils.db thread-local ones) are not
+profiled.
+
+Usage:
+    from src.utils.db_profiler import profile_queries
+
+    with profile_queries(slow_ms=5) as profiler:
+        analyze_gaps(business_id, match_requirements(answers), answers)
+    print(profiler.format_report())
+    print(profiler.format_explain(top=5))
+
+    python src/utils/db_profiler.py --slow-ms 1 --explain 5
+"""
+
+import argparse
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+import sys
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from config.config import DB_PATH
+
+SLOW_QUERY_MS = float(os.environ.get('DPDPA_SLOW_QUERY_MS', '50'))
+SLOW_QUERY_LOG = project_root / "data" / "processed" / "slow_queries.jsonl"
+
+# Progress handler granularity (VM instructions per callback)
+PROGRESS_STEPS = 100
+
+# Statements EXPLAIN QUERY PLAN applies to
+EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+_STRING_LITERAL = re.compile(r"[xX]?'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b")
+_NULL_LITERAL = re.compile(r"(?<!IS )(?<!IS NOT )\bNULL\b", re.IGNORECASE)
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Statement text with literals replaced by ? and whitespace collapsed
+
+    Source SQL (with placeholders) and the expanded SQL SQLite reports to
+    the trace callback normalize to the same text.
+    """
+    text = _STRING_LITERAL.sub('?', sql)
+    text = _NUMBER_LITERAL.sub('?', text)
+    text = _NULL_LITERAL.sub('?', text)
+    text = _WHITESPACE.sub(' ', text).strip().rstrip(';').strip()
+    return _IN_LIST.sub('IN (...)', text)
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+class QueryProfiler:
+    """
+    Statistics for profiled connections
+
+    Args:
+        slow_ms: Log executions slower than this (milliseconds; None disables the log)
+        slow_log: JSON-lines file for slow executions
+    """
+
+    def __init__(self, slow_ms: Optional[float] = SLOW_QUERY_MS, slow_log: Path = SLOW_QUERY_LOG):
+        self.slow_ms = slow_ms
+        self.slow_log = Path(slow_log)
+        self.slow_count = 0
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, statement: str) -> Dict[str, Any]:
+        entry = self._stats.get(statement)
+        if entry is None:
+            entry = self._stats[statement] = {
+                'statement': statement,
+                'calls': 0,
+                'samples': [],
+                'rows': 0,
+                'vm_steps': 0,
+                'example': None
+            }
+        return entry
+
+    def statement_started(self, statement: str) -> None:
+        """Trace callback: SQLite started running a statement"""
+        with self._lock:
+            self._entry(statement)['calls'] += 1
+
+    def vm_steps(self, statement: str, steps: int) -> None:
+        """Progress handler: the running statement used more VM instructions"""
+        with self._lock:
+            self._entry(statement)['vm_steps'] += steps
+
+    def record(self, statement: str, elapsed_ms: float, rows: int, database: str,
+               sql: str, parameters: Any) -> None:
+        """One execute() call finished (all rows fetched or the cursor moved on)"""
+        with self._lock:
+            entry = self._entry(statement)
+            entry['samples'].append(elapsed_ms)
+            entry['rows'] += max(rows, 0)
+            if entry['example'] is None or elapsed_ms > entry['example']['elapsed_ms']:
+                entry['example'] = {
+                    'database': database,
+                    'sql': sql,
+                    'parameters': parameters,
+                    'elapsed_ms': elapsed_ms
+                }
+
+        if self.slow_ms is not None and elapsed_ms >= self.slow_ms:
+            self._log_slow(statement, elapsed_ms, rows, parameters)
+
+    def _log_slow(self, statement: str, elapsed_ms: float, rows: int, parameters: Any) -> None:
+        line = json.dumps({
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'duration_ms': round(elapsed_ms, 3),
+            'rows': rows,
+            'statement': statement,
+            'parameters': repr(parameters)[:500]
+        })
+        with self._lock:
+            self.slow_count += 1
+            self.slow_log.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.slow_log, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self.slow_count = 0
+
+    def report(self, sort_by: str = 'total_ms') -> List[Dict[str, Any]]:
+        """
+        Per-statement statistics, most expensive first
+
+        Args:
+            sort_by: 'total_ms', 'calls', 'p95_ms', 'rows' or 'vm_steps'
+
+        Returns:
+            Rows with statement, calls, executions, total_ms, mean_ms,
+            p95_ms, max_ms, rows and vm_steps
+        """
+        with self._lock:
+            entries = [dict(entry, samples=list(entry['samples'])) for entry in self._stats.values()]
+
+        rows = []
+        for entry in entries:
+            samples = entry['samples']
+            total = sum(samples)
+            rows.append({
+                'statement': entry['statement'],
+                'calls': entry['calls'],
+                'executions': len(samples),
+                'total_ms': round(total, 3),
+                'mean_ms': round(total / len(samples), 3) if samples else 0.0,
+                'p95_ms': round(_percentile(samples, 0.95), 3),
+                'max_ms': round(max(samples), 3) if samples else 0.0,
+                'rows': entry['rows'],
+                'vm_steps': entry['vm_steps']
+            })
+        return sorted(rows, key=lambda row: row[sort_by], reverse=True)
+
+    def format_report(self, top: int = 20, sort_by: str = 'total_ms', width: int = 70) -> str:
+        """report() as a text table (statements truncated to width)"""
+        lines = [f"  {'Calls':>7s} {'Total ms':>10s} {'Mean ms':>9s} {'p95 ms':>9s} {'Rows':>8s} {'VM steps':>10s}  Statement"]
+        for row in self.report(sort_by)[:top]:
+            statement = row['statement'] if len(row['statement']) <= width else row['statement'][:width - 3] + '...'
+            lines.append(
+                f"  {row['calls']:7d} {row['total_ms']:10.2f} {row['mean_ms']:9.3f} {row['p95_ms']:9.3f} "
+                f"{row['rows']:8d} {row['vm_steps']:10d}  {statement}"
+            )
+        return '\n'.join(lines)
+
+    def explain_top(self, top: int = 5, sort_by: str = 'total_ms') -> List[Dict[str, Any]]:
+        """
+        EXPLAIN QUERY PLAN for the most expensive statements
+
+        Each plan is run on a fresh connection with the parameters of the
+        statement's slowest execution.
+
+        Returns:
+            List of {'statement', 'total_ms', 'plan', 'full_scans'} (plan is a
+            list of indented detail lines; full_scans the SCAN lines without
+            an index, empty when every table is searched by index)
+        """
+        with self._lock:
+            examples = {statement: entry['example'] for statement, entry in self._stats.items()}
+
+        plans = []
+        for row in self.report(sort_by):
+            example = examples.get(row['statement'])
+            if (example is None or example['parameters'] is None
+                    or not row['statement'].upper().startswith(EXPLAINABLE)):
+                continue
+
+            conn = _original_connect(example['database'])
+            try:
+                cursor = conn.execute(f"EXPLAIN QUERY PLAN {example['sql']}", example['parameters'])
+                plan_rows = cursor.fetchall()
+            except sqlite3.Error as e:
+                plan_rows = [(0, 0, 0, f"(could not explain: {e})")]
+            finally:
+                conn.close()
+
+            depth = {0: -1}
+            plan = []
+            for node_id, parent_id, _, detail in plan_rows:
+                depth[node_id] = depth.get(parent_id, -1) + 1
+                plan.append('  ' * depth[node_id] + detail)
+
+            plans.append({
+                'statement': row['statement'],
+                'total_ms': row['total_ms'],
+                'plan': plan,
+                'full_scans': [
+                    line.strip() for line in plan
+                    if line.strip().startswith('SCAN') and 'USING' not in line
+                ]
+            })
+            if len(plans) >= top:
+                break
+        return plans
+
+    def format_explain(self, top: int = 5, sort_by: str = 'total_ms') -> str:
+        """explain_top() as text"""
+        lines = []
+        for i, item in enumerate(self.explain_top(top, sort_by), 1):
+            lines.append(f"[{i}] {item['total_ms']:.2f} ms  {item['statement']}")
+            lines.extend(f"      {line}" for line in item['plan'])
+            if item['full_scans']:
+                lines.append(f"      ⚠️  Full scan: {'; '.join(item['full_scans'])}")
+            else:
+                lines.append("      ✓ Indexed (no full table scans)")
+            lines.append('')
+        return '\n'.join(lines)
+
+
+class ProfiledCursor(sqlite3.Cursor):
+    """Cursor timing execute/fetch calls and counting rows returned"""
+
+    def __init__(self, connection):
+        super().__init__(connection)
+        self._pending = None
+
+    def _finish(self):
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            statement, sql, parameters, elapsed_ms, rows = pending
+            self.connection.profiler.record(statement, elapsed_ms, rows, self.connection.database, sql, parameters)
+
+    def _begin(self, method, sql, parameters, example_parameters):
+        self._finish()
+        statement = normalize_sql(sql)
+        start = perf_counter()
+        try:
+            method(sql, parameters)
+        finally:
+            self._pending = [statement, sql, example_parameters, (perf_counter() - start) * 1000, 0]
+        if self.description is None:
+            # No result set: rows affected (rowcount is -1 for DDL)
+            self._pending[4] = self.rowcount
+            self._finish()
+        return self
+
+    def execute(self, sql, parameters=()):
+        return self._begin(super().execute, sql, parameters, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        # The parameter sequence may be a one-shot iterator, so it isn't kept
+        return self._begin(super().executemany, sql, seq_of_parameters, None)
+
+    def _timed_fetch(self, method, *args):
+        start = perf_counter()
+        result = method(*args)
+        if self._pending is not None:
+            self._pending[3] += (perf_counter() - start) * 1000
+        return result
+
+    def fetchone(self):
+        row = self._timed_fetch(super().fetchone)
+        if row is None:
+            self._finish()
+        elif self._pending is not None:
+            self._pending[4] += 1
+        return row
+
+    def fetchmany(self, size=None):
+        rows = self._timed_fetch(super().fetchmany, self.arraysize if size is None else size)
+        if self._pending is not None:
+            self._pending[4] += len(rows)
+        if not rows or len(rows) < (self.arraysize if size is None else size):
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed_fetch(super().fetchall)
+        if self._pending is not None:
+            self._pending[4] += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._timed_fetch(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+        if self._pending is not None:
+            self._pending[4] += 1
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+
+class ProfiledConnection(sqlite3.Connection):
+    """Connection reporting to a QueryProfiler (see attach())"""
+
+    profiler = None
+    database = None
+
+    def attach(self, profiler: QueryProfiler, database: str) -> 'ProfiledConnection':
+        """Install the trace callback and progress handler"""
+        self.profiler = profiler
+        self.database = database
+        self._cursors = weakref.WeakSet()
+        self._running = None
+        self._trace_callback = None
+
+        def on_statement(sql):
+            self._running = normalize_sql(sql)
+            profiler.statement_started(self._running)
+            if self._trace_callback is not None:
+                self._trace_callback(sql)
+
+        def on_progress():
+            if self._running is not None:
+                profiler.vm_steps(self._running, PROGRESS_STEPS)
+            return 0
+
+        super().set_trace_callback(on_statement)
+        self.set_progress_handler(on_progress, PROGRESS_STEPS)
+        return self
+
+    def set_trace_callback(self, trace_callback):
+        # Chained after the profiler's own callback (e.g. metrics.instrument_connection)
+        self._trace_callback = trace_callback
+
+    def cursor(self, factory=ProfiledCursor):
+        cursor = super().cursor(factory)
+        if isinstance(cursor, ProfiledCursor):
+            self._cursors.add(cursor)
+        return cursor
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def close(self):
+        # Record statements whose rows were not read to the end
+        for cursor in list(self._cursors):
+            cursor._finish()
+        super().close()
+
+
+_original_connect = sqlite3.connect
+
+
+def connect(database, profiler: QueryProfiler, **kwargs) -> ProfiledConnection:
+    """Open a profiled connection (same arguments as sqlite3.connect)"""
+    kwargs['factory'] = ProfiledConnection
+    return _original_connect(database, **kwargs).attach(profiler, str(database))
+
+
+@contextmanager
+def profile_queries(profiler: Optional[QueryProfiler] = None, **kwargs) -> Iterator[QueryProfiler]:
+    """
+    Profile every connection opened with sqlite3.connect inside the block
+
+    Args:
+        profiler: Existing profiler to add to (default: a new one)
+        **kwargs: QueryProfiler arguments (slow_ms, slow_log) for a new one
+
+    Yields:
+        The QueryProfiler
+    """
+    profiler = profiler or QueryProfiler(**kwargs)
+
+    def patched_connect(database, *args, **connect_kwargs):
+        if args or 'factory' in connect_kwargs:
+            return _original_connect(database, *args, **connect_kwargs)
+        return connect(database, profiler, **connect_kwargs)
+
+    sqlite3.connect = patched_connect
+    try:
+        yield profiler
+    finally:
+        sqlite3.connect = _original_connect
+
+
+# ============================================================================
+# WORKLOAD (command line)
+# ============================================================================
+
+def sample_profiles() -> List[Dict[str, Any]]:
+    """Questionnaire-shaped profiles covering every trigger group"""
+    profiles = []
+    for entity_type, user_count in [('ecommerce', 25_000_000), ('social_media', 1_000_000),
+                                    ('gaming', 60_000_000), ('healthcare', 50_000), ('other', 500)]:
+        for children in (False, True):
+            profiles.append({
+                'business_name': f"Profiler {entity_type} {'children' if children else 'adults'}",
+                'entity_type': entity_type,
+                'user_count': user_count,
+                'processes_children_data': children,
+                'cross_border_transfers': children,
+                'has_breach_plan': not children,
+                'has_consent_mechanism': True,
+                'current_security': ['encryption', 'access_control', 'logging', 'backups'] if children else []
+            })
+    return profiles
+
+
+def run_workload(repeat: int = 3) -> None:
+    """Match and analyze the sample profiles (read-only)"""
+    import contextlib
+    import io
+
+    from src.assessment.catalog import build_catalog
+    from src.assessment.gap_analyzer import analyze_gaps
+    from src.assessment.requirement_matcher import match_requirements
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            build_catalog()
+            for answers in sample_profiles():
+                analyze_gaps(None, match_requirements(answers), answers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile the SQLite queries of the assessment pipeline")
+    parser.add_argument('--repeat', type=int, default=3, help="Workload repetitions")
+    parser.add_argument('--top', type=int, default=20, help="Statements in the report")
+    parser.add_argument('--sort', default='total_ms', choices=['total_ms', 'calls', 'p95_ms', 'rows', 'vm_steps'])
+    parser.add_argument('--slow-ms', type=float, default=SLOW_QUERY_MS, help="Slow-query log threshold")
+    parser.add_argument('--slow-log', default=str(SLOW_QUERY_LOG), help="Slow-query log file")
+    parser.add_argument('--explain', type=int, default=5, metavar='N', help="EXPLAIN QUERY PLAN for the top N")
+    parser.add_argument('--json', metavar='PATH', help="Write the report and plans as JSON")
+    args = parser.parse_args()
+
+    if not Path(DB_PATH).exists():
+        print(f"✗ Database not found: {DB_PATH}")
+        sys.exit(1)
+
+    print("=" * 70)
+    print("SQLITE QUERY PROFILE")
+    print("=" * 70)
+    print(f"Database: {DB_PATH}")
+    print(f"Workload: {len(sample_profiles())} profiles x {args.repeat}")
+    print()
+
+    with profile_queries(slow_ms=args.slow_ms, slow_log=args.slow_log) as profiler:
+        run_workload(args.repeat)
+
+    print(profiler.format_report(args.top, args.sort))
+    print()
+    if profiler.slow_count:
+        print(f"⚠️  {profiler.slow_count} executions over {args.slow_ms:g} ms logged to {args.slow_log}")
+    else:
+        print(f"✓ No executions over {args.slow_ms:g} ms")
+
+    if args.explain:
+        print()
+        print("=" * 70)
+        print(f"QUERY PLANS (top {args.explain})")
+        print("=" * 70)
+        print()
+        print(profiler.format_explain(args.explain, args.sort))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps({
+            'report': profiler.report(args.sort),
+            'plans': profiler.explain_top(args.explain, args.sort)
+        }, indent=2), encoding='utf-8')
+        print(f"✓ Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+"""
+Metrics
+Process-wide counters, gauges and histograms in the Prometheus text format
+
+The assessment modules update the metrics defined at the bottom of this
+file; render() produces the text exposition format (version 0.0.4). Scrape
+it from the API (GET /metrics), from a standalone endpoint started with
+start_http_server() (the dashboard does this when DPDPA_METRICS_PORT is
+set), or dump it to a file with write_metrics() (DPDPA_METRICS_FILE writes
+at exit; the file suits node_exporter's textfile collector).
+
+Usage:
+    from src.utils.metrics import GAP_ANALYSIS_SECONDS, instrument_connection
+
+    @GAP_ANALYSIS_SECONDS.time()
+    def analyze_gaps(...): ...
+
+    conn = instrument_connection(sqlite3.connect(DB_PATH))   # counts statements
+
+    DPDPA_METRICS_PORT=9464 streamlit run app.py   # then curl localhost:9464/metrics
+"""
+
+import atexit
+import bisect
+import functools
+import math
+import os
+import sqlite3
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Seconds (1 ms to 10 s)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Bytes (4 KB to 64 MB)
+SIZE_BUCKETS = tuple(4096 * 4 ** i for i in range(8))
+
+# Statement types counted separately by instrument_connection()
+QUERY_OPERATIONS = {'SELECT', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE', 'WITH', 'BEGIN', 'COMMIT',
+                    'ROLLBACK', 'PRAGMA', 'CREATE', 'DROP', 'ALTER'}
+
+# HTTP methods counted separately in HTTP_REQUESTS (others count as 'OTHER')
+HTTP_METHODS = {'GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS'}
+
+
+def bounded_label(value, allowed, other: str = 'other') -> str:
+    """
+    Label value from request data, limited to a known set
+
+    Every distinct label value is a new time series, so values that come
+    from clients (entity types, HTTP methods) are mapped onto a fixed set.
+
+    Args:
+        value: Raw value
+        allowed: Values kept as they are
+        other: Bucket for everything else
+    """
+    return value if isinstance(value, str) and value in allowed else other
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class Registry:
+    """Named metrics rendered together"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: 'Metric') -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+
+    def get(self, name: str) -> Optional['Metric']:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return ''.join(metric.render() for metric in metrics)
+
+    def reset(self) -> None:
+        """Zero every metric (tests and benchmarks)"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+REGISTRY = Registry()
+
+
+class Metric:
+    """Base class: a name, help text, label names and one value per label set"""
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: Optional[Registry] = REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames) or any(name not in labels for name in self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}\n"
+                for key, value in items]
+
+    def render(self) -> str:
+        header = f"# HELP {self.name} {_escape(self.documentation)}\n# TYPE {self.name} {self.kind}\n"
+        return header + ''.join(self._samples())
+
+
+class Counter(Metric):
+    """Monotonically increasing count"""
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(Metric):
+    """Value that can go up and down"""
+    kind = 'gauge'
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class _Timer:
+    """Histogram.time(): context manager and decorator observing elapsed seconds"""
+
+    def __init__(self, histogram: 'Histogram', labels: Dict[str, str]):
+        self.histogram = histogram
+        self.labels = labels
+        self._start = None
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(perf_counter() - self._start, **self.labels)
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        histogram, labels = self.histogram, self.labels
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(perf_counter() - start, **labels)
+        return wrapper
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets, with their sum and count"""
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS, registry: Optional[Registry] = REGISTRY):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def time(self, **labels) -> _Timer:
+        """Time a block (with) or every call of a function (decorator)"""
+        self._key(labels)
+        return _Timer(self, labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[2] if state else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, ([*counts], total, count)) for key, (counts, total, count) in self._values.items())
+
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}\n")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}\n")
+            lines.append(f"{self.name}_count{labels} {count}\n")
+        return lines
+
+
+# ============================================================================
+# EXPOSITION
+# ============================================================================
+
+def render(registry: Registry = REGISTRY) -> str:
+    return registry.render()
+
+
+def write_metrics(path, registry: Registry = REGISTRY) -> None:
+    """Write the exposition text atomically (write a temp file, then rename)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+    temp_path.write_text(registry.render(), encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the console
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_http_server(port: int, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """
+    Serve /metrics from a background thread (once per process)
+
+    Returns:
+        The running server (the existing one if already started)
+    """
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name='metrics-http', daemon=True).start()
+            print(f"✓ Metrics at http://{host}:{port}/metrics")
+        return _server
+
+
+def _write_at_exit():
+    path = os.environ.get('DPDPA_METRICS_FILE')
+    if path:
+        write_metrics(path)
+
+
+atexit.register(_write_at_exit)
+
+
+# ============================================================================
+# DATABASE
+# ============================================================================
+
+def instrument_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """Count the statements a connection runs in DB_QUERIES (by operation)"""
+    def on_statement(sql):
+        words = sql.split(None, 1)
+        operation = words[0].upper() if words else 'OTHER'
+        DB_QUERIES.inc(operation=operation if operation in QUERY_OPERATIONS else 'OTHER')
+
+    conn.set_trace_callback(on_statement)
+    return conn
+
+
+# ============================================================================
+# METRICS
+# ============================================================================
+
+ASSESSMENTS_CREATED = Counter(
+    'dpdpa_assessments_created_total', "Business profiles created for assessment", ['entity_type']
+)
+MATCH_SECONDS = Histogram(
+    'dpdpa_match_duration_seconds', "Requirement matching latency", ['source']
+)
+GAP_ANALYSIS_SECONDS = Histogram(
+    'dpdpa_gap_analysis_duration_seconds', "Gap analysis latency"
+)
+DOCUMENTS_GENERATED = Counter(
+    'dpdpa_documents_generated_total', "Compliance documents generated", ['document']
+)
+EXCEL_EXPORT_SECONDS = Histogram(
+    'dpdpa_excel_export_duration_seconds', "Excel report export latency"
+)
+EXCEL_EXPORT_BYTES = Histogram(
+    'dpdpa_excel_export_bytes', "Excel report file size", buckets=SIZE_BUCKETS
+)
+CACHE_REQUESTS = Counter(
+    'dpdpa_cache_requests_total', "Dashboard cache lookups", ['cache']
+)
+CACHE_MISSES = Counter(
+    'dpdpa_cache_misses_total', "Dashboard cache lookups that computed the value", ['cache']
+)
+CACHE_HIT_RATIO = Gauge(
+    'dpdpa_cache_hit_ratio', "Dashboard cache hits / lookups since start", ['cache']
+)
+SESSION_STATE_BYTES = Gauge(
+    'dpdpa_session_state_bytes', "Pickled session state of recently active dashboard sessions", ['stat']
+)
+DASHBOARD_SESSIONS = Gauge(
+    'dpdpa_dashboard_sessions', "Dashboard sessions with a rerun in the last hour"
+)
+DB_QUERIES = Counter(
+    'dpdpa_db_queries_total', "SQLite statements run on instrumented connections", ['operation']
+)
+HTTP_REQUESTS = Counter(
+    'dpdpa_http_requests_total', "API requests", ['method', 'route', 'status']
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    'dpdpa_http_request_duration_seconds', "API request latency", ['method', 'route']
+)
@@ -0,0 +1,302 @@
+"""
+Tracing
+Lightweight timing spans for the assessment pipeline, exported as JSON lines or Chrome traces
+
+Spans nest per thread/task (contextvars), so a span's parent is whatever
+span was open when it started. Finished spans go to a bounded in-memory
+buffer and to any open capture() (e.g. one dashboard request).
+
+Tracing is off unless DPDPA_TRACE=1 or enable() is called (whole
+process), or inside a scoped() block (this thread or task only, e.g. one
+dashboard rerun with ?trace=1). When off, span() returns a shared no-op
+context manager and @traced calls the function directly, so instrumented
+hot paths cost a flag check and a context variable lookup.
+
+Set DPDPA_TRACE_FILE to write the buffer when the process exits (Chrome
+trace-event format if the name ends in .json, JSON lines otherwise; open
+Chrome traces in chrome://tracing or https://ui.perfetto.dev).
+
+Usage:
+    from src.utils.tracing import span, traced
+
+    @traced('match.universal')
+    def get_universal_requirements(): ...
+
+    with span('gaps.loop', rows=len(rows)):
+        ...
+
+    with scoped(query_params.get('trace') == '1'):
+        page_show()     # traced for this request only
+
+    DPDPA_TRACE=1 DPDPA_TRACE_FILE=trace.json python src/assessment/run_assessment.py
+"""
+
+import atexit
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Finished spans kept in memory (oldest dropped first)
+MAX_SPANS = 100_000
+
+_enabled = os.environ.get('DPDPA_TRACE', '') == '1'
+_buffer = deque(maxlen=MAX_SPANS)
+_ids = itertools.count(1)
+_origin_ns = perf_counter_ns()
+
+_current_span = contextvars.ContextVar('dpdpa_trace_span', default=None)
+_capture = contextvars.ContextVar('dpdpa_trace_capture', default=None)
+_scoped = contextvars.ContextVar('dpdpa_trace_scoped', default=False)
+
+
+def enable(on: bool = True) -> None:
+    """Turn span recording on or off for the whole process"""
+    global _enabled
+    _enabled = on
+
+
+def is_enabled() -> bool:
+    """Whether spans are recorded here (process-wide or in a scoped() block)"""
+    return _enabled or _scoped.get()
+
+
+@contextmanager
+def scoped(on: bool = True) -> Iterator[None]:
+    """
+    Record spans inside the block, in this thread or task only
+
+    Other sessions and threads keep the process-wide setting; work handed
+    to a thread pool has to enter its own scoped() block.
+
+    Args:
+        on: False makes the block a no-op (so callers can pass a flag)
+    """
+    if not on:
+        yield
+        return
+    token = _scoped.set(True)
+    try:
+        yield
+    finally:
+        _scoped.reset(token)
+
+
+class _NoopSpan:
+    """Returned by span() while tracing is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attributes):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """An open span; records itself when the with-block exits"""
+    __slots__ = ('name', 'attributes', 'span_id', 'parent_id', 'start_ns', '_token')
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        parent = _current_span.get()
+        self.span_id = next(_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self._token = _current_span.set(self)
+        self.start_ns = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = perf_counter_ns()
+        _current_span.reset(self._token)
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+
+        record = {
+            'name': self.name,
+            'id': self.span_id,
+            'parent': self.parent_id,
+            'start_us': (self.start_ns - _origin_ns) // 1000,
+            'duration_ms': (end_ns - self.start_ns) / 1_000_000,
+            'thread': threading.current_thread().name,
+            'attributes': self.attributes
+        }
+        _buffer.append(record)
+        captured = _capture.get()
+        if captured is not None:
+            captured.append(record)
+        return False
+
+    def set(self, **attributes):
+        """Add attributes (e.g. result sizes) while the span is open"""
+        self.attributes.update(attributes)
+
+
+def span(name: str, **attributes):
+    """
+    Context manager timing a block
+
+    Args:
+        name: Span name, dotted by area (e.g. 'gaps.loop')
+        **attributes: Extra fields recorded with the span
+    """
+    if not (_enabled or _scoped.get()):
+        return _NOOP_SPAN
+    return Span(name, attributes)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """Decorator recording a span per call (name defaults to the function's qualified name)"""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (_enabled or _scoped.get()):
+                return func(*args, **kwargs)
+            with Span(label, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def capture() -> Iterator[List[Dict[str, Any]]]:
+    """
+    Collect the spans finished inside the block (in this thread or task)
+
+    Yields:
+        List that fills with span records as they finish
+    """
+    spans = []
+    token = _capture.set(spans)
+    try:
+        yield spans
+    finally:
+        _capture.reset(token)
+
+
+def get_spans() -> List[Dict[str, Any]]:
+    """Copy of the buffered span records, oldest first"""
+    return list(_buffer)
+
+
+def clear() -> None:
+    _buffer.clear()
+
+
+def summarize(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Per-stage totals, nested like the call tree
+
+    Spans with the same name under the same parent path are merged, so a
+    function traced once per row (e.g. gaps.priority_score) gives one line.
+
+    Returns:
+        Rows with name, depth, calls and total_ms, parents before children
+    """
+    by_id = {record['id']: record for record in spans}
+    paths = {}
+
+    def path_of(record):
+        if record['id'] not in paths:
+            parent = by_id.get(record['parent'])
+            prefix = path_of(parent) if parent is not None else ()
+            paths[record['id']] = prefix + (record['name'],)
+        return paths[record['id']]
+
+    rows = {}
+    children = {}
+    for record in sorted(spans, key=lambda r: r['start_us']):
+        path = path_of(record)
+        if path not in rows:
+            rows[path] = {'name': record['name'], 'depth': len(path) - 1, 'calls': 0, 'total_ms': 0.0}
+            children.setdefault(path[:-1], []).append(path)
+        rows[path]['calls'] += 1
+        rows[path]['total_ms'] += record['duration_ms']
+
+    ordered = []
+
+    def walk(parent):
+        for path in children.get(parent, []):
+            ordered.append(rows[path])
+            walk(path)
+
+    walk(())
+    return ordered
+
+
+def format_summary(spans: List[Dict[str, Any]]) -> str:
+    """summarize() as an indented text table (for console output)"""
+    lines = [f"  {'Stage':44s} {'Calls':>7s} {'Total ms':>10s}"]
+    for row in summarize(spans):
+        label = '  ' * row['depth'] + row['name']
+        lines.append(f"  {label:44s} {row['calls']:7d} {row['total_ms']:10.2f}")
+    return '\n'.join(lines)
+
+
+def to_chrome_trace(spans: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Chrome trace-event document ("X" complete events, one track per thread)"""
+    pid = os.getpid()
+    return {
+        'traceEvents': [
+            {
+                'name': record['name'],
+                'cat': record['name'].split('.', 1)[0],
+                'ph': 'X',
+                'ts': record['start_us'],
+                'dur': round(record['duration_ms'] * 1000, 3),
+                'pid': pid,
+                'tid': record['thread'],
+                'args': record['attributes']
+            }
+            for record in spans
+        ],
+        'displayTimeUnit': 'ms'
+    }
+
+
+def export_jsonl(path, spans: Optional[List[Dict[str, Any]]] = None) -> int:
+    """Write span records as JSON lines; returns the number written"""
+    spans = get_spans() if spans is None else spans
+    with open(path, 'w', encoding='utf-8') as f:
+        for record in spans:
+            f.write(json.dumps(record, default=str) + '\n')
+    return len(spans)
+
+
+def export_chrome_trace(path, spans: Optional[List[Dict[str, Any]]] = None) -> int:
+    """Write spans as a Chrome trace-event JSON file; returns the number written"""
+    spans = get_spans() if spans is None else spans
+    Path(path).write_text(json.dumps(to_chrome_trace(spans), default=str), encoding='utf-8')
+    return len(spans)
+
+
+def _export_at_exit():
+    path = os.environ.get('DPDPA_TRACE_FILE')
+    if not path or not _buffer:
+        return
+    if path.endswith('.json'):
+        count = export_chrome_trace(path)
+    else:
+        count = export_jsonl(path)
+    print(f"✓ Wrote {count} trace spans to {path}")
+
+
+atexit.register(_export_at_exit)
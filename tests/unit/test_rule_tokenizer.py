@@ -0,0 +1,73 @@
+"""
+Regression tests for the rule tokenizer (src/extraction/rule_tokenizer.py)
+
+The tokenizer-backed extraction must produce the same rules, bodies and
+sub-rules as the original multi-pass regex splitter, which is kept as the
+reference implementation in check_tokenizer.py. The Rules text is
+extracted from the bundled PDF in data/raw.
+"""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+RULES_PDF = project_root / "data" / "raw" / "DPDP_Rules_2025_English_only.pdf"
+
+# Skipped where PyMuPDF is not installed
+pytest.importorskip('fitz')
+
+from src.extraction.check_tokenizer import (
+    legacy_clean_text, legacy_extract_rules, legacy_extract_subrules,
+    legacy_pipeline, pages_to_text, tokenizer_pipeline, tokenizer_structure
+)
+from src.extraction.extract_requirements import clean_text, extract_rules, extract_subrules
+from src.extraction.parse_rules import _extract_page_range, scan_page_hashes
+
+
+@pytest.fixture(scope='module')
+def rules_pages():
+    """Page texts of the bundled Rules PDF (read directly, the page cache is not touched)"""
+    if not RULES_PDF.exists():
+        pytest.skip(f"{RULES_PDF.name} not found in data/raw")
+    page_numbers = list(range(1, len(scan_page_hashes(RULES_PDF)) + 1))
+    return [text for _, text in _extract_page_range((str(RULES_PDF), page_numbers))]
+
+
+@pytest.fixture(scope='module')
+def rules_text(rules_pages):
+    """The combined TXT layout (with page markers) parse_rules.py writes"""
+    return pages_to_text(rules_pages)
+
+
+@pytest.fixture(scope='module')
+def expected(rules_text):
+    return legacy_pipeline(rules_text)
+
+
+def test_reference_finds_rules(expected):
+    # Guards against comparing two empty outputs
+    assert [rule[0] for rule in expected] == [str(number) for number in range(1, len(expected) + 1)]
+    assert len(expected) >= 10
+
+
+def test_tokenizer_matches_regex_splitter(rules_text, expected):
+    assert tokenizer_pipeline(rules_text) == expected
+
+
+def test_tokenizer_matches_on_streamed_pages(rules_pages, expected):
+    # extract_requirements.py cleans the JSONL pages one at a time
+    assert tokenizer_structure(clean_text(iter(rules_pages))) == expected
+
+
+def test_extract_rules_matches_regex_splitter(rules_text):
+    assert extract_rules(clean_text(rules_text)) == legacy_extract_rules(legacy_clean_text(rules_text))
+
+
+def test_extract_subrules_matches_regex_splitter(rules_text):
+    for rule_num, _, content in legacy_extract_rules(legacy_clean_text(rules_text)):
+        assert extract_subrules(content) == legacy_extract_subrules(content), f"Rule {rule_num}"
@@ -0,0 +1,144 @@
+"""
+Unit tests for regulation versioning (src/extraction/versioning.py)
+
+Two extraction runs are applied to a scratch database; the second edits,
+removes and adds clauses.
+"""
+
+import sqlite3
+from pathlib import Path
+import sys
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.extraction.extract_requirements import build_requirement_row, load_penalty_ids
+from src.extraction.init_db import init_database, requirement_text_hash
+from src.extraction.versioning import apply_requirement_diff, diff_requirements
+
+FIRST_RUN = [
+    ('Rule 3(a)', 'A Data Fiduciary shall give notice in clear and plain language.'),
+    ('Rule 3(a)', 'The notice shall be understandable independently of other information.'),
+    ('Rule 6(1)', 'A Data Fiduciary shall protect personal data with reasonable security safeguards.'),
+    ('Rule 7(1)', 'A Data Fiduciary shall intimate a personal data breach without delay.'),
+]
+
+EDITED_TEXT = 'A Data Fiduciary shall protect personal data with encryption and access control.'
+ADDED_TEXT = 'A Data Fiduciary shall erase personal data after the retention period.'
+
+SECOND_RUN = [
+    FIRST_RUN[0],
+    FIRST_RUN[1],
+    ('Rule 6(1)', EDITED_TEXT),
+    ('Rule 8(1)', ADDED_TEXT),
+]
+
+
+@pytest.fixture
+def conn(tmp_path):
+    db_path = tmp_path / 'versioning.db'
+    init_database(db_path)
+    conn = sqlite3.connect(db_path)
+    yield conn
+    conn.close()
+
+
+def extract(conn, clauses):
+    """Diff and apply one extraction run, as extract_requirements.main() does"""
+    cursor = conn.cursor()
+    penalty_ids = load_penalty_ids(cursor)
+    rows = [
+        build_requirement_row(rule_number, text, 'mandatory', penalty_ids)
+        for rule_number, text in clauses
+    ]
+    return apply_requirement_diff(conn, diff_requirements(cursor, rows), 'test_rules', notify=False)
+
+
+def requirement_rows(conn):
+    cursor = conn.execute(
+        "SELECT id, clause_key, requirement_text, is_active FROM requirements ORDER BY id"
+    )
+    return {row[1]: row for row in cursor.fetchall()}
+
+
+def test_first_run_adds_every_clause(conn):
+    result = extract(conn, FIRST_RUN)
+
+    assert result['version_id'] == 1
+    assert (result['added'], result['changed'], result['removed']) == (4, 0, 0)
+
+    rows = requirement_rows(conn)
+    # A repeated rule reference gets an occurrence suffix
+    assert set(rows) == {'Rule 3(a)', 'Rule 3(a)#2', 'Rule 6(1)', 'Rule 7(1)'}
+    assert all(row[3] == 1 for row in rows.values())
+
+
+def test_rerun_without_changes_records_no_version(conn):
+    extract(conn, FIRST_RUN)
+    result = extract(conn, FIRST_RUN)
+
+    assert result['version_id'] is None
+    assert result['unchanged'] == 4
+    assert conn.execute("SELECT COUNT(*) FROM regulation_versions").fetchone()[0] == 1
+
+
+def test_edited_clause_keeps_id_and_records_changes(conn):
+    extract(conn, FIRST_RUN)
+    before = requirement_rows(conn)
+
+    result = extract(conn, SECOND_RUN)
+
+    assert result['version_id'] == 2
+    assert (result['added'], result['changed'], result['removed'], result['unchanged']) == (1, 1, 1, 2)
+
+    after = requirement_rows(conn)
+    # The edited clause is updated in place under the same id and clause key
+    assert after['Rule 6(1)'][0] == before['Rule 6(1)'][0]
+    assert after['Rule 6(1)'][2] == EDITED_TEXT
+    assert after['Rule 6(1)'][3] == 1
+    # The dropped clause is deactivated, not deleted
+    assert after['Rule 7(1)'][0] == before['Rule 7(1)'][0]
+    assert after['Rule 7(1)'][3] == 0
+    assert after['Rule 8(1)'][3] == 1
+
+    active = conn.execute("SELECT COUNT(*) FROM requirements WHERE is_active = 1").fetchone()[0]
+    assert active == 4
+    assert result['changed_ids'] == {
+        after['Rule 6(1)'][0], after['Rule 7(1)'][0], after['Rule 8(1)'][0]
+    }
+
+    changes = conn.execute("""
+        SELECT requirement_id, clause_key, change_type, old_text_hash, new_text_hash, old_text
+        FROM requirement_changes
+        WHERE version_id = 2
+        ORDER BY clause_key
+    """).fetchall()
+    assert changes == [
+        (after['Rule 6(1)'][0], 'Rule 6(1)', 'changed',
+         requirement_text_hash(FIRST_RUN[2][1]), requirement_text_hash(EDITED_TEXT), FIRST_RUN[2][1]),
+        (after['Rule 7(1)'][0], 'Rule 7(1)', 'removed',
+         requirement_text_hash(FIRST_RUN[3][1]), None, FIRST_RUN[3][1]),
+        (after['Rule 8(1)'][0], 'Rule 8(1)', 'added',
+         None, requirement_text_hash(ADDED_TEXT), None),
+    ]
+
+    counts = conn.execute(
+        "SELECT added_count, changed_count, removed_count FROM regulation_versions WHERE id = 2"
+    ).fetchone()
+    assert counts == (1, 1, 1)
+
+
+def test_restored_clause_reactivates_the_removed_row(conn):
+    extract(conn, FIRST_RUN)
+    removed_id = requirement_rows(conn)['Rule 7(1)'][0]
+    extract(conn, SECOND_RUN)
+
+    result = extract(conn, SECOND_RUN + [FIRST_RUN[3]])
+
+    assert result['added'] == 1
+    rows = requirement_rows(conn)
+    assert rows['Rule 7(1)'][0] == removed_id
+    assert rows['Rule 7(1)'][3] == 1